@@ -0,0 +1,199 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+import os
+import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Iterable, List, NamedTuple, Optional
+
+import shared_graph
+from engine import SearchEngine
+from models import SearchBudget, SearchOutcome
+from problem import SearchProblem
+
+
+# ---------------------------------------------------------------------------
+# Data Transfer Objects (DTOs)
+# ---------------------------------------------------------------------------
+class BatchQuery(NamedTuple):
+    """
+    An immutable Data Transfer Object (DTO) describing one query of a batch.
+
+    Attributes:
+        origin (int): The starting node ID.
+        destinations (List[int]): The acceptable goal node IDs.
+        search_method (str): The search algorithm to execute (e.g., 'as', 'cus1').
+        budget (Optional[SearchBudget]): Cooperative limits for this query (None = unlimited).
+    """
+    origin: int
+    destinations: List[int]
+    search_method: str
+    budget: Optional[SearchBudget] = None
+
+
+class BatchResult(NamedTuple):
+    """
+    An immutable Data Transfer Object (DTO) pairing a query with its outcome.
+
+    Attributes:
+        query (BatchQuery): The query as submitted.
+        search_outcome (SearchOutcome): The engine's detailed outcome. An invalid query (unknown origin,
+                                        destination without coordinates) is reported as 'FAIL'.
+        execution_duration (float): The time spent solving the query, in seconds.
+    """
+    query: BatchQuery
+    search_outcome: SearchOutcome
+    execution_duration: float
+
+
+# ---------------------------------------------------------------------------
+# Query Execution
+# ---------------------------------------------------------------------------
+def solve_batch_query(graph: Any, batch_query: BatchQuery) -> BatchResult:
+    """
+    Answers one query on a shared, read-only graph.
+
+    Architectural Note:
+    The query gets its own `SearchProblem` and `SearchEngine`, and neither writes to the graph, so
+    any number of calls may run at the same time on one `Graph` or `SharedGraph`. (`TiledGraph`
+    updates its tile cache while searching and must not be shared between threads.)
+
+    Args:
+        graph (Any): The graph every query of the batch runs on.
+        batch_query (BatchQuery): The query to answer.
+
+    Returns:
+        BatchResult: The query, its outcome and the time it took.
+    """
+    start_time_counter = time.perf_counter()
+    try:
+        search_problem = SearchProblem(graph, batch_query.origin, batch_query.destinations)
+    except ValueError:
+        return BatchResult(batch_query, SearchOutcome("FAIL"), time.perf_counter() - start_time_counter)
+
+    search_engine = SearchEngine(graph, search_problem)
+    search_engine.solve(batch_query.search_method, budget=batch_query.budget)
+    return BatchResult(batch_query, search_engine.search_outcome, time.perf_counter() - start_time_counter)
+
+
+def solve_in_shared_worker(batch_query: BatchQuery) -> BatchResult:
+    """
+    Answers one query inside a process initialized with `shared_graph.initialize_worker`.
+    This must stay a module-level function so that the process pool can pickle a reference to it.
+    """
+    return solve_batch_query(shared_graph.worker_graph(), batch_query)
+
+
+def is_gil_enabled() -> bool:
+    """
+    Reports whether the running interpreter serializes Python threads with the GIL.
+
+    Returns:
+        bool: False only on a free-threaded build (e.g. 3.13t) running with the GIL disabled.
+    """
+    gil_probe = getattr(sys, "_is_gil_enabled", None)
+    return True if gil_probe is None else gil_probe()
+
+
+# ---------------------------------------------------------------------------
+# Batch Executors
+# ---------------------------------------------------------------------------
+class ThreadedBatchExecutor:
+    """
+    Runs batches of queries on one shared graph with a thread pool.
+
+    Architectural Note:
+    Threads share the loaded graph directly: nothing is pickled and no second copy of the topology
+    exists. On a free-threaded build the searches run truly in parallel. On a standard build the
+    GIL serializes the pure-Python searches, so threads give no speed-up for CPU-bound batches
+    there; `SharedMemoryBatchExecutor` is the parallel alternative (see tests/batch_benchmark.py).
+
+    Attributes:
+        graph (Any): The shared, read-only graph.
+        executor (ThreadPoolExecutor): The pool running the searches.
+    """
+
+    def __init__(self, graph: Any, max_workers: Optional[int] = None) -> None:
+        """
+        Args:
+            graph (Any): The graph every query runs on (a `Graph` or an attached `SharedGraph`).
+            max_workers (Optional[int]): The number of threads (defaults to the CPU count).
+        """
+        self.graph = graph
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or os.cpu_count() or 1)
+
+    def __enter__(self) -> "ThreadedBatchExecutor":
+        return self
+
+    def __exit__(self, *exception_details: object) -> None:
+        self.close()
+
+    def submit(self, batch_query: BatchQuery) -> "Future[BatchResult]":
+        """Schedules one query and returns its future."""
+        return self.executor.submit(solve_batch_query, self.graph, batch_query)
+
+    def run(self, batch_queries: Iterable[BatchQuery]) -> List[BatchResult]:
+        """
+        Answers every query of a batch.
+
+        Returns:
+            List[BatchResult]: One result per query, in submission order.
+        """
+        query_futures = [self.submit(batch_query) for batch_query in batch_queries]
+        return [query_future.result() for query_future in query_futures]
+
+    def close(self) -> None:
+        """Waits for the running queries and stops the threads."""
+        self.executor.shutdown(wait=True)
+
+
+class SharedMemoryBatchExecutor:
+    """
+    Runs batches of queries with a process pool attached to one shared-memory copy of the graph.
+
+    Architectural Note:
+    The graph is published once with `SharedGraphPublisher`; each worker attaches at start-up, so
+    only the small queries and results are pickled. This is the parallel path on a standard build.
+
+    Attributes:
+        graph_publisher (SharedGraphPublisher): The owner of the shared block.
+        executor (ProcessPoolExecutor): The pool running the searches.
+    """
+
+    def __init__(self, graph: Any, max_workers: Optional[int] = None) -> None:
+        """
+        Args:
+            graph (Any): The loaded Graph to publish.
+            max_workers (Optional[int]): The number of processes (defaults to the CPU count).
+        """
+        self.graph_publisher = shared_graph.SharedGraphPublisher(graph)
+        self.executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=shared_graph.initialize_worker,
+            initargs=(self.graph_publisher.handle,),
+        )
+
+    def __enter__(self) -> "SharedMemoryBatchExecutor":
+        return self
+
+    def __exit__(self, *exception_details: object) -> None:
+        self.close()
+
+    def submit(self, batch_query: BatchQuery) -> "Future[BatchResult]":
+        """Schedules one query and returns its future."""
+        return self.executor.submit(solve_in_shared_worker, batch_query)
+
+    def run(self, batch_queries: Iterable[BatchQuery]) -> List[BatchResult]:
+        """
+        Answers every query of a batch.
+
+        Returns:
+            List[BatchResult]: One result per query, in submission order.
+        """
+        return list(self.executor.map(solve_in_shared_worker, batch_queries))
+
+    def close(self) -> None:
+        """Stops the workers, then destroys the shared block (which must outlive them)."""
+        self.executor.shutdown(wait=True)
+        self.graph_publisher.close()
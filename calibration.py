@@ -0,0 +1,79 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+from __future__ import annotations
+
+import math
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+
+# ---------------------------------------------------------------------------
+# Heuristic Scale Calibration
+# ---------------------------------------------------------------------------
+def calibrate_heuristic_scale(graph: Any) -> float:
+    """
+    Computes the largest factor the Euclidean heuristic can be multiplied by while staying
+    admissible and consistent on this graph: the minimum, over every edge, of its weight divided
+    by the straight-line distance between its endpoints.
+
+    Architectural Note:
+    With s = min w(u, v) / |uv|, every edge satisfies s * |uv| <= w(u, v). Consistency follows
+    from the triangle inequality: s * d(u, goal) <= s * |uv| + s * d(v, goal) <= w(u, v) + h(v),
+    and a consistent heuristic that is 0 at the goals is admissible. The bound is as tight as a
+    single global factor can be: the edge that attains the minimum makes any larger factor
+    inconsistent. When edges cost more than their length (weights in minutes, lengths in km), s is
+    above 1 and A* expands fewer nodes. When some edge is cheaper than its length, as in
+    T07_HeuristicTrap and T08_CostVsHops, s is below 1 and the raw Euclidean distance was
+    overestimating, so scaling it down restores the optimality guarantee. Zero-length edges
+    constrain nothing and are skipped. A zero-weight edge between distinct points (T10_ZeroCost)
+    gives s = 0, which turns A* into uniform-cost search, the only safe choice there. Edges
+    touching a node without coordinates are skipped too: the heuristic is undefined at such a
+    node, and a search that reaches it raises KeyError whatever the scale. A graph without any
+    positive-length edge keeps the plain heuristic (1.0).
+
+    The ratio is used as is, without a safety margin: the plain heuristic already relies on the
+    triangle inequality holding up to rounding, and the scaled one only adds one rounding step.
+    A margin would also cost IDA* dearly, since every f-value tie it broke (a map whose weights
+    equal their lengths, such as T05_Linear, gives exactly 1.0) becomes an extra threshold pass.
+
+    The scan reads every adjacency row once (O(V + E)). The result depends only on the topology,
+    so compute it once per graph and pass it to every `SearchProblem` that should use it.
+
+    Args:
+        graph (Any): An indexed topology (`Graph`, `CompactGraph`, `SharedGraph`, `TiledGraph`).
+
+    Returns:
+        float: The heuristic scale, at least 0.0.
+
+    Internal Variables:
+        minimum_ratio (float): The lowest weight / length ratio found so far (inf = no edge yet).
+    """
+    coordinate_x = graph.coordinate_x
+    coordinate_y = graph.coordinate_y
+    minimum_ratio = math.inf
+
+    for source_index in range(graph.node_count):
+        source_x = coordinate_x[source_index]
+        if source_x != source_x:
+            continue
+        source_y = coordinate_y[source_index]
+        targets, weights, row_start, row_stop = graph.get_adjacency_slice(source_index)
+        for position in range(row_start, row_stop):
+            target_index = targets[position]
+            edge_length = math.sqrt(
+                (coordinate_x[target_index] - source_x) ** 2 +
+                (coordinate_y[target_index] - source_y) ** 2
+            )
+            # NaN (target without coordinates) fails this test as well.
+            if not edge_length > 0.0:
+                continue
+            edge_ratio = weights[position] / edge_length
+            if edge_ratio < minimum_ratio:
+                minimum_ratio = edge_ratio
+
+    if minimum_ratio == math.inf:
+        return 1.0
+    return max(0.0, minimum_ratio)
@@ -0,0 +1,135 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+from array import array
+from typing import Dict
+
+from graph import Graph, ReadOnlyGraphView
+
+
+# ---------------------------------------------------------------------------
+# Compact Typed-Array Graph
+# ---------------------------------------------------------------------------
+class CompactGraph(ReadOnlyGraphView):
+    """
+    A read-only Graph that keeps only typed arrays, with selectable numeric precision.
+
+    Architectural Note:
+    A loaded `Graph` keeps the parser's dictionaries (`adjacency_list`, `node_coordinates`,
+    `node_index`) next to its CSR arrays, so every weight and coordinate also lives on as a boxed
+    float inside a dict or tuple. This view keeps the arrays alone: node IDs, CSR offsets and
+    targets as int32 or int64, weights and coordinates as float32 or float64. ID lookups use a
+    binary search over the sorted IDs (see `ReadOnlyGraphView`), so `SearchEngine` runs on it
+    unchanged.
+
+    Narrower types must not change any result, so the conversion is checked when the graph is
+    built: every ID and index must fit the integer type, and every weight and coordinate must
+    survive the round trip to the float type bit for bit (NaN for missing coordinates included).
+    The engines widen each value to a Python float before doing arithmetic, so a map that passes
+    the check yields bit-identical g, h and f values. Every result is therefore unchanged, including
+    the `math.isclose` tie-breaks of `SearchState.__lt__` and zero-cost edges. Integer and half-integer
+    weights and grid coordinates pass for float32; a value like 0.1 does not, and requires float64.
+
+    Attributes:
+        node_ids, adjacency_offsets, adjacency_targets (array): The integer arrays ('i' or 'q').
+        adjacency_weights, coordinate_x, coordinate_y (array): The float arrays ('f' or 'd').
+        FLOAT_TYPECODES (Dict[str, str]): The accepted float precisions and their `array` typecodes.
+        INTEGER_TYPECODES (Dict[str, str]): The accepted integer widths and their `array` typecodes.
+    """
+
+    FLOAT_TYPECODES: Dict[str, str] = {"float32": "f", "float64": "d"}
+    INTEGER_TYPECODES: Dict[str, str] = {"int32": "i", "int64": "q"}
+
+    def __init__(self, source_graph: Graph, float_type: str = "float32", integer_type: str = "int32") -> None:
+        """
+        Copies the arrays of an indexed Graph into the requested precision. The source graph can
+        be discarded afterwards.
+
+        Args:
+            source_graph (Graph): A loaded, indexed Graph.
+            float_type (str): 'float32' (default) or 'float64', for weights and coordinates.
+            integer_type (str): 'int32' (default) or 'int64', for node IDs, offsets and targets.
+
+        Raises:
+            ValueError: If a type is unknown, or a value does not survive the narrower type exactly.
+        """
+        if float_type not in self.FLOAT_TYPECODES:
+            raise ValueError(f"Unknown float type '{float_type}'. Supported: {', '.join(self.FLOAT_TYPECODES)}")
+        if integer_type not in self.INTEGER_TYPECODES:
+            raise ValueError(f"Unknown integer type '{integer_type}'. Supported: {', '.join(self.INTEGER_TYPECODES)}")
+        float_typecode = self.FLOAT_TYPECODES[float_type]
+        integer_typecode = self.INTEGER_TYPECODES[integer_type]
+
+        self.node_ids = self._narrow_integers(array("q", source_graph.node_ids), integer_typecode, "Node ID", integer_type)
+        self.adjacency_offsets = self._narrow_integers(source_graph.adjacency_offsets, integer_typecode, "Edge offset", integer_type)
+        self.adjacency_targets = self._narrow_integers(source_graph.adjacency_targets, integer_typecode, "Edge target", integer_type)
+        self.adjacency_weights = self._narrow_floats(source_graph.adjacency_weights, float_typecode, "Edge weight", float_type)
+        self.coordinate_x = self._narrow_floats(source_graph.coordinate_x, float_typecode, "Coordinate", float_type)
+        self.coordinate_y = self._narrow_floats(source_graph.coordinate_y, float_typecode, "Coordinate", float_type)
+
+        self._attach_default_query(source_graph.origin, source_graph.destinations)
+
+    @classmethod
+    def load(cls, filepath: str, float_type: str = "float32", integer_type: str = "int32") -> "CompactGraph":
+        """
+        Parses a configuration file and keeps only its compact arrays.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the map is invalid, or does not fit the requested precision exactly.
+        """
+        source_graph = Graph()
+        source_graph.load_from_file(filepath)
+        return cls(source_graph, float_type, integer_type)
+
+    # ---------------------------------------------------------------------------
+    # Load-Time Precision Checks
+    # ---------------------------------------------------------------------------
+    @staticmethod
+    def _narrow_integers(source_values: array, typecode: str, value_label: str, type_name: str) -> array:
+        """
+        Copies integers into `typecode`.
+
+        Raises:
+            ValueError: If a value is outside the type's range.
+        """
+        try:
+            return array(typecode, source_values)
+        except OverflowError:
+            value_limit = 1 << (8 * array(typecode).itemsize - 1)
+            offending_value = next(value for value in source_values if not -value_limit <= value < value_limit)
+            raise ValueError(f"{value_label} {offending_value} does not fit {type_name}; use int64.") from None
+
+    @staticmethod
+    def _narrow_floats(source_values: array, typecode: str, value_label: str, type_name: str) -> array:
+        """
+        Copies floats into `typecode` and checks that widening them back restores every bit.
+
+        Raises:
+            ValueError: If a value is not exactly representable in the type.
+        """
+        narrowed_values = array(typecode, source_values)
+        widened_values = array("d", narrowed_values)
+        if widened_values.tobytes() != array("d", source_values).tobytes():
+            offending_value = next(
+                source_value for source_value, widened_value in zip(source_values, widened_values)
+                if array("d", [source_value]).tobytes() != array("d", [widened_value]).tobytes()
+            )
+            raise ValueError(
+                f"{value_label} {offending_value!r} is not exactly representable as {type_name}; "
+                f"results could change, use float64."
+            )
+        return narrowed_values
+
+    # ---------------------------------------------------------------------------
+    # Footprint
+    # ---------------------------------------------------------------------------
+    @property
+    def array_bytes(self) -> int:
+        """The memory held by the arrays, in bytes."""
+        return sum(
+            len(values) * values.itemsize for values in (
+                self.node_ids, self.adjacency_offsets, self.adjacency_targets,
+                self.adjacency_weights, self.coordinate_x, self.coordinate_y,
+            )
+        )
@@ -0,0 +1,233 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+import shared_graph
+
+
+# ---------------------------------------------------------------------------
+# Delta-Stepping Single-Source Shortest Paths
+# ---------------------------------------------------------------------------
+class DeltaSteppingEngine:
+    """
+    Computes one-to-all shortest path distances with Meyer and Sanders' delta-stepping algorithm.
+
+    Architectural Note:
+    The CSR adjacency is split once into a "light" (weight <= delta) and a "heavy" CSR. Each step
+    takes the window [m, m + delta), where m is the smallest tentative distance still pending, and
+    relaxes the light edges of every node in the window as one NumPy batch; nodes whose distance
+    drops back into the window are relaxed again until it is stable. Only then are the heavy edges
+    of the window relaxed, once: a heavy edge can never land inside its own window. A batch
+    gathers the edges of all its nodes with one `np.repeat`, and duplicate targets are reduced
+    with `np.minimum.at`.
+
+    A relaxation only ever writes `distance[u] + weight`, the same floating-point sum CUS1 uses for
+    g, and the result is the least fixed point of those sums, so every distance is bit-for-bit the
+    cost with which CUS1 settles the node. (CUS1 treats priorities within a relative 1e-9 of each
+    other as tied; if two such near-equal route costs reach the same node, CUS1 may keep the
+    marginally larger one, while this engine keeps the smaller.)
+
+    Attributes:
+        graph (Any): The topology (`Graph` or an attached `SharedGraph`); never mutated.
+        delta (float): The bucket width. Small values approach Dijkstra (many small steps), large
+                       values approach Bellman-Ford (few steps, more re-relaxations).
+    """
+
+    def __init__(self, graph: Any, delta: Optional[float] = None) -> None:
+        """
+        Builds the light and heavy CSR arrays.
+
+        Args:
+            graph (Any): The indexed topology.
+            delta (Optional[float]): The bucket width; defaults to the mean edge weight.
+
+        Raises:
+            ValueError: If delta is not positive, or an edge weight is negative.
+        """
+        self.graph = graph
+        adjacency_offsets = np.asarray(graph.adjacency_offsets, dtype=np.int64)
+        adjacency_targets = np.asarray(graph.adjacency_targets, dtype=np.int64)
+        adjacency_weights = np.asarray(graph.adjacency_weights, dtype=np.float64)
+        if adjacency_weights.size and adjacency_weights.min() < 0.0:
+            raise ValueError("Delta-stepping requires non-negative edge weights.")
+
+        if delta is None:
+            delta = float(adjacency_weights.mean()) if adjacency_weights.size else 1.0
+            delta = delta if delta > 0.0 else 1.0
+        if not delta > 0.0:
+            raise ValueError(f"delta must be positive, got {delta}.")
+        self.delta = delta
+
+        node_count = graph.node_count
+        edge_sources = np.repeat(np.arange(node_count, dtype=np.int64), np.diff(adjacency_offsets))
+        light_mask = adjacency_weights <= delta
+        self._light_csr = self._select_edges(node_count, edge_sources, adjacency_targets, adjacency_weights, light_mask)
+        self._heavy_csr = self._select_edges(node_count, edge_sources, adjacency_targets, adjacency_weights, ~light_mask)
+
+    @staticmethod
+    def _select_edges(
+        node_count: int,
+        edge_sources: "np.ndarray",
+        adjacency_targets: "np.ndarray",
+        adjacency_weights: "np.ndarray",
+        edge_mask: "np.ndarray"
+    ) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """
+        Extracts the masked edges as a CSR triple (offsets, targets, weights), preserving row order.
+        """
+        row_lengths = np.bincount(edge_sources[edge_mask], minlength=node_count)
+        selected_offsets = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(row_lengths, out=selected_offsets[1:])
+        return selected_offsets, adjacency_targets[edge_mask], adjacency_weights[edge_mask]
+
+    def solve(self, source_id: int) -> "np.ndarray":
+        """
+        Computes the distance from one node to every node.
+
+        Args:
+            source_id (int): The external ID of the source node.
+
+        Returns:
+            np.ndarray: A float64 array indexed by dense index (`graph.node_ids` order); `inf` marks
+                        unreachable nodes.
+
+        Raises:
+            KeyError: If the source is not part of the graph.
+
+        Internal Variables:
+            pending_nodes (np.ndarray): Nodes with a finite tentative distance not yet in a finished window.
+            window_nodes (np.ndarray): The nodes whose light edges are relaxed in the current batch.
+            settled_nodes (List[np.ndarray]): Every node of the current window, for the heavy relaxation.
+        """
+        distances = np.full(self.graph.node_count, math.inf)
+        source_index = self.graph.node_index[source_id]
+        distances[source_index] = 0.0
+        pending_nodes = np.array([source_index], dtype=np.int64)
+
+        while pending_nodes.size:
+            pending_nodes = np.unique(pending_nodes)
+            pending_distances = distances[pending_nodes]
+            window_limit = pending_distances.min() + self.delta
+            in_window = pending_distances < window_limit
+            window_nodes = pending_nodes[in_window]
+            pending_nodes = pending_nodes[~in_window]
+
+            settled_nodes: List["np.ndarray"] = []
+            while window_nodes.size:
+                settled_nodes.append(window_nodes)
+                improved_nodes = self._relax(window_nodes, self._light_csr, distances)
+                returning = distances[improved_nodes] < window_limit
+                window_nodes = improved_nodes[returning]
+                pending_nodes = np.concatenate((pending_nodes, improved_nodes[~returning]))
+
+            # Nodes queued beyond the window and later pulled into it are final now.
+            pending_nodes = pending_nodes[distances[pending_nodes] >= window_limit]
+            # Heavy edges cannot land inside the window, so one pass over its final members suffices.
+            window_members = np.unique(np.concatenate(settled_nodes))
+            pending_nodes = np.concatenate((pending_nodes, self._relax(window_members, self._heavy_csr, distances)))
+
+        return distances
+
+    @staticmethod
+    def _relax(
+        source_nodes: "np.ndarray",
+        edge_csr: Tuple["np.ndarray", "np.ndarray", "np.ndarray"],
+        distances: "np.ndarray"
+    ) -> "np.ndarray":
+        """
+        Relaxes every edge of `source_nodes` in one batch.
+
+        Args:
+            source_nodes (np.ndarray): The dense indices whose outbound edges are relaxed.
+            edge_csr (Tuple): The (offsets, targets, weights) CSR to take the edges from.
+            distances (np.ndarray): The tentative distances, updated in place.
+
+        Returns:
+            np.ndarray: The distinct nodes whose distance strictly decreased.
+        """
+        edge_offsets, edge_targets, edge_weights = edge_csr
+        row_starts = edge_offsets[source_nodes]
+        row_lengths = edge_offsets[source_nodes + 1] - row_starts
+        edge_count = int(row_lengths.sum())
+        if not edge_count:
+            return np.empty(0, dtype=np.int64)
+
+        # Position k of the batch belongs to row r: its edge is row_starts[r] + (k - first position of r).
+        row_firsts = np.cumsum(row_lengths) - row_lengths
+        edge_positions = np.arange(edge_count, dtype=np.int64) + np.repeat(row_starts - row_firsts, row_lengths)
+
+        candidate_targets = edge_targets[edge_positions]
+        candidate_distances = np.repeat(distances[source_nodes], row_lengths) + edge_weights[edge_positions]
+        improving = candidate_distances < distances[candidate_targets]
+        candidate_targets = candidate_targets[improving]
+        np.minimum.at(distances, candidate_targets, candidate_distances[improving])
+        return np.unique(candidate_targets)
+
+    def distance_map(self, source_id: int) -> Dict[int, float]:
+        """
+        Computes the distances from one node, keyed by external node ID.
+
+        Returns:
+            Dict[int, float]: The distance of every reachable node (the source included, at 0.0).
+        """
+        distances = self.solve(source_id)
+        reachable_indices = np.flatnonzero(np.isfinite(distances))
+        return {self.graph.node_ids[int(node_index)]: float(distances[node_index]) for node_index in reachable_indices}
+
+    def solve_many(self, source_ids: List[int], max_workers: Optional[int] = None) -> "np.ndarray":
+        """
+        Computes a distance matrix, one row per source, for cost matrices, landmark tables or isochrones.
+
+        Architectural Note:
+        With `max_workers` > 1 the sources are spread across a process pool. The topology is published
+        once to shared memory (see `SharedGraphPublisher`), and every worker builds its own engine on
+        the zero-copy view, so only source IDs and result rows cross process boundaries. Only a loaded
+        `Graph` can be published.
+
+        Args:
+            source_ids (List[int]): The external IDs of the sources.
+            max_workers (Optional[int]): The number of processes; None or 1 computes the rows in this process.
+
+        Returns:
+            np.ndarray: A (len(source_ids), node_count) float64 matrix in source order.
+        """
+        if max_workers is None or max_workers <= 1 or len(source_ids) <= 1:
+            return np.array([self.solve(source_id) for source_id in source_ids]).reshape(len(source_ids), self.graph.node_count)
+
+        with shared_graph.SharedGraphPublisher(self.graph) as graph_publisher:
+            with ProcessPoolExecutor(
+                max_workers=min(max_workers, os.cpu_count() or max_workers),
+                initializer=initialize_worker,
+                initargs=(graph_publisher.handle, self.delta),
+            ) as executor:
+                return np.array(list(executor.map(solve_in_shared_worker, source_ids)))
+
+
+# ---------------------------------------------------------------------------
+# Process Pool Integration
+# ---------------------------------------------------------------------------
+_worker_engine: Optional[DeltaSteppingEngine] = None
+
+
+def initialize_worker(handle: shared_graph.SharedGraphHandle, delta: float) -> None:
+    """
+    A `ProcessPoolExecutor` initializer that attaches the worker to the published graph and builds
+    its engine once.
+    """
+    global _worker_engine
+    shared_graph.initialize_worker(handle)
+    _worker_engine = DeltaSteppingEngine(shared_graph.worker_graph(), delta)
+
+
+def solve_in_shared_worker(source_id: int) -> "np.ndarray":
+    """
+    Computes one distance row inside a process initialized with `initialize_worker`.
+    This must stay a module-level function so that the process pool can pickle a reference to it.
+    """
+    return _worker_engine.solve(source_id)
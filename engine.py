@@ -1,10 +1,37 @@
 # ---------------------------------------------------------------------------
 # Imports & Dependencies
 # ---------------------------------------------------------------------------
+from __future__ import annotations
+
 import heapq
-from collections import deque
-from typing import List, Tuple, Optional, Set, Any
-from models import SearchState
+import sys
+import time
+from array import array
+from models import SearchState, SearchBudget, SearchOutcome
+from problem import SearchProblem
+from frontier import FRONTIER_TYPES
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import List, Tuple, Optional, Set, Any
+    from expansion_trace import ExpansionTrace
+
+
+# ---------------------------------------------------------------------------
+# Internal Control Flow
+# ---------------------------------------------------------------------------
+class _SearchBudgetExhausted(Exception):
+    """
+    Raised by `SearchEngine._enforce_budget` to unwind any algorithm (including the recursive IDA*) 
+    back to `solve`, which converts it into a 'BUDGET_EXHAUSTED' SearchOutcome.
+    
+    Attributes:
+        exhausted_limit (str): The SearchBudget field that tripped.
+    """
+
+    def __init__(self, exhausted_limit: str) -> None:
+        super().__init__(exhausted_limit)
+        self.exhausted_limit = exhausted_limit
 
 
 # ---------------------------------------------------------------------------
@@ -15,114 +42,286 @@ class SearchEngine:
     SearchEngine is the core algorithmic orchestrator responsible for executing various 
     informed and uninformed pathfinding algorithms on a provided graph representation.
     
+    Architectural Note:
+    Every engine works on the graph's dense node indices (see `Graph.build_index`). Visited and 
+    closed markers are bytearrays, parents and g-values are flat typed arrays, and external node 
+    IDs are only restored when the final path is reported.
+    
+    When the graph carries a `ReachabilityIndex` (see `Graph.build_reachability_index`), `solve` 
+    first asks it whether any destination is reachable at all, and answers "No solution" without 
+    searching if not. Otherwise the nodes that cannot reach a destination start out pre-marked in 
+    each algorithm's visited/closed bitmap, so they are never generated and the hot loops stay 
+    unchanged.
+    
+    The engine only reads the graph, and keeps everything that belongs to one query (origin, goal 
+    bitmap, heuristic cache) in its `SearchProblem`. Any number of engines, each with its own 
+    problem, may therefore search one loaded graph concurrently.
+    
     Attributes:
         graph (Any): The instantiated mathematical problem space containing spatial node 
-                     coordinates, adjacency lists, and routing parameters.
+                     coordinates and adjacency lists. It is never mutated by a search.
+        problem (SearchProblem): The query being answered: origin, destinations and heuristic.
+        frontier_type (str): The open-list implementation of the best-first searches: 'heap' (default), 
+                             'dial' or 'radix' (see `frontier.py`).
         total_nodes_created (int): A critical space-complexity metric tracking the absolute total 
-                                   number of SearchState instances instantiated during a run.
+                                   number of search nodes generated during a run. Array-based engines 
+                                   that never allocate a SearchState still count every generation.
         creation_timestamp (int): A strictly monotonically increasing counter. It guarantees the 
                                   tertiary assignment tie-breaking rule: if heuristic costs and 
                                   node IDs are identical, the node generated first chronologically 
                                   is expanded first.
+        budget (Optional[SearchBudget]): The cooperative limits of the current run, if any.
+        trace (Optional[ExpansionTrace]): The recorder receiving every generate, expand and prune event, 
+                                          if tracing is enabled (see `expansion_trace.py`).
+        search_outcome (Optional[SearchOutcome]): The detailed result of the last `solve` call, including 
+                                                  partial progress when a budget was exhausted.
+        BUDGET_CLOCK_INTERVAL (int): How many budget checks pass between two reads of the clock.
+        ARA_INITIAL_WEIGHT (float): The heuristic inflation ε used for the first, fast ARA* solution.
+        ARA_WEIGHT_DECREMENT (float): How much ε is tightened between successive ARA* improvements.
     """
 
+    BUDGET_CLOCK_INTERVAL: int = 64
+    ARA_INITIAL_WEIGHT: float = 2.5
+    ARA_WEIGHT_DECREMENT: float = 0.5
+
     # ---------------------------------------------------------------------------
     # Initialization
     # ---------------------------------------------------------------------------
-    def __init__(self, graph: Any) -> None:
+    def __init__(
+        self, 
+        graph: Any, 
+        problem: Optional[SearchProblem] = None, 
+        frontier_type: str = "heap", 
+        trace: Optional[ExpansionTrace] = None
+    ) -> None:
         """
         Initializes the Search Engine and resets all internal benchmarking metrics.
         
         Args:
             graph (Any): The mathematical problem space to be traversed.
+            problem (Optional[SearchProblem]): The query to answer. Defaults to a fresh problem built 
+                                               from the graph's own origin and destinations.
+            frontier_type (str): The open list used by GBFS, AS, CUS1 and the nearest-goal queries. The 
+                                 monotone 'dial' (integer priorities) and 'radix' frontiers suit CUS1, and 
+                                 AS under a consistent heuristic; ARA* and IDA* always use their own.
+            trace (Optional[ExpansionTrace]): Records the search's events; tracing is off when None, which 
+                                              costs one `is not None` test per event site.
+                                 
+        Raises:
+            ValueError: If the frontier type is unknown.
         """
+        if frontier_type not in FRONTIER_TYPES:
+            raise ValueError(f"Unknown frontier type '{frontier_type}'. Supported: {', '.join(FRONTIER_TYPES)}")
         self.graph = graph
+        self.problem = problem if problem is not None else SearchProblem.from_graph(graph)
+        self.frontier_type = frontier_type
         self.total_nodes_created: int = 0
         self.creation_timestamp: int = 0
+        self.budget: Optional[SearchBudget] = None
+        self.trace = trace
+        self.search_outcome: Optional[SearchOutcome] = None
+        self._partial_progress: Optional[Tuple[bytearray, array]] = None
+        self._unproductive_flags: Optional[bytearray] = None
+        self._node_limit: int = sys.maxsize
 
     # ---------------------------------------------------------------------------
     # State & Path Management
     # ---------------------------------------------------------------------------
     def _create_search_state(
         self, 
-        node_identifier: int, 
-        parent_state: Optional[SearchState], 
+        node_index: int, 
+        parent_index: int, 
         cumulative_cost: float, 
-        search_method: str
+        search_method: str,
+        heuristic_weight: float = 1.0
     ) -> SearchState:
         """
         A factory method that provisions a new SearchState object, computes its specific 
         heuristic estimation, and increments the global tracking metrics.
         
         Args:
-            node_identifier (int): The unique numeric ID of the specific graph node.
-            parent_state (Optional[SearchState]): The immediate predecessor state in the search tree. 
-                                                  Passed as None for the origin node.
+            node_index (int): The dense index of the specific graph node.
+            parent_index (int): The dense index of the immediate predecessor in the search tree. 
+                                Passed as -1 for the origin node.
             cumulative_cost (float): The actual path cost accumulated from the origin to this node (g-value).
             search_method (str): The identifier of the algorithm dictating how the priority score is computed.
+            heuristic_weight (float): The ε inflation applied to h by the 'ara' method.
             
         Returns:
             SearchState: The newly instantiated, chronologically stamped node wrapper.
             
+        Raises:
+            _SearchBudgetExhausted: If the node would exceed the budget's `max_nodes_created`.
+            
         Internal Variables:
             heuristic_cost (float): The estimated remaining cost to the goal (h-value), computed dynamically.
         """
+        if self.total_nodes_created >= self._node_limit:
+            raise _SearchBudgetExhausted("max_nodes_created")
         self.total_nodes_created += 1
         self.creation_timestamp += 1
         
-        heuristic_cost = self.graph.heuristic(node_identifier)
+        heuristic_cost = self.problem.heuristic_by_index(node_index)
         
-        return SearchState(
-            node_identifier, 
-            parent_state, 
+        new_state = SearchState(
+            node_index, 
+            parent_index, 
             cumulative_cost, 
             heuristic_cost, 
             search_method, 
-            self.creation_timestamp
+            self.creation_timestamp,
+            heuristic_weight
         )
+        if self.trace is not None:
+            self.trace.generate(self.graph.node_ids[node_index], cumulative_cost, heuristic_cost, new_state.priority_score)
+        return new_state
 
-    def _reconstruct_path(self, goal_state: SearchState) -> List[int]:
+    def _register_created_nodes(self, node_count: int) -> None:
         """
-        Backtracks through the parent pointers of the search tree from the destination 
-        back to the origin to reconstruct the final sequential path.
+        Accounts for search nodes generated by the array-based engines, which record them 
+        in flat arrays instead of allocating SearchState objects.
         
         Args:
-            goal_state (SearchState): The valid destination state that terminated the search.
+            node_count (int): The number of nodes generated in one batch.
+            
+        Raises:
+            _SearchBudgetExhausted: If the batch would exceed the budget's `max_nodes_created`.
+        """
+        if self.total_nodes_created + node_count > self._node_limit:
+            raise _SearchBudgetExhausted("max_nodes_created")
+        self.total_nodes_created += node_count
+        self.creation_timestamp += node_count
+
+    def _resolve_origin_index(self) -> Optional[int]:
+        """
+        Translates the problem's origin into its dense index.
+        
+        Returns:
+            Optional[int]: The dense index of the origin, or None if the problem defines no origin.
+        """
+        return self.problem.origin_index
+
+    def _is_goal(self, node_index: int) -> bool:
+        """
+        Reports whether a dense index corresponds to one of the routing destinations.
+        
+        Args:
+            node_index (int): The dense index under evaluation.
+        """
+        return self.problem.goal_flags[node_index] == 1
+
+    def _reconstruct_path(self, goal_index: int, parent_indices: array) -> List[int]:
+        """
+        Backtracks through the flat parent array from the destination back to the origin 
+        and translates the dense indices back into external node IDs.
+        
+        Args:
+            goal_index (int): The dense index of the destination that terminated the search.
+            parent_indices (array): Maps every discovered dense index to its predecessor (-1 at the root).
             
         Returns:
             List[int]: An ordered list of node IDs from origin to destination.
             
         Internal Variables:
             path_sequence (List[int]): The temporary buffer holding the reversed path during backtracking.
-            current_state (Optional[SearchState]): The active pointer walking up the ancestral chain.
+            current_index (int): The active pointer walking up the ancestral chain.
         """
         path_sequence: List[int] = []
-        current_state: Optional[SearchState] = goal_state
+        current_index = goal_index
         
-        while current_state is not None:
-            path_sequence.append(current_state.node_id)
-            current_state = current_state.parent
+        while current_index != -1:
+            path_sequence.append(self.graph.node_ids[current_index])
+            current_index = parent_indices[current_index]
             
         # The path is constructed backwards (Goal -> Origin), so it must be reversed before returning
         return path_sequence[::-1]
 
+    def _new_node_flags(self, seed_flags: Optional[bytearray] = None) -> bytearray:
+        """
+        Allocates a per-node visited/closed bitmap, with the nodes that cannot reach a destination 
+        already marked when the graph has a reachability index.
+        
+        Args:
+            seed_flags (Optional[bytearray]): Further nodes to pre-mark (e.g. the blocked nodes of a spur search).
+        """
+        node_flags = bytearray(seed_flags) if seed_flags is not None else bytearray(self.graph.node_count)
+        if self._unproductive_flags is not None:
+            if seed_flags is None:
+                return bytearray(self._unproductive_flags)
+            node_flags = bytearray(
+                (int.from_bytes(node_flags, "little") | int.from_bytes(self._unproductive_flags, "little"))
+                .to_bytes(len(node_flags), "little")
+            )
+        return node_flags
+
+    def _load_unproductive_flags(self) -> bool:
+        """
+        Consults the graph's reachability index, if any, before a search.
+        
+        Returns:
+            bool: False if the index proves that no destination is reachable from the origin.
+        """
+        self._unproductive_flags = None
+        reachability_index = getattr(self.graph, "reachability_index", None)
+        if reachability_index is None:
+            return True
+        origin_index = self.problem.origin_index
+        if origin_index is not None and not reachability_index.reaches_any(origin_index, self.problem.destination_indices):
+            return False
+        self._unproductive_flags = reachability_index.unproductive_flags(self.problem.destination_indices)
+        return True
+
     # ---------------------------------------------------------------------------
     # Execution Dispatcher
     # ---------------------------------------------------------------------------
-    def solve(self, search_method: str) -> Optional[Tuple[int, int, List[int]]]:
+    def solve(self, search_method: str, budget: Optional[SearchBudget] = None) -> Optional[Tuple[int, int, List[int]]]:
         """
         The primary dispatcher method that normalizes user input and routes execution 
         to the appropriate internal traversal algorithm.
         
         Args:
             search_method (str): A string indicating the algorithm (e.g., 'dfs', 'as').
+            budget (Optional[SearchBudget]): Cooperative node, time and frontier limits. When a limit 
+                                             trips, the search stops and `search_outcome` records the 
+                                             best node reached so far. The anytime 'ara' method instead 
+                                             returns its best solution once it has one.
             
         Returns:
             Optional[Tuple[int, int, List[int]]]: A payload containing (Goal ID, Nodes Created, Path), 
-                                                  or None if the entire space is exhausted without a solution.
+                                                  or None if the entire space is exhausted without a solution 
+                                                  or the budget ran out. `search_outcome` tells the two apart.
         """
         normalized_method = search_method.lower()
+        self._arm_budget(budget)
+        self._partial_progress = None
+        self._suboptimality_bound: Optional[float] = None
+        if not self._load_unproductive_flags():
+            self.search_outcome = SearchOutcome("No_Solution", total_nodes_created=self.total_nodes_created)
+            return None
+
+        try:
+            search_result = self._dispatch(normalized_method)
+        except _SearchBudgetExhausted as budget_exhaustion:
+            self.search_outcome = self._build_partial_outcome(budget_exhaustion.exhausted_limit)
+            return None
+
+        if search_result is None:
+            self.search_outcome = SearchOutcome("No_Solution", total_nodes_created=self.total_nodes_created)
+        else:
+            reached_goal_id, total_nodes_created, path_sequence = search_result
+            self.search_outcome = SearchOutcome(
+                "SUCCESS", reached_goal_id, total_nodes_created, path_sequence, 
+                suboptimality_bound=self._suboptimality_bound
+            )
+        return search_result
+
+    def _dispatch(self, normalized_method: str) -> Optional[Tuple[int, int, List[int]]]:
+        """
+        Routes a normalized method identifier to its traversal algorithm.
         
+        Args:
+            normalized_method (str): The lowercase algorithm identifier.
+        """
         if normalized_method == "dfs":
             return self._execute_depth_first_search()
         if normalized_method == "bfs":
@@ -135,9 +334,117 @@ class SearchEngine:
             return self._execute_priority_search("cus1")
         if normalized_method == "cus2":
             return self._execute_iterative_deepening_a_star()
+        if normalized_method == "ara":
+            return self._execute_anytime_repairing_a_star()
             
         return None
 
+    # ---------------------------------------------------------------------------
+    # Cooperative Budget Enforcement
+    # ---------------------------------------------------------------------------
+    def _arm_budget(self, budget: Optional[SearchBudget]) -> None:
+        """
+        Converts a SearchBudget into the flat limits read by `_enforce_budget` and by the node 
+        counters. Unset limits become `sys.maxsize`, so that each check is one integer comparison.
+        
+        Args:
+            budget (Optional[SearchBudget]): The limits for this run, or None for an unbounded search.
+        """
+        self.budget = budget
+        # Primed so that the very first check also reads the clock (a zero time limit stops at once).
+        self._budget_check_counter = self.BUDGET_CLOCK_INTERVAL - 1
+        self._node_limit = sys.maxsize
+        if budget is None:
+            return
+
+        self._node_limit = budget.max_nodes_created if budget.max_nodes_created is not None else sys.maxsize
+        self._frontier_limit = budget.max_frontier_size if budget.max_frontier_size is not None else sys.maxsize
+        self._deadline = None
+        if budget.time_limit_seconds is not None:
+            self._deadline = time.monotonic() + budget.time_limit_seconds
+
+    def _enforce_budget(self, frontier_size: int) -> None:
+        """
+        Checks the armed budget. Called once per expansion by every algorithm loop, and only 
+        when a budget is set, so unbounded searches pay a single `is not None` test.
+        
+        Architectural Note:
+        The clock is read only every `BUDGET_CLOCK_INTERVAL` checks; the frontier limit is a plain 
+        integer comparison and is checked every time. The node limit is not checked here but where 
+        nodes are generated (`_create_search_state`, `_register_created_nodes`), because a single 
+        expansion can generate a whole row of children: a search never creates more than 
+        `max_nodes_created` nodes, and trips the budget on its next generation instead.
+        
+        Args:
+            frontier_size (int): The current length of the algorithm's frontier.
+            
+        Raises:
+            _SearchBudgetExhausted: If the time or frontier limit has been reached.
+        """
+        if frontier_size > self._frontier_limit:
+            raise _SearchBudgetExhausted("max_frontier_size")
+        if self._deadline is not None:
+            self._budget_check_counter += 1
+            if self._budget_check_counter % self.BUDGET_CLOCK_INTERVAL == 0 and time.monotonic() >= self._deadline:
+                raise _SearchBudgetExhausted("time_limit_seconds")
+
+    def _record_progress(self, explored_flags: bytearray, parent_indices: array) -> None:
+        """
+        Registers the structures describing what the active algorithm has explored, so that 
+        an interrupted search can still report the best node it reached.
+        
+        Args:
+            explored_flags (bytearray): Marks every node with a known route from the origin.
+            parent_indices (array): The predecessor of every marked node (-1 at the origin).
+        """
+        self._partial_progress = (explored_flags, parent_indices)
+
+    def _build_partial_outcome(self, exhausted_limit: str) -> SearchOutcome:
+        """
+        Selects the best explored node after a budget interruption.
+        
+        Architectural Note:
+        "Best" is the explored node with the lowest heuristic estimate (ties to the lower ID), 
+        i.e. the one believed closest to a destination. The O(N) scan happens once, on the 
+        failure path, so the hot loops do not have to track it.
+        
+        Args:
+            exhausted_limit (str): The budget field that tripped.
+            
+        Internal Variables:
+            best_index (int): The dense index of the best node found so far.
+            best_heuristic (float): Its heuristic estimate.
+        """
+        partial_outcome = SearchOutcome("BUDGET_EXHAUSTED", total_nodes_created=self.total_nodes_created, exhausted_limit=exhausted_limit)
+        if self._partial_progress is None:
+            return partial_outcome
+        if self.problem.origin is not None:
+            # The origin is always reached, even if the budget trips before it is expanded.
+            partial_outcome.best_node_id = self.problem.origin
+            partial_outcome.best_path = [self.problem.origin]
+
+        explored_flags, parent_indices = self._partial_progress
+        best_index = -1
+        best_heuristic = float("inf")
+
+        unproductive_flags = self._unproductive_flags
+        for node_index, explored in enumerate(explored_flags):
+            # Pre-marked unproductive nodes were never actually reached.
+            if not explored or (unproductive_flags is not None and unproductive_flags[node_index]):
+                continue
+            try:
+                node_heuristic = self.problem.heuristic_by_index(node_index)
+            except KeyError:
+                # Nodes without coordinates cannot be ranked; they only win if nothing else was explored.
+                node_heuristic = float("inf")
+            if best_index == -1 or node_heuristic < best_heuristic:
+                best_index, best_heuristic = node_index, node_heuristic
+
+        if best_index != -1:
+            partial_outcome.best_node_id = self.graph.node_ids[best_index]
+            partial_outcome.best_path = self._reconstruct_path(best_index, parent_indices)
+        return partial_outcome
+
     # ---------------------------------------------------------------------------
     # Uninformed Search Algorithms
     # ---------------------------------------------------------------------------
@@ -147,74 +454,133 @@ class SearchEngine:
         
         Architectural Note: 
         DFS explores as deeply as possible along each branch before backtracking. 
-        We use a global `visited_nodes` set to prevent infinite loops in cyclic graphs.
+        We use a global visited bitmap to prevent infinite loops in cyclic graphs. Because 
+        DFS never reads g or h, the frontier holds bare dense indices rather than SearchStates.
         
         Internal Variables:
-            stack (List[SearchState]): A Last-In-First-Out (LIFO) data structure governing the frontier.
-            visited_nodes (Set[int]): A hash set ensuring nodes are expanded only once.
+            stack (List[int]): A Last-In-First-Out (LIFO) data structure governing the frontier.
+            visited_flags (bytearray): A dense bitmap ensuring nodes are discovered only once.
+            parent_indices (array): The dense index of each node's discoverer (-1 for the origin).
         """
-        start_state = self._create_search_state(self.graph.origin, None, 0.0, "dfs")
-        stack: List[SearchState] = [start_state]
-        visited_nodes: Set[int] = {self.graph.origin} 
+        origin_index = self._resolve_origin_index()
+        if origin_index is None:
+            return None
+
+        visited_flags = self._new_node_flags()
+        visited_flags[origin_index] = 1
+        parent_indices = array("q", [-1]) * self.graph.node_count
+        stack: List[int] = [origin_index]
+        self._register_created_nodes(1)
+        self._record_progress(visited_flags, parent_indices)
+        trace = self.trace
+        if trace is not None:
+            trace.generate(self.graph.node_ids[origin_index])
 
         while stack:
-            current_state = stack.pop()
+            if self.budget is not None:
+                self._enforce_budget(len(stack))
+
+            current_index = stack.pop()
+            if trace is not None:
+                trace.expand(self.graph.node_ids[current_index])
 
-            if current_state.node_id in self.graph.destinations:
-                return current_state.node_id, self.total_nodes_created, self._reconstruct_path(current_state)
+            if self._is_goal(current_index):
+                return self.graph.node_ids[current_index], self.total_nodes_created, self._reconstruct_path(current_index, parent_indices)
 
-            neighbors = self.graph.get_neighbors(current_state.node_id)
+            targets, _, row_start, row_stop = self.graph.get_adjacency_slice(current_index)
             
             # Tie-Breaking Justification (DFS): 
             # Because a stack pops the LAST element added, pushing neighbors in strictly DESCENDING 
             # order guarantees that the algorithm will pop and expand them in ASCENDING order.
-            neighbors.sort(key=lambda neighbor: neighbor[0], reverse=True)
-
-            for neighbor_identifier, edge_weight in neighbors:
-                if neighbor_identifier not in visited_nodes:
-                    visited_nodes.add(neighbor_identifier)
-                    new_cumulative_cost = current_state.g + edge_weight
-                    new_state = self._create_search_state(neighbor_identifier, current_state, new_cumulative_cost, "dfs")
-                    stack.append(new_state)
+            for position in range(row_stop - 1, row_start - 1, -1):
+                neighbor_index = targets[position]
+                if not visited_flags[neighbor_index]:
+                    self._register_created_nodes(1)
+                    visited_flags[neighbor_index] = 1
+                    parent_indices[neighbor_index] = current_index
+                    stack.append(neighbor_index)
+                    if trace is not None:
+                        trace.generate(self.graph.node_ids[neighbor_index])
                     
         return None
 
     def _execute_breadth_first_search(self) -> Optional[Tuple[int, int, List[int]]]:
         """
-        Executes a Breadth-First Search (BFS) using a Graph Search approach.
+        Executes a level-synchronous Breadth-First Search (BFS) over the graph's CSR arrays.
         
         Architectural Note:
         BFS explores the graph strictly level-by-level, guaranteeing the shortest path 
-        in terms of unweighted hops.
+        in terms of unweighted hops. Hop-count search never reads g or h, so instead of 
+        allocating a SearchState per discovered node, the whole frontier is expanded at once 
+        into the next level using a visited bitmap and a flat parent array. The path is only 
+        materialized at the end.
+        
+        Equivalence with the FIFO formulation: the classic queue dequeues a level in discovery 
+        order and stops at the first goal it pops. Each level here is scanned for its first goal 
+        before expansion; only the nodes ahead of that goal are expanded, so the goal, the path 
+        (ascending-ID rows) and the nodes-created metric are identical.
         
         Internal Variables:
-            queue (deque[SearchState]): A First-In-First-Out (FIFO) queue governing the frontier.
-            visited_nodes (Set[int]): A hash set ensuring nodes are expanded only once.
+            frontier (List[int]): The dense indices of the current level, in discovery order.
+            goal_flags (bytearray): The problem's dense bitmap marking destination indices.
+            visited_flags (bytearray): A dense bitmap ensuring each node is discovered only once.
+            parent_indices (array): The dense index of each node's discoverer (-1 for undiscovered/origin).
+            goal_position (int): The position of the first goal within the current level, or -1.
         """
-        start_state = self._create_search_state(self.graph.origin, None, 0.0, "bfs")
-        queue: deque[SearchState] = deque([start_state])
-        visited_nodes: Set[int] = {self.graph.origin}
+        origin_index = self._resolve_origin_index()
+        if origin_index is None:
+            return None
 
-        while queue:
-            current_state = queue.popleft()
-            
-            if current_state.node_id in self.graph.destinations:
-                return current_state.node_id, self.total_nodes_created, self._reconstruct_path(current_state)
+        node_count = self.graph.node_count
+        goal_flags = self.problem.goal_flags
+        visited_flags = self._new_node_flags()
+        visited_flags[origin_index] = 1
+        parent_indices = array("q", [-1]) * node_count
+
+        self._register_created_nodes(1)
+        self._record_progress(visited_flags, parent_indices)
+        frontier: List[int] = [origin_index]
+        trace = self.trace
+        if trace is not None:
+            trace.generate(self.graph.node_ids[origin_index])
+
+        while frontier:
+            goal_position = next((position for position, index in enumerate(frontier) if goal_flags[index]), -1)
+            expanded_frontier = frontier if goal_position < 0 else frontier[:goal_position]
+
+            # The level is registered in one batch below; this is how many nodes it may generate 
+            # before `max_nodes_created` trips.
+            level_allowance = self._node_limit - self.total_nodes_created
+            next_frontier: List[int] = []
+            for node_index in expanded_frontier:
+                if self.budget is not None:
+                    self._enforce_budget(len(frontier) + len(next_frontier))
+                if trace is not None:
+                    trace.expand(self.graph.node_ids[node_index])
+
+                # Tie-Breaking Justification (BFS): 
+                # CSR rows are stored in ASCENDING target order, so appending each row in sequence 
+                # reproduces the exact discovery order of the FIFO queue formulation.
+                targets, _, row_start, row_stop = self.graph.get_adjacency_slice(node_index)
+                for neighbor_index in targets[row_start:row_stop]:
+                    if not visited_flags[neighbor_index]:
+                        if len(next_frontier) >= level_allowance:
+                            self._register_created_nodes(len(next_frontier))
+                            raise _SearchBudgetExhausted("max_nodes_created")
+                        visited_flags[neighbor_index] = 1
+                        parent_indices[neighbor_index] = node_index
+                        next_frontier.append(neighbor_index)
+                        if trace is not None:
+                            trace.generate(self.graph.node_ids[neighbor_index])
+
+            self._register_created_nodes(len(next_frontier))
+
+            if goal_position >= 0:
+                goal_index = frontier[goal_position]
+                return self.graph.node_ids[goal_index], self.total_nodes_created, self._reconstruct_path(goal_index, parent_indices)
+
+            frontier = next_frontier
 
-            neighbors = self.graph.get_neighbors(current_state.node_id)
-            
-            # Tie-Breaking Justification (BFS): 
-            # Because a queue dequeues the FIRST element added, adding neighbors in strictly ASCENDING 
-            # order guarantees they will be dequeued and expanded in that exact same ascending order.
-            neighbors.sort(key=lambda neighbor: neighbor[0])
-
-            for neighbor_identifier, edge_weight in neighbors:
-                if neighbor_identifier not in visited_nodes:
-                    visited_nodes.add(neighbor_identifier)
-                    new_cumulative_cost = current_state.g + edge_weight
-                    new_state = self._create_search_state(neighbor_identifier, current_state, new_cumulative_cost, "bfs")
-                    queue.append(new_state)
-                    
         return None
 
     # ---------------------------------------------------------------------------
@@ -225,41 +591,412 @@ class SearchEngine:
         A unified execution engine for heuristic-driven priority algorithms: 
         Greedy Best-First Search (GBFS), A* Search (AS), and Uniform Cost Search (CUS1).
         
+        Returns:
+            Optional[Tuple[int, int, List[int]]]: (Goal ID, Nodes Created, Path) for the first goal settled.
+        """
+        origin_index = self._resolve_origin_index()
+        if origin_index is None:
+            return None
+
+        settled_goals = self._run_priority_search(search_method, [origin_index], 1)
+        if not settled_goals:
+            return None
+
+        goal_index, _, path_sequence = settled_goals[0]
+        return self.graph.node_ids[goal_index], self.total_nodes_created, path_sequence
+
+    def _run_priority_search(
+        self, 
+        search_method: str, 
+        origin_indices: List[int], 
+        goal_limit: int,
+        settled_goals: Optional[List[Tuple[int, float, List[int]]]] = None,
+        blocked_nodes: Optional[bytearray] = None,
+        blocked_edges: Optional[Set[Tuple[int, int]]] = None
+    ) -> List[Tuple[int, float, List[int]]]:
+        """
+        The shared best-first frontier loop behind GBFS, AS, CUS1 and the multi-source / 
+        k-nearest queries.
+        
         Architectural Note:
         These algorithms evaluate nodes based on an f-cost. Instead of updating existing 
         nodes in the priority queue (which is O(N) in Python), we use "Lazy Deletion" by 
-        ignoring nodes that have already been expanded via a cheaper path.
+        ignoring nodes that have already been expanded via a cheaper path. The frontier still holds 
+        SearchStates and pops them in the order of `SearchState.__lt__` (the monotone frontiers 
+        reproduce its tie-breaks without calling it), but each state only carries its parent's 
+        index; the winning parent and g-value are copied into flat arrays when a node is closed.
+        
+        Every origin is seeded into the same frontier with g = 0, so a multi-source query costs 
+        a single search. A goal is "settled" when it is first popped; with `goal_limit > 1` the 
+        search closes it and keeps expanding (a goal may lie on the route to the next one) until 
+        `goal_limit` distinct goals are settled. Goals are never closed before they are settled, 
+        so checking the closed marker ahead of the goal test is equivalent to the classic order.
+        
+        Args:
+            search_method (str): 'gbfs', 'as' or 'cus1'.
+            origin_indices (List[int]): The dense indices seeded into the frontier, in tie-break order.
+            goal_limit (int): How many goals to settle before stopping.
+            settled_goals (Optional[List]): A caller-owned list to append settled goals to, so that they 
+                                            survive a budget interruption.
+            blocked_nodes (Optional[bytearray]): Dense indices the search must not enter (used by spur 
+                                                 searches). They are simply pre-marked as closed.
+            blocked_edges (Optional[Set[Tuple[int, int]]]): (source, target) index pairs that must not be used.
+            
+        Returns:
+            List[Tuple[int, float, List[int]]]: (goal index, path cost, path of node IDs) per settled goal, 
+                                                in settlement order.
         
         Internal Variables:
-            open_priority_queue (List[SearchState]): A binary min-heap frontier automatically 
-                                                     sorted by f-cost, then ID, then timestamp.
-            closed_set (Set[int]): Tracks nodes that have already been optimally expanded.
+            open_frontier (Any): The `frontier_type` open list, ordered by f-cost, then ID, then timestamp.
+            closed_flags (bytearray): Marks nodes that have already been optimally expanded.
+            parent_indices (array): The predecessor of every closed node (-1 for an origin).
+            settled_costs (array): The g-value with which every closed node was expanded.
         """
-        start_state = self._create_search_state(self.graph.origin, None, 0.0, search_method)
-        open_priority_queue: List[SearchState] = [start_state]
-        closed_set: Set[int] = set()
+        closed_flags = self._new_node_flags(blocked_nodes)
+        parent_indices = array("q", [-1]) * self.graph.node_count
+        settled_costs = array("d", [0.0]) * self.graph.node_count
+        if settled_goals is None:
+            settled_goals = []
 
-        while open_priority_queue:
-            # heapq.heappop inherently respects the SearchState's __lt__ magic method tie-breakers
-            current_state = heapq.heappop(open_priority_queue)
+        open_frontier = FRONTIER_TYPES[self.frontier_type]()
+        push_state, pop_state = open_frontier.push, open_frontier.pop
+        for origin_index in origin_indices:
+            push_state(self._create_search_state(origin_index, -1, 0.0, search_method))
+        self._record_progress(closed_flags, parent_indices)
+
+        while open_frontier:
+            if self.budget is not None:
+                self._enforce_budget(len(open_frontier))
 
-            if current_state.node_id in self.graph.destinations:
-                return current_state.node_id, self.total_nodes_created, self._reconstruct_path(current_state)
+            # Every frontier pops in the order of the SearchState's __lt__ tie-breakers
+            current_state = pop_state()
+            current_index = current_state.node_id
 
             # Lazy Deletion: If this node was previously expanded, a shorter/better path 
             # already processed it. Skip redundant work.
-            if current_state.node_id in closed_set:
+            if closed_flags[current_index]:
+                if self.trace is not None:
+                    self.trace.prune(self.graph.node_ids[current_index], current_state.g, current_state.h, current_state.priority_score)
                 continue
                 
-            closed_set.add(current_state.node_id)
+            closed_flags[current_index] = 1
+            parent_indices[current_index] = current_state.parent
+            settled_costs[current_index] = current_state.g
+            if self.trace is not None:
+                self.trace.expand(self.graph.node_ids[current_index], current_state.g, current_state.h, current_state.priority_score)
 
-            for neighbor_identifier, edge_weight in self.graph.get_neighbors(current_state.node_id):
-                if neighbor_identifier not in closed_set:
-                    new_cumulative_cost = current_state.g + edge_weight
-                    new_state = self._create_search_state(neighbor_identifier, current_state, new_cumulative_cost, search_method)
-                    heapq.heappush(open_priority_queue, new_state)
+            if self._is_goal(current_index):
+                settled_goals.append((current_index, current_state.g, self._reconstruct_path(current_index, parent_indices)))
+                if len(settled_goals) >= goal_limit:
+                    return settled_goals
+
+            targets, weights, row_start, row_stop = self.graph.get_adjacency_slice(current_index)
+            for position in range(row_start, row_stop):
+                neighbor_index = targets[position]
+                if blocked_edges is not None and (current_index, neighbor_index) in blocked_edges:
+                    continue
+                if not closed_flags[neighbor_index]:
+                    new_cumulative_cost = current_state.g + weights[position]
+                    new_state = self._create_search_state(neighbor_index, current_index, new_cumulative_cost, search_method)
+                    push_state(new_state)
                     
-        return None
+        return settled_goals
+
+    # ---------------------------------------------------------------------------
+    # Multi-Source & K-Nearest Queries
+    # ---------------------------------------------------------------------------
+    def solve_nearest(
+        self, 
+        search_method: str = "cus1", 
+        origins: Optional[List[int]] = None, 
+        goal_count: int = 1, 
+        budget: Optional[SearchBudget] = None
+    ) -> List[Tuple[int, float, List[int]]]:
+        """
+        Answers dispatch-style queries with a single search: "which of these origins is closest 
+        to a destination" (multi-source) and "give me the k nearest destinations with paths" 
+        (k-nearest), or both at once.
+        
+        Architectural Note:
+        All origins share one frontier, so each settled goal is reached from whichever origin is 
+        cheapest; the first node of its path tells which origin won. With 'cus1', or 'as' under a 
+        consistent heuristic, goals are settled in ascending cost order, making the result the true 
+        k nearest. 'gbfs' is accepted but gives no such ordering guarantee.
+        
+        Args:
+            search_method (str): 'cus1' (default), 'as' or 'gbfs'.
+            origins (Optional[List[int]]): The origin node IDs; defaults to the problem's origin.
+            goal_count (int): How many distinct destinations to settle (k).
+            budget (Optional[SearchBudget]): Cooperative limits; on exhaustion the goals settled so far 
+                                             are returned and `search_outcome` is 'BUDGET_EXHAUSTED'.
+            
+        Returns:
+            List[Tuple[int, float, List[int]]]: Up to `goal_count` (Goal ID, Path Cost, Path) entries, 
+                                                nearest first. Fewer are returned if fewer are reachable.
+                                                
+        Raises:
+            ValueError: If the method is not a best-first method, k < 1, or an origin is unknown.
+        """
+        normalized_method = search_method.lower()
+        if normalized_method not in ("cus1", "as", "gbfs"):
+            raise ValueError(f"Nearest-goal queries require 'cus1', 'as' or 'gbfs', not '{search_method}'.")
+        if goal_count < 1:
+            raise ValueError("goal_count must be at least 1.")
+
+        origin_identifiers = [self.problem.origin] if origins is None else list(dict.fromkeys(origins))
+        origin_indices: List[int] = []
+        for origin_identifier in origin_identifiers:
+            # A plain lookup: unlike `Graph.index_of`, it never rebuilds a graph other queries may share.
+            origin_index = self.graph.node_index.get(origin_identifier)
+            if origin_index is None:
+                raise ValueError(f"Unknown origin node {origin_identifier}.")
+            origin_indices.append(origin_index)
+
+        self._arm_budget(budget)
+        self._partial_progress = None
+        self._suboptimality_bound = None
+        self._load_unproductive_flags()
+
+        settled_goals: List[Tuple[int, float, List[int]]] = []
+        try:
+            self._run_priority_search(normalized_method, origin_indices, goal_count, settled_goals)
+        except _SearchBudgetExhausted as budget_exhaustion:
+            self.search_outcome = self._build_partial_outcome(budget_exhaustion.exhausted_limit)
+        else:
+            self._record_nearest_outcome(settled_goals)
+
+        return [
+            (self.graph.node_ids[goal_index], path_cost, path_sequence) 
+            for goal_index, path_cost, path_sequence in settled_goals
+        ]
+
+    def _record_nearest_outcome(self, settled_goals: List[Tuple[int, float, List[int]]]) -> None:
+        """
+        Summarizes a completed nearest-goal query in `search_outcome`, using the nearest goal.
+        
+        Args:
+            settled_goals (List[Tuple[int, float, List[int]]]): The goals settled, nearest first.
+        """
+        if settled_goals:
+            first_goal_index, _, first_path = settled_goals[0]
+            self.search_outcome = SearchOutcome("SUCCESS", self.graph.node_ids[first_goal_index], self.total_nodes_created, first_path)
+        else:
+            self.search_outcome = SearchOutcome("No_Solution", total_nodes_created=self.total_nodes_created)
+
+    # ---------------------------------------------------------------------------
+    # Anytime Repairing A* (ARA*) Engine
+    # ---------------------------------------------------------------------------
+    def _execute_anytime_repairing_a_star(self) -> Optional[Tuple[int, int, List[int]]]:
+        """
+        Executes Anytime Repairing A* (ARA*): a weighted A* that returns a first solution quickly 
+        and then tightens it for as long as the budget allows.
+        
+        Architectural Note:
+        Nodes are ranked by an inflated f = g + ε·h (see `SearchState`), starting at 
+        `ARA_INITIAL_WEIGHT`. With an admissible heuristic, each published solution costs at most 
+        ε times the optimum. ε is then lowered by `ARA_WEIGHT_DECREMENT` and the search is repaired 
+        rather than restarted: nodes whose g improved after they were expanded in the current pass 
+        are parked in an INCONS list and re-queued for the next pass, so earlier effort is reused.
+        
+        Passes continue until the proven bound reaches 1 (optimal). If the budget trips after at 
+        least one solution has been published, the best solution is returned as a SUCCESS together 
+        with its bound (`search_outcome.suboptimality_bound`); before that, the usual partial 
+        outcome is reported.
+        
+        Internal Variables:
+            heuristic_weight (float): The current inflation factor ε.
+            best_costs (array): The lowest g found so far for every node (inf if unseen).
+            parent_indices (array): The predecessor that produced each `best_costs` entry.
+            closed_flags (bytearray): Nodes expanded during the current pass.
+            inconsistent_nodes (Set[int]): Nodes improved after being closed in the current pass (INCONS).
+            _incumbent_index (int): The goal of the best solution found so far (-1 if none). Kept on the 
+                                    instance so that it survives a budget interruption mid-pass.
+            _incumbent_path (List[int]): That solution's route, snapshotted when it was found.
+        """
+        origin_index = self._resolve_origin_index()
+        if origin_index is None:
+            return None
+
+        node_count = self.graph.node_count
+        heuristic_weight = max(1.0, self.ARA_INITIAL_WEIGHT)
+        best_costs = array("d", [float("inf")]) * node_count
+        parent_indices = array("q", [-1]) * node_count
+        closed_flags = bytearray(node_count)
+        inconsistent_nodes = set()
+
+        if self._unproductive_flags is not None:
+            # ARA* gates generation on g rather than on a bitmap: no route can ever improve on -inf.
+            for node_index, unproductive in enumerate(self._unproductive_flags):
+                if unproductive:
+                    best_costs[node_index] = float("-inf")
+        best_costs[origin_index] = 0.0
+        open_priority_queue: List[SearchState] = [self._create_search_state(origin_index, -1, 0.0, "ara", heuristic_weight)]
+        self._incumbent_index = -1
+        self._incumbent_path: List[int] = []
+        self._record_progress(closed_flags, parent_indices)
+
+        try:
+            while True:
+                self._improve_anytime_path(
+                    open_priority_queue, heuristic_weight, best_costs, parent_indices, closed_flags, inconsistent_nodes
+                )
+                if self._incumbent_index == -1:
+                    return None
+
+                self._suboptimality_bound = self._anytime_suboptimality_bound(
+                    open_priority_queue, heuristic_weight, best_costs, closed_flags, inconsistent_nodes
+                )
+                if self._suboptimality_bound <= 1.0:
+                    break
+
+                # Tighten ε and repair: OPEN ∪ INCONS is re-keyed under the new weight, CLOSED is reset.
+                heuristic_weight = max(1.0, heuristic_weight - self.ARA_WEIGHT_DECREMENT)
+                open_priority_queue = self._rebuild_anytime_frontier(
+                    open_priority_queue, heuristic_weight, best_costs, parent_indices, closed_flags, inconsistent_nodes
+                )
+                closed_flags[:] = bytes(node_count)
+                inconsistent_nodes.clear()
+
+        except _SearchBudgetExhausted:
+            if self._incumbent_index == -1:
+                raise
+            # Interrupted mid-pass: the ε cap is not yet proven, but the ratio to the open lower bound is.
+            self._suboptimality_bound = self._anytime_suboptimality_bound(
+                open_priority_queue, float("inf"), best_costs, closed_flags, inconsistent_nodes
+            )
+
+        return self.graph.node_ids[self._incumbent_index], self.total_nodes_created, self._incumbent_path
+
+    def _improve_anytime_path(
+        self, 
+        open_priority_queue: List[SearchState], 
+        heuristic_weight: float, 
+        best_costs: array, 
+        parent_indices: array, 
+        closed_flags: bytearray, 
+        inconsistent_nodes: set
+    ) -> None:
+        """
+        One ARA* pass (the "ImprovePath" routine): expands nodes in inflated-f order until no 
+        open node can still lead to a cheaper solution than the incumbent, updating 
+        `_incumbent_index` / `_incumbent_path` whenever a cheaper route to a destination appears.
+        
+        Architectural Note:
+        The heap uses lazy deletion like `_execute_priority_search`: entries whose g is worse than 
+        the node's current best, or whose node was already expanded in this pass, are skipped.
+        """
+        while open_priority_queue:
+            if self.budget is not None:
+                self._enforce_budget(len(open_priority_queue))
+
+            current_state = open_priority_queue[0]
+            current_index = current_state.node_id
+
+            # Lazy Deletion: Discard superseded entries before they can influence the stop test.
+            if closed_flags[current_index] or current_state.g > best_costs[current_index]:
+                heapq.heappop(open_priority_queue)
+                if self.trace is not None:
+                    self.trace.prune(self.graph.node_ids[current_index], current_state.g, current_state.h, current_state.priority_score)
+                continue
+
+            # The origin itself may be a destination; every other goal is registered when generated.
+            if self._incumbent_index == -1 and self.problem.goal_flags[current_index]:
+                self._incumbent_index = current_index
+                self._incumbent_path = self._reconstruct_path(current_index, parent_indices)
+
+            if self._incumbent_index != -1 and best_costs[self._incumbent_index] <= current_state.priority_score:
+                break
+
+            heapq.heappop(open_priority_queue)
+            closed_flags[current_index] = 1
+            if self.trace is not None:
+                self.trace.expand(self.graph.node_ids[current_index], current_state.g, current_state.h, current_state.priority_score)
+
+            targets, weights, row_start, row_stop = self.graph.get_adjacency_slice(current_index)
+            for position in range(row_start, row_stop):
+                neighbor_index = targets[position]
+                new_cumulative_cost = current_state.g + weights[position]
+                if new_cumulative_cost >= best_costs[neighbor_index]:
+                    continue
+
+                # Created before the incumbent is updated, so a node budget that trips here never 
+                # leaves a published route through a node that was not counted.
+                new_state = None
+                if not closed_flags[neighbor_index]:
+                    new_state = self._create_search_state(neighbor_index, current_index, new_cumulative_cost, "ara", heuristic_weight)
+
+                best_costs[neighbor_index] = new_cumulative_cost
+                parent_indices[neighbor_index] = current_index
+
+                # best_costs is already updated, so an improved route to the incumbent itself 
+                # must be accepted explicitly rather than through the cost comparison.
+                if self.problem.goal_flags[neighbor_index] and (
+                    self._incumbent_index in (-1, neighbor_index) 
+                    or new_cumulative_cost < best_costs[self._incumbent_index]
+                ):
+                    self._incumbent_index = neighbor_index
+                    self._incumbent_path = self._reconstruct_path(neighbor_index, parent_indices)
+
+                if new_state is None:
+                    inconsistent_nodes.add(neighbor_index)
+                else:
+                    heapq.heappush(open_priority_queue, new_state)
+
+    def _anytime_suboptimality_bound(
+        self, 
+        open_priority_queue: List[SearchState], 
+        heuristic_weight: float, 
+        best_costs: array, 
+        closed_flags: bytearray, 
+        inconsistent_nodes: set
+    ) -> float:
+        """
+        Computes ARA*'s proven suboptimality bound: min(ε, g(goal) / min over OPEN ∪ INCONS of (g + h)).
+        Passing ε = inf yields the uncapped ratio, which is valid at any point of a pass.
+        
+        Returns:
+            float: The factor by which the incumbent may exceed the optimal cost (1.0 = proven optimal).
+        """
+        lower_bound = float("inf")
+        for open_state in open_priority_queue:
+            if not closed_flags[open_state.node_id] and open_state.g <= best_costs[open_state.node_id]:
+                lower_bound = min(lower_bound, open_state.g + open_state.h)
+        for node_index in inconsistent_nodes:
+            lower_bound = min(lower_bound, best_costs[node_index] + self.problem.heuristic_by_index(node_index))
+
+        incumbent_cost = best_costs[self._incumbent_index]
+        if lower_bound == float("inf") or incumbent_cost <= lower_bound:
+            return 1.0
+        if lower_bound <= 0.0:
+            return heuristic_weight
+        return min(heuristic_weight, incumbent_cost / lower_bound)
+
+    def _rebuild_anytime_frontier(
+        self, 
+        open_priority_queue: List[SearchState], 
+        heuristic_weight: float, 
+        best_costs: array, 
+        parent_indices: array, 
+        closed_flags: bytearray, 
+        inconsistent_nodes: set
+    ) -> List[SearchState]:
+        """
+        Moves INCONS into OPEN and re-keys every open node under the new ε.
+        
+        Returns:
+            List[SearchState]: A fresh heap holding one current entry per open node.
+        """
+        reopened_nodes = set(inconsistent_nodes)
+        for open_state in open_priority_queue:
+            if not closed_flags[open_state.node_id] and open_state.g <= best_costs[open_state.node_id]:
+                reopened_nodes.add(open_state.node_id)
+
+        rebuilt_queue = [
+            self._create_search_state(node_index, parent_indices[node_index], best_costs[node_index], "ara", heuristic_weight) 
+            for node_index in sorted(reopened_nodes)
+        ]
+        heapq.heapify(rebuilt_queue)
+        return rebuilt_queue
 
     # ---------------------------------------------------------------------------
     # Iterative Deepening A* (IDA*) Engine
@@ -275,21 +1012,49 @@ class SearchEngine:
         Internal Variables:
             initial_heuristic (float): The starting threshold, which is the h-value of the origin.
             current_threshold (float): The maximum allowed total cost (f = g + h) for the active iteration.
-            search_result (Any): The outcome of the recursive pass (either the Goal State, infinity, or a new threshold).
+            active_path (List[int]): The dense indices of the branch currently being explored.
+            on_path_flags (bytearray): A bitmap mirror of `active_path` for O(1) local cycle checks.
+            search_result (Any): The outcome of the recursive pass (either the goal index or a new threshold).
         """
-        initial_heuristic = self.graph.heuristic(self.graph.origin)
+        origin_index = self._resolve_origin_index()
+        if origin_index is None:
+            return None
+
+        initial_heuristic = self.problem.heuristic_by_index(origin_index)
         current_threshold = initial_heuristic
+        # Unproductive nodes are pre-marked as if on the path, so no branch ever enters them.
+        on_path_flags = self._new_node_flags()
 
         while True:
-            # Crucial Benchmark Requirement: Generate a fresh start state for EVERY deepening iteration. 
-            # This ensures total_nodes_created accurately reflects the overlapping multi-pass nature of IDA*.
-            start_state = self._create_search_state(self.graph.origin, None, 0.0, "cus2")
+            active_path: List[int] = [origin_index]
+            on_path_flags[origin_index] = 1
+
+            try:
+                # Crucial Benchmark Requirement: Generate a fresh start node for EVERY deepening iteration. 
+                # This ensures total_nodes_created accurately reflects the overlapping multi-pass nature of IDA*.
+                self._register_created_nodes(1)
+                if self.trace is not None:
+                    self.trace.iteration(current_threshold)
+                    self.trace.generate(self.graph.node_ids[origin_index], 0.0, initial_heuristic, initial_heuristic)
 
-            search_result = self._iterative_deepening_recursive(start_state, current_threshold, [self.graph.origin])
+                search_result = self._iterative_deepening_recursive(
+                    origin_index, 0.0, initial_heuristic, current_threshold, active_path, on_path_flags
+                )
+            except _SearchBudgetExhausted:
+                # The interrupted frames never popped their entries, so the active branch is intact. 
+                # IDA* keeps no global record, so that branch is the explored region it can report.
+                branch_parents = array("q", [-1]) * self.graph.node_count
+                for parent_index, child_index in zip(active_path, active_path[1:]):
+                    branch_parents[child_index] = parent_index
+                self._record_progress(on_path_flags, branch_parents)
+                raise
 
             # Success: The goal was physically reached within the current cost threshold.
-            if isinstance(search_result, SearchState):
-                return search_result.node_id, self.total_nodes_created, self._reconstruct_path(search_result)
+            # The active path was left in place and now spells out the route to it.
+            if isinstance(search_result, int):
+                return self.graph.node_ids[search_result], self.total_nodes_created, [self.graph.node_ids[index] for index in active_path]
+
+            on_path_flags[origin_index] = 0
 
             # Exhaustion: The entire reachable graph was traversed and the threshold never increased.
             if search_result == float("inf"):
@@ -300,9 +1065,12 @@ class SearchEngine:
 
     def _iterative_deepening_recursive(
         self, 
-        current_state: SearchState, 
+        current_index: int, 
+        cumulative_cost: float, 
+        heuristic_cost: float, 
         current_threshold: float, 
-        current_path_identifiers: List[int]
+        active_path: List[int], 
+        on_path_flags: bytearray
     ) -> Any:
         """
         The recursive depth-first traversal engine powering IDA*.
@@ -310,71 +1078,96 @@ class SearchEngine:
         Architectural Note:
         Unlike standard DFS, IDA* evaluates nodes based on their estimated total cost (g + h). 
         To maintain linear space complexity, cycle checking is localized strictly to the current active 
-        branch rather than using a global closed set.
+        branch rather than using a global closed set. The branch is tracked by an explicit index stack 
+        plus a bitmap, so the per-child cycle check is O(1) instead of a scan of the path list.
         
         Args:
-            current_state (SearchState): The specific node currently being evaluated in this recursive frame. 
-                                         It encapsulates the node ID, the path cost so far (g), the heuristic (h), 
-                                         and the parent pointer needed for backtracking if the goal is found.
+            current_index (int): The dense index of the node evaluated in this recursive frame.
+            
+            cumulative_cost (float): The path cost (g) from the origin down to `current_index`.
+            
+            heuristic_cost (float): The heuristic estimate (h) from `current_index` to the nearest goal.
             
             current_threshold (float): The strict upper bound for the f-cost (g + h) allowed in this specific 
-                                       IDA* iteration. If `current_state`'s f-cost exceeds this limit, 
+                                       IDA* iteration. If the current f-cost exceeds this limit, 
                                        the branch is aggressively pruned and the cost is bubbled up.
                                        
-            current_path_identifiers (List[int]): A chronological sequence of node IDs representing the active 
-                                                  branch from the origin down to the `current_state`. It is 
-                                                  utilized exclusively for local cycle detection, ensuring the 
-                                                  search does not traverse back up its own ancestral chain and 
-                                                  fall into an infinite loop.
+            active_path (List[int]): The dense indices of the active branch from the origin down to 
+                                     `current_index`. Left untouched on success so the caller can read the path.
+                                     
+            on_path_flags (bytearray): Marks every index currently on `active_path`, ensuring the search 
+                                       does not traverse back up its own ancestral chain.
         
         Returns:
-            SearchState: If the goal is successfully reached within the threshold, the goal state is returned.
+            int: If the goal is successfully reached within the threshold, the goal's dense index is returned.
             float: If the path is pruned, returns the minimum f-cost that exceeded the threshold, 
                    which is used to calculate the threshold limit for the next outer iteration.
                    
         Internal Variables:
             total_estimated_cost (float): The f-value (g + h) of the current node.
             minimum_exceeded_threshold (float): Tracks the smallest f-value among all pruned child branches.
-            child_states (List[SearchState]): All valid, non-cyclic adjacent states slated for recursive exploration.
+            child_nodes (List[Tuple[float, int, float, float]]): All valid, non-cyclic children slated for 
+                                                                 recursive exploration as (f, index, g, h).
         """
-        total_estimated_cost = current_state.g + current_state.h
+        if self.budget is not None:
+            self._enforce_budget(len(active_path))
+
+        total_estimated_cost = cumulative_cost + heuristic_cost
         
         # Pruning condition: The path has become too expensive for this iteration
         if total_estimated_cost > current_threshold:
+            if self.trace is not None:
+                self.trace.prune(self.graph.node_ids[current_index], cumulative_cost, heuristic_cost, total_estimated_cost)
             return total_estimated_cost
 
         # Goal condition: We have successfully reached a valid destination
-        if current_state.node_id in self.graph.destinations:
-            return current_state
+        if self._is_goal(current_index):
+            return current_index
+
+        if self.trace is not None:
+            self.trace.expand(self.graph.node_ids[current_index], cumulative_cost, heuristic_cost, total_estimated_cost)
 
         minimum_exceeded_threshold = float("inf")
-        neighbors = self.graph.get_neighbors(current_state.node_id)
+        targets, weights, row_start, row_stop = self.graph.get_adjacency_slice(current_index)
 
-        child_states: List[SearchState] = []
-        for neighbor_identifier, edge_weight in neighbors:
+        child_nodes: List[Tuple[float, int, float, float]] = []
+        for position in range(row_start, row_stop):
+            neighbor_index = targets[position]
             
             # Local Cycle Prevention: Ensures the current sequence doesn't loop back on itself, 
             # but allows other branches to visit the same node later if cheaper.
-            if neighbor_identifier not in current_path_identifiers:  
-                new_cumulative_cost = current_state.g + edge_weight
-                new_child_state = self._create_search_state(neighbor_identifier, current_state, new_cumulative_cost, "cus2")
-                child_states.append(new_child_state)
+            if not on_path_flags[neighbor_index]:
+                new_cumulative_cost = cumulative_cost + weights[position]
+                new_heuristic_cost = self.problem.heuristic_by_index(neighbor_index)
+                self._register_created_nodes(1)
+                child_nodes.append((new_cumulative_cost + new_heuristic_cost, neighbor_index, new_cumulative_cost, new_heuristic_cost))
+                if self.trace is not None:
+                    self.trace.generate(
+                        self.graph.node_ids[neighbor_index], new_cumulative_cost, new_heuristic_cost, 
+                        new_cumulative_cost + new_heuristic_cost
+                    )
 
         # Tie-Breaking Justification (IDA*): 
         # The assignment dictates expanding nodes with the lowest f-cost first.
         # If f-costs are tied, we break the tie using an ASCENDING Node ID.
-        child_states.sort(key=lambda state: (state.g + state.h, state.node_id))
+        child_nodes.sort(key=lambda child: (child[0], child[1]))
 
-        for child_state in child_states:
-            extended_path = current_path_identifiers + [child_state.node_id]
-            recursive_result = self._iterative_deepening_recursive(child_state, current_threshold, extended_path)
+        for _, child_index, child_cost, child_heuristic in child_nodes:
+            active_path.append(child_index)
+            on_path_flags[child_index] = 1
+            recursive_result = self._iterative_deepening_recursive(
+                child_index, child_cost, child_heuristic, current_threshold, active_path, on_path_flags
+            )
             
-            # Bubble up the successful SearchState immediately to stop further traversal
-            if isinstance(recursive_result, SearchState):
+            # Bubble up the goal index immediately to stop further traversal
+            if isinstance(recursive_result, int):
                 return recursive_result
+
+            on_path_flags[child_index] = 0
+            active_path.pop()
                 
             # Track the lowest cost that crossed the threshold line
             if recursive_result < minimum_exceeded_threshold:
                 minimum_exceeded_threshold = recursive_result
 
-        return minimum_exceeded_threshold
\ No newline at end of file
+        return minimum_exceeded_threshold
@@ -0,0 +1,298 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+import math
+import struct
+import sys
+import time
+from collections import Counter
+from typing import BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+
+# ---------------------------------------------------------------------------
+# Data Transfer Objects (DTOs)
+# ---------------------------------------------------------------------------
+class TraceRecord(NamedTuple):
+    """
+    One decoded trace event.
+
+    Attributes:
+        event (str): 'generate', 'expand', 'prune' or 'iteration' (an IDA* pass starting).
+        node_id (int): The external node ID (-1 for 'iteration').
+        g (float): The path cost of the state (NaN where the method does not track it: DFS, BFS).
+        h (float): Its heuristic estimate (NaN where not computed).
+        f (float): The key the method orders by (g for CUS1, g + h for AS, ...); the threshold for 'iteration'.
+        timestamp_ns (int): `time.perf_counter_ns()` when the event was recorded.
+    """
+    event: str
+    node_id: int
+    g: float
+    h: float
+    f: float
+    timestamp_ns: int
+
+
+class TraceSummary(NamedTuple):
+    """
+    The replay analysis of one trace.
+
+    Attributes:
+        event_counts (Dict[str, int]): The number of records per event type.
+        expanded_node_count (int): The number of distinct nodes expanded at least once.
+        reexpansion_ratio (float): Expansions per distinct expanded node (1.0 = nothing expanded twice).
+        revisit_histogram (Dict[int, int]): Maps an expansion count > 1 to the number of nodes expanded that often.
+        hotspots (List[Tuple[int, int]]): The most expanded nodes as (node ID, expansions), most first.
+        iteration_expansions (List[int]): The expansions of every IDA* pass, in order (empty for other methods).
+        iteration_overhead (float): IDA*'s total expansions divided by those of its last pass (1.0 otherwise).
+        duration_ns (int): The time between the first and the last record.
+    """
+    event_counts: Dict[str, int]
+    expanded_node_count: int
+    reexpansion_ratio: float
+    revisit_histogram: Dict[int, int]
+    hotspots: List[Tuple[int, int]]
+    iteration_expansions: List[int]
+    iteration_overhead: float
+    duration_ns: int
+
+
+# ---------------------------------------------------------------------------
+# Binary Expansion Trace Recorder
+# ---------------------------------------------------------------------------
+class ExpansionTrace:
+    """
+    Records every generate, expand and prune event of a search as fixed-width binary records.
+
+    Architectural Note:
+    A traced search may emit millions of events, so they are never held as Python objects: each
+    one is packed with a precompiled `struct` into 48 bytes (event code, node ID, g, h, f and a
+    nanosecond timestamp) straight into a preallocated bytearray. Two sinks share that layout:
+    - Ring buffer (no `path`): the last `capacity` events are kept in memory, older ones are
+      overwritten, so a trace can stay enabled on long runs with a bounded footprint.
+    - File (`path` given): the buffer is a staging area flushed to disk whenever it fills, so
+      the file holds every event.
+    Files start with `FILE_MAGIC`; `read_trace` decodes both a file and a saved ring buffer.
+
+    Pass a trace to `SearchEngine(..., trace=...)`. Without one the engine pays a single
+    `is not None` test per event site, like the budget check.
+
+    Attributes:
+        capacity (int): The number of records the buffer holds.
+        path (Optional[str]): The output file, or None for ring-buffer mode.
+        recorded_count (int): Every event recorded so far (including overwritten ones).
+        RECORD_FORMAT (struct.Struct): The little-endian record layout.
+        FILE_MAGIC (bytes): The header identifying a trace file.
+        EVENT_NAMES (Tuple[str, ...]): The event name of every event code.
+    """
+
+    RECORD_FORMAT = struct.Struct("<B7xqdddq")
+    FILE_MAGIC: bytes = b"PFTRACE1"
+    EVENT_NAMES: Tuple[str, ...] = ("generate", "expand", "prune", "iteration")
+
+    def __init__(self, capacity: int = 1 << 16, path: Optional[str] = None) -> None:
+        """
+        Args:
+            capacity (int): The ring size, or the staging size in file mode, in records.
+            path (Optional[str]): Stream every record to this file instead of keeping a ring.
+
+        Raises:
+            ValueError: If the capacity is not positive.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.capacity = capacity
+        self.path = path
+        self.recorded_count = 0
+        self._buffer = bytearray(capacity * self.RECORD_FORMAT.size)
+        self._buffered_count = 0
+        self._pack_into = self.RECORD_FORMAT.pack_into
+        self._file_stream: Optional[BinaryIO] = None
+        if path is not None:
+            self._file_stream = open(path, "wb")
+            self._file_stream.write(self.FILE_MAGIC)
+
+    # ---------------------------------------------------------------------------
+    # Recording (called by the engine)
+    # ---------------------------------------------------------------------------
+    def generate(self, node_id: int, g: float = math.nan, h: float = math.nan, f: float = math.nan) -> None:
+        """Records a node being generated (added to the frontier)."""
+        self._append(0, node_id, g, h, f)
+
+    def expand(self, node_id: int, g: float = math.nan, h: float = math.nan, f: float = math.nan) -> None:
+        """Records a node being expanded (its successors generated)."""
+        self._append(1, node_id, g, h, f)
+
+    def prune(self, node_id: int, g: float = math.nan, h: float = math.nan, f: float = math.nan) -> None:
+        """Records a generated state being discarded (already closed, superseded, or over the IDA* threshold)."""
+        self._append(2, node_id, g, h, f)
+
+    def iteration(self, threshold: float) -> None:
+        """Records the start of an IDA* pass with its f-cost threshold."""
+        self._append(3, -1, math.nan, math.nan, threshold)
+
+    def _append(self, event_code: int, node_id: int, g: float, h: float, f: float) -> None:
+        """Packs one record into the next buffer slot, flushing (file) or wrapping around (ring) when full."""
+        if self._buffered_count == self.capacity:
+            if self._file_stream is not None:
+                self._file_stream.write(self._buffer)
+            self._buffered_count = 0
+        self._pack_into(
+            self._buffer, self._buffered_count * self.RECORD_FORMAT.size,
+            event_code, node_id, g, h, f, time.perf_counter_ns()
+        )
+        self._buffered_count += 1
+        self.recorded_count += 1
+
+    # ---------------------------------------------------------------------------
+    # Output
+    # ---------------------------------------------------------------------------
+    @property
+    def dropped_count(self) -> int:
+        """The number of events the ring buffer has overwritten (always 0 in file mode)."""
+        return 0 if self.path is not None else max(0, self.recorded_count - self.capacity)
+
+    def _ring_bytes(self) -> bytes:
+        """The retained ring records in chronological order."""
+        split_offset = self._buffered_count * self.RECORD_FORMAT.size
+        if self.recorded_count <= self.capacity:
+            return bytes(self._buffer[:split_offset])
+        return bytes(self._buffer[split_offset:] + self._buffer[:split_offset])
+
+    def records(self) -> Iterator[TraceRecord]:
+        """
+        Decodes the retained ring records, oldest first.
+
+        Raises:
+            ValueError: In file mode; read the file with `read_trace` instead.
+        """
+        if self.path is not None:
+            raise ValueError("A file trace is read back with read_trace(path).")
+        return _decode_records(self._ring_bytes())
+
+    def save(self, path: str) -> None:
+        """Writes the retained ring records to a trace file readable by `read_trace`."""
+        with open(path, "wb") as file_stream:
+            file_stream.write(self.FILE_MAGIC)
+            file_stream.write(self._ring_bytes())
+
+    def close(self) -> None:
+        """Flushes the staged records and closes the file (no-op in ring-buffer mode)."""
+        if self._file_stream is not None:
+            self._file_stream.write(self._buffer[:self._buffered_count * self.RECORD_FORMAT.size])
+            self._file_stream.close()
+            self._file_stream = None
+            self._buffered_count = 0
+
+    def __enter__(self) -> "ExpansionTrace":
+        return self
+
+    def __exit__(self, *exception_details) -> None:
+        self.close()
+
+
+# ---------------------------------------------------------------------------
+# Replay & Analysis
+# ---------------------------------------------------------------------------
+def _decode_records(record_bytes: bytes) -> Iterator[TraceRecord]:
+    """Unpacks a run of whole records."""
+    event_names = ExpansionTrace.EVENT_NAMES
+    for event_code, node_id, g, h, f, timestamp_ns in ExpansionTrace.RECORD_FORMAT.iter_unpack(record_bytes):
+        yield TraceRecord(event_names[event_code], node_id, g, h, f, timestamp_ns)
+
+
+def read_trace(path: str, chunk_records: int = 1 << 16) -> Iterator[TraceRecord]:
+    """
+    Streams the records of a trace file in chunks, so traces larger than memory can be replayed.
+
+    Raises:
+        ValueError: If the file is not a trace file or ends in a partial record.
+    """
+    record_size = ExpansionTrace.RECORD_FORMAT.size
+    with open(path, "rb") as file_stream:
+        if file_stream.read(len(ExpansionTrace.FILE_MAGIC)) != ExpansionTrace.FILE_MAGIC:
+            raise ValueError(f"{path} is not an expansion trace.")
+        while True:
+            chunk = file_stream.read(chunk_records * record_size)
+            if not chunk:
+                return
+            if len(chunk) % record_size:
+                raise ValueError(f"{path} ends in a truncated record.")
+            yield from _decode_records(chunk)
+
+
+def summarize_trace(records: Iterable[TraceRecord], hotspot_count: int = 10) -> TraceSummary:
+    """
+    Replays a trace into hotspot, revisit and re-expansion statistics.
+
+    Args:
+        records (Iterable[TraceRecord]): The events, in recording order.
+        hotspot_count (int): How many of the most expanded nodes to report.
+
+    Returns:
+        TraceSummary: The analysis.
+    """
+    event_counts: Counter = Counter()
+    expansion_counts: Counter = Counter()
+    iteration_expansions: List[int] = []
+    first_timestamp = last_timestamp = 0
+
+    for trace_record in records:
+        if not event_counts:
+            first_timestamp = trace_record.timestamp_ns
+        last_timestamp = trace_record.timestamp_ns
+        event_counts[trace_record.event] += 1
+        if trace_record.event == "expand":
+            expansion_counts[trace_record.node_id] += 1
+            if iteration_expansions:
+                iteration_expansions[-1] += 1
+        elif trace_record.event == "iteration":
+            iteration_expansions.append(0)
+
+    expansion_total = event_counts["expand"]
+    revisit_histogram = Counter(count for count in expansion_counts.values() if count > 1)
+    last_iteration = iteration_expansions[-1] if iteration_expansions else 0
+    return TraceSummary(
+        event_counts=dict(event_counts),
+        expanded_node_count=len(expansion_counts),
+        reexpansion_ratio=expansion_total / len(expansion_counts) if expansion_counts else 1.0,
+        revisit_histogram=dict(sorted(revisit_histogram.items())),
+        hotspots=expansion_counts.most_common(hotspot_count),
+        iteration_expansions=iteration_expansions,
+        iteration_overhead=expansion_total / last_iteration if last_iteration else 1.0,
+        duration_ns=last_timestamp - first_timestamp,
+    )
+
+
+def format_summary(trace_summary: TraceSummary) -> List[str]:
+    """Renders a summary as report lines for the terminal."""
+    report_lines = [
+        "Events: " + ", ".join(f"{event} {count}" for event, count in trace_summary.event_counts.items()),
+        f"Duration: {trace_summary.duration_ns / 1e6:.3f} ms",
+        f"Distinct nodes expanded: {trace_summary.expanded_node_count} "
+        f"(re-expansion ratio {trace_summary.reexpansion_ratio:.2f})",
+    ]
+    if trace_summary.revisit_histogram:
+        report_lines.append("Revisits (expansions: nodes): " + ", ".join(
+            f"{expansion_count}: {node_count}" for expansion_count, node_count in trace_summary.revisit_histogram.items()
+        ))
+    if trace_summary.iteration_expansions:
+        report_lines.append(
+            f"IDA* passes: {len(trace_summary.iteration_expansions)} "
+            f"(total / last-pass expansions {trace_summary.iteration_overhead:.2f})"
+        )
+    report_lines.append("Hotspots (node: expansions): " + ", ".join(
+        f"{node_id}: {expansion_count}" for node_id, expansion_count in trace_summary.hotspots
+    ))
+    return report_lines
+
+
+# ---------------------------------------------------------------------------
+# Application Entry Point
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    # Usage: python expansion_trace.py <trace file> [hotspot count]
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python expansion_trace.py <trace file> [hotspot count]")
+        sys.exit(1)
+    summary = summarize_trace(read_trace(sys.argv[1]), int(sys.argv[2]) if len(sys.argv) == 3 else 10)
+    print("\n".join(format_summary(summary)))
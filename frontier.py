@@ -0,0 +1,280 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+from __future__ import annotations
+
+import struct
+from heapq import heapify, heappop, heappush
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, List, Tuple
+    from models import SearchState
+
+
+# The relative tolerance under which `SearchState.__lt__` treats two priorities as tied.
+PRIORITY_TIE_TOLERANCE: float = 1e-9
+
+_pack_double = struct.Struct("<d").pack
+
+
+def _ordered_bits(priority: float) -> int:
+    """
+    Reinterprets a non-negative double as an unsigned integer. IEEE-754 orders non-negative doubles
+    exactly like their bit patterns, so radix arithmetic on these integers respects float order.
+    """
+    return int.from_bytes(_pack_double(priority + 0.0), "little")
+
+
+# ---------------------------------------------------------------------------
+# Binary Heap Frontier (Default)
+# ---------------------------------------------------------------------------
+class BinaryHeapFrontier:
+    """
+    The classic `heapq` frontier of SearchState objects, ordered by `SearchState.__lt__`.
+
+    Architectural Note:
+    This is the reference behaviour and the engine's default. It accepts any priorities (GBFS and
+    ARA* keys are not monotone), at the price of a Python-level `__lt__` call per comparison.
+
+    Attributes:
+        entries (List[SearchState]): The heap-ordered states.
+    """
+
+    def __init__(self) -> None:
+        self.entries: List[SearchState] = []
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def push(self, search_state: SearchState) -> None:
+        heappush(self.entries, search_state)
+
+    def pop(self) -> SearchState:
+        return heappop(self.entries)
+
+
+# ---------------------------------------------------------------------------
+# Dial Bucket Frontier (Integer Priorities)
+# ---------------------------------------------------------------------------
+class DialBucketFrontier:
+    """
+    Dial's bucket queue for monotone, integer-valued priorities (e.g. CUS1 on integer edge weights).
+
+    Architectural Note:
+    Every integer priority owns a bucket, and the pointer to the current bucket only moves forward,
+    so a push is O(1) and the pointer's total travel is bounded by the largest priority. Inside a
+    bucket, states are kept in a heap of (node index, timestamp, state) tuples: all of them share
+    the same priority, so this reproduces the node-ID then chronological tie-break of
+    `SearchState.__lt__` with C-level tuple comparisons.
+
+    Attributes:
+        current_priority (int): The bucket currently being drained.
+
+    Raises:
+        ValueError: (from `push`) for a fractional priority, or one below `current_priority`.
+    """
+
+    def __init__(self) -> None:
+        self.current_priority = 0
+        self._buckets: Dict[int, List[Tuple[int, int, SearchState]]] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, search_state: SearchState) -> None:
+        priority = search_state.priority_score
+        bucket_priority = int(priority)
+        if bucket_priority != priority:
+            raise ValueError(f"Dial buckets require integer priorities, got {priority}.")
+        if bucket_priority < self.current_priority:
+            raise ValueError(f"Priority {priority} is below the current bucket {self.current_priority}; keys must be monotone.")
+
+        bucket = self._buckets.get(bucket_priority)
+        if bucket is None:
+            bucket = self._buckets[bucket_priority] = []
+        heappush(bucket, (search_state.node_id, search_state.timestamp, search_state))
+        self._size += 1
+
+    def pop(self) -> SearchState:
+        bucket = self._buckets.get(self.current_priority)
+        while not bucket:
+            if bucket is not None:
+                del self._buckets[self.current_priority]
+            self.current_priority += 1
+            bucket = self._buckets.get(self.current_priority)
+        self._size -= 1
+        return heappop(bucket)[2]
+
+
+# ---------------------------------------------------------------------------
+# Radix Heap Frontier (Non-Negative Float Priorities)
+# ---------------------------------------------------------------------------
+class RadixHeapFrontier:
+    """
+    A radix heap for monotone, non-negative float priorities (CUS1, and A* with a consistent heuristic).
+
+    Architectural Note:
+    Priorities are compared through their IEEE-754 bit patterns. Outside the active batch, a state
+    lives in bucket `(bits(priority) XOR bits(reference)).bit_length()`, where `reference` is a
+    lower bound of everything still bucketed; a higher bucket only ever holds higher priorities, so
+    no two bucketed states are ever compared. When the active batch runs dry, the lowest non-empty
+    bucket is taken: if it holds more than `BATCH_SIZE` states it is first redistributed around its
+    own minimum (every state moves to a strictly lower bucket, so each state moves at most 64
+    times), otherwise it becomes the new active batch as a whole.
+
+    The active batch is a binary heap of (priority, node index, timestamp, bits, state) tuples, so its
+    comparisons run in C instead of calling `SearchState.__lt__`. Every pushed state whose priority
+    does not exceed (or ties with) the batch's largest priority joins the batch directly; this also
+    keeps the frontier exact when rounding of g + h (or an inconsistent heuristic) produces a
+    priority below one already popped. Exact ties are ordered by the tuples themselves. A small heap of the batch's
+    distinct priorities shows whether a different priority ties with the minimum under the tolerance
+    of `SearchState.__lt__`; only then is every tied state considered, and the one with the smallest
+    node index, then timestamp, wins. A refill also pulls any bucketed state that ties with the new
+    batch's largest priority into the batch, so near-ties are never split across a bucket boundary.
+
+    Attributes:
+        BATCH_SIZE (int): The largest bucket that is heapified as a whole rather than redistributed.
+        active_limit (float): The largest priority in the active batch.
+    """
+
+    BATCH_SIZE: int = 1024
+
+    def __init__(self) -> None:
+        self.active_limit = -1.0
+        self._reference_bits = 0
+        self._active_batch: List[Tuple[float, int, int, int, SearchState]] = []
+        self._batch_priorities: List[float] = []
+        self._batch_priority_counts: Dict[float, int] = {}
+        self._buckets: List[List[Tuple[float, int, int, int, SearchState]]] = [[] for _ in range(65)]
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, search_state: SearchState) -> None:
+        priority = search_state.priority_score
+        self._size += 1
+        if priority - self.active_limit <= PRIORITY_TIE_TOLERANCE * priority:
+            # A near-tie of the batch's largest priority must be compared with it, so it joins too.
+            if priority > self.active_limit:
+                self.active_limit = priority
+            heappush(self._active_batch, (priority, search_state.node_id, search_state.timestamp, 0, search_state))
+            batch_priority_counts = self._batch_priority_counts
+            priority_count = batch_priority_counts.get(priority, 0)
+            if not priority_count:
+                heappush(self._batch_priorities, priority)
+            batch_priority_counts[priority] = priority_count + 1
+        else:
+            # The bit pattern is kept in the entry, so redistribution never has to recompute it.
+            priority_bits = _ordered_bits(priority)
+            self._buckets[(priority_bits ^ self._reference_bits).bit_length()].append(
+                (priority, search_state.node_id, search_state.timestamp, priority_bits, search_state)
+            )
+
+    def pop(self) -> SearchState:
+        if not self._active_batch:
+            self._refill()
+        active_batch = self._active_batch
+        batch_priorities = self._batch_priorities
+        self._size -= 1
+
+        # Exact ties are already ordered by node index, then timestamp, inside the batch tuples; only
+        # a distinct priority within the tie tolerance of the minimum needs the slow path below.
+        minimum_priority = batch_priorities[0]
+        distinct_count = len(batch_priorities)
+        if distinct_count > 2:
+            next_priority = batch_priorities[1] if batch_priorities[1] < batch_priorities[2] else batch_priorities[2]
+        else:
+            next_priority = batch_priorities[1] if distinct_count == 2 else minimum_priority
+        if next_priority - minimum_priority > PRIORITY_TIE_TOLERANCE * next_priority or distinct_count == 1:
+            winning_entry = heappop(active_batch)
+        else:
+            # Near-ties: the smallest node index (then timestamp) among the tied priorities wins.
+            tied_entries = [heappop(active_batch)]
+            while active_batch and active_batch[0][0] - minimum_priority <= PRIORITY_TIE_TOLERANCE * active_batch[0][0]:
+                tied_entries.append(heappop(active_batch))
+            winning_entry = min(tied_entries, key=lambda tied_entry: (tied_entry[1], tied_entry[2]))
+            for tied_entry in tied_entries:
+                if tied_entry is not winning_entry:
+                    heappush(active_batch, tied_entry)
+
+        # Counts one batch entry with the winning priority less, dropping the priority at zero.
+        winning_priority = winning_entry[0]
+        batch_priority_counts = self._batch_priority_counts
+        priority_count = batch_priority_counts[winning_priority] - 1
+        if priority_count:
+            batch_priority_counts[winning_priority] = priority_count
+        else:
+            del batch_priority_counts[winning_priority]
+            if winning_priority == minimum_priority:
+                heappop(batch_priorities)
+            else:
+                batch_priorities.remove(winning_priority)
+                heapify(batch_priorities)
+        return winning_entry[4]
+
+    def _refill(self) -> None:
+        """
+        Makes the lowest bucket the active batch, redistributing it first while it is larger than
+        `BATCH_SIZE`. Must only be called on a non-empty frontier with an empty active batch.
+        """
+        buckets = self._buckets
+        while True:
+            bucket_number = 0
+            while not buckets[bucket_number]:
+                bucket_number += 1
+            bucket_entries = buckets[bucket_number]
+            buckets[bucket_number] = []
+
+            reference_bits = self._reference_bits = min(bucket_entries)[3]
+            if len(bucket_entries) <= self.BATCH_SIZE or bucket_number == 0:
+                break
+
+            for bucket_entry in bucket_entries:
+                buckets[(bucket_entry[3] ^ reference_bits).bit_length()].append(bucket_entry)
+
+        # Entries that tie with the batch's largest priority under the tolerance join the batch, so
+        # near-ties are never split across a bucket boundary. Bucket i only holds bit patterns of at
+        # least its lower bound, so the scan stops at the first bucket that starts above the tie range.
+        active_limit = max(bucket_entries)[0]
+        while True:
+            limit_bits = _ordered_bits(active_limit / (1.0 - PRIORITY_TIE_TOLERANCE))
+            raised_limit = active_limit
+            for bucket_number in range(1, 65):
+                if (reference_bits >> bucket_number << bucket_number) | (1 << (bucket_number - 1)) > limit_bits:
+                    break
+                if not buckets[bucket_number]:
+                    continue
+                remaining_entries = []
+                for bucket_entry in buckets[bucket_number]:
+                    if bucket_entry[0] - active_limit <= PRIORITY_TIE_TOLERANCE * bucket_entry[0]:
+                        bucket_entries.append(bucket_entry)
+                        if bucket_entry[0] > raised_limit:
+                            raised_limit = bucket_entry[0]
+                    else:
+                        remaining_entries.append(bucket_entry)
+                buckets[bucket_number] = remaining_entries
+            if raised_limit == active_limit:
+                break
+            active_limit = raised_limit
+
+        heapify(bucket_entries)
+        self._active_batch = bucket_entries
+        batch_priority_counts = self._batch_priority_counts = {}
+        for bucket_entry in bucket_entries:
+            batch_priority_counts[bucket_entry[0]] = batch_priority_counts.get(bucket_entry[0], 0) + 1
+        self._batch_priorities = list(batch_priority_counts)
+        heapify(self._batch_priorities)
+        self.active_limit = active_limit
+
+
+# ---------------------------------------------------------------------------
+# Frontier Registry
+# ---------------------------------------------------------------------------
+FRONTIER_TYPES: Dict[str, type] = {
+    "heap": BinaryHeapFrontier,
+    "dial": DialBucketFrontier,
+    "radix": RadixHeapFrontier,
+}
@@ -1,8 +1,17 @@
 # ---------------------------------------------------------------------------
 # Imports & Dependencies
 # ---------------------------------------------------------------------------
+from __future__ import annotations
+
 import math
-from typing import Dict, List, Tuple, Optional
+from array import array
+from bisect import bisect_left
+from problem import SearchProblem
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, FrozenSet, List, Tuple, Optional
+    from reachability import ReachabilityIndex
 
 
 # ---------------------------------------------------------------------------
@@ -13,7 +22,8 @@ class Graph:
     Represents the mathematical state space for the Route Finding Problem.
     
     This architecture manages the mapping of spatial node coordinates, the weighted 
-    directional edges connecting them, and the specific routing objectives (origin to destinations).
+    directional edges connecting them, and the routing objectives defined by the file (origin to 
+    destinations), which are wrapped in a `SearchProblem` so that other queries can share the topology.
     
     Attributes:
         node_coordinates (Dict[int, Tuple[float, float]]): A strict mapping of node IDs to their (X, Y) 
@@ -23,7 +33,25 @@ class Graph:
                                                       inner dictionary of target neighbors and edge weights.
         origin (Optional[int]): The defined starting node ID for the traversal.
         destinations (List[int]): A collection of acceptable target node IDs. The agent must dynamically 
-                                  seek the most optimal path to ANY of these valid goals.
+                                  seek the most optimal path to ANY of these valid goals. Kept in file 
+                                  order (without duplicates) purely for output and reporting.
+        default_problem (Optional[SearchProblem]): The query defined by `origin` and `destinations`. 
+                                                   Engines build their own problem per query, so 
+                                                   other queries never touch these fields.
+        destination_set (FrozenSet[int]): A hashed view of `destinations` for O(1) ID membership tests.
+        goal_flags (bytearray): The goal bitmap of `default_problem`; `goal_flags[i]` is 1 when dense 
+                                index `i` is a destination.
+        node_ids (List[int]): Every known node ID in strictly ascending order. The position of an ID in 
+                              this list is its dense row index inside the compressed adjacency arrays.
+        node_index (Dict[int, int]): The inverse of `node_ids`, mapping an external node ID to its dense index.
+        adjacency_offsets (array): Compressed Sparse Row (CSR) offsets. The outbound edges of the node at 
+                                   dense index `i` occupy positions `offsets[i]` to `offsets[i + 1]` of the 
+                                   target and weight arrays.
+        adjacency_targets (array): The dense index of every edge target, sorted ascending within each row.
+        adjacency_weights (array): The edge weight aligned position-for-position with `adjacency_targets`.
+        coordinate_x, coordinate_y (array): The node coordinates aligned with the dense indices (NaN if unknown).
+        reachability_index (Optional[ReachabilityIndex]): The SCC index searches consult, once built with 
+                                                          `build_reachability_index` (None by default).
     """
 
     # ---------------------------------------------------------------------------
@@ -35,6 +63,17 @@ class Graph:
         self.adjacency_list: Dict[int, Dict[int, float]] = {}
         self.origin: Optional[int] = None
         self.destinations: List[int] = []
+        self.node_ids: List[int] = []
+        self.node_index: Dict[int, int] = {}
+        self.adjacency_offsets: array = array("q", [0])
+        self.adjacency_targets: array = array("q")
+        self.adjacency_weights: array = array("d")
+        self.coordinate_x: array = array("d")
+        self.coordinate_y: array = array("d")
+        self.destination_set: FrozenSet[int] = frozenset()
+        self.goal_flags: bytearray = bytearray()
+        self.default_problem: Optional[SearchProblem] = None
+        self.reachability_index: Optional[ReachabilityIndex] = None
 
     def load_from_file(self, filepath: str) -> None:
         """
@@ -46,20 +85,39 @@ class Graph:
             
         Raises:
             FileNotFoundError: If the operating system cannot locate the target file.
+            ValueError: If a destination refers to a node without coordinates (see `build_index`).
             
         Internal Variables:
             file_stream (TextIO): The active read buffer.
-            sanitized_lines (List[str]): The payload with all leading/trailing whitespace and blank lines stripped.
-            current_section (Optional[str]): A state-tracker indicating which block of the file is actively being parsed.
-            parts (List[str]): Temporary array holding split string tokens during line evaluation.
         """
         try:
             with open(filepath, "r", encoding="utf-8") as file_stream:
-                # Strip whitespace and ignore completely blank lines to ensure robust parsing
-                sanitized_lines = [line.strip() for line in file_stream if line.strip()]
+                configuration_text = file_stream.read()
         except FileNotFoundError:
             raise
 
+        self.load_from_string(configuration_text)
+
+    def load_from_string(self, configuration_text: str) -> None:
+        """
+        Parses the contents of a configuration file that has already been read (and decoded with 
+        universal newlines), then builds the index. `load_from_file` delegates here; the graph 
+        cache uses it to parse exactly the bytes it hashed.
+        
+        Args:
+            configuration_text (str): The full text of the configuration file.
+            
+        Raises:
+            ValueError: If a destination refers to a node without coordinates (see `build_index`).
+            
+        Internal Variables:
+            sanitized_lines (List[str]): The payload with all leading/trailing whitespace and blank lines stripped.
+            current_section (Optional[str]): A state-tracker indicating which block of the file is actively being parsed.
+            parts (List[str]): Temporary array holding split string tokens during line evaluation.
+        """
+        # Strip whitespace and ignore completely blank lines to ensure robust parsing
+        sanitized_lines = [line.strip() for line in configuration_text.split("\n") if line.strip()]
+
         current_section: Optional[str] = None
         
         for line in sanitized_lines:
@@ -97,7 +155,174 @@ class Graph:
                 
             elif current_section == "Destinations":
                 # Expected Schema: "5; 4"
-                self.destinations = [int(destination_id) for destination_id in line.split(";")]
+                # Large destination sets may be wrapped over several lines (optionally with a trailing ";"), 
+                # so every line extends the collection. Duplicates are dropped, keeping the first occurrence.
+                for destination_token in line.split(";"):
+                    if destination_token.strip():
+                        self.destinations.append(int(destination_token))
+                self.destinations = list(dict.fromkeys(self.destinations))
+
+        self.build_index()
+
+    # ---------------------------------------------------------------------------
+    # Dense Index Remapping & Array Storage
+    # ---------------------------------------------------------------------------
+    def build_index(self) -> None:
+        """
+        Builds the integer-indexed, array-backed view of the graph that the search engines operate on.
+        
+        Architectural Note:
+        External node IDs are arbitrary integers, so every engine structure keyed by them 
+        (visited sets, parent maps) would otherwise need a hash table costing tens of bytes per 
+        entry. Remapping the IDs to dense indices 0..N-1 lets the engines use bytearray markers 
+        and flat typed arrays instead. IDs are assigned in ascending order, so comparing two 
+        indices is identical to comparing the IDs they stand for; every ascending-ID tie-break 
+        therefore survives the remap unchanged. External IDs are restored only on output.
+        
+        This is invoked automatically at the end of `load_from_file`, and must be re-run if the 
+        dictionaries, origin or destinations are mutated afterwards.
+        
+        Raises:
+            ValueError: If a destination refers to a node that has no coordinates.
+        """
+        # Dense indices may change, so a reachability index built earlier no longer applies.
+        self.reachability_index = None
+        self._remap_node_identifiers()
+        self._build_compressed_adjacency()
+        self._build_coordinate_arrays()
+        self._build_destination_index()
+
+    def _remap_node_identifiers(self) -> None:
+        """
+        Assigns every referenced node ID (coordinates, edges, origin, destinations) a dense index.
+        
+        Internal Variables:
+            known_identifiers (Set[int]): The union of every node ID mentioned anywhere in the file.
+        """
+        known_identifiers = set(self.node_coordinates)
+        known_identifiers.update(self.destinations)
+        for source_node, neighbors in self.adjacency_list.items():
+            known_identifiers.add(source_node)
+            known_identifiers.update(neighbors)
+        if self.origin is not None:
+            known_identifiers.add(self.origin)
+
+        self.node_ids = sorted(known_identifiers)
+        self.node_index = {node_identifier: index for index, node_identifier in enumerate(self.node_ids)}
+
+    def _build_compressed_adjacency(self) -> None:
+        """
+        Flattens the nested `adjacency_list` dictionaries into Compressed Sparse Row (CSR) arrays, 
+        with every row sorted by ascending target index.
+        
+        Internal Variables:
+            row_targets (List[Tuple[int, float]]): The sorted outbound edges of the row being flattened.
+        """
+        self.adjacency_offsets = array("q", [0])
+        self.adjacency_targets = array("q")
+        self.adjacency_weights = array("d")
+
+        for node_identifier in self.node_ids:
+            row_targets = sorted(self.adjacency_list.get(node_identifier, {}).items())
+            for target_node, edge_weight in row_targets:
+                self.adjacency_targets.append(self.node_index[target_node])
+                self.adjacency_weights.append(edge_weight)
+            self.adjacency_offsets.append(len(self.adjacency_targets))
+
+    def _build_coordinate_arrays(self) -> None:
+        """
+        Copies the node coordinates into two index-aligned float arrays. Nodes that only appear 
+        in the edge list have no coordinates and are marked with NaN.
+        """
+        self.coordinate_x = array("d", [math.nan]) * len(self.node_ids)
+        self.coordinate_y = array("d", [math.nan]) * len(self.node_ids)
+
+        for node_identifier, (x_coordinate, y_coordinate) in self.node_coordinates.items():
+            node_index = self.node_index[node_identifier]
+            self.coordinate_x[node_index] = x_coordinate
+            self.coordinate_y[node_index] = y_coordinate
+
+    def _build_destination_index(self) -> None:
+        """
+        Builds the query defined by the file's "Origin:" and "Destinations:" sections.
+        
+        Architectural Note:
+        The graph itself is query-independent topology; the origin and destinations are turned into 
+        a `SearchProblem`, which owns the goal bitmap and the heuristic. `destination_set` and 
+        `goal_flags` remain available on the graph as views of this default problem. Validating the 
+        destinations here means a destination without coordinates is reported once, at load time, 
+        rather than as a KeyError deep inside an informed search.
+        
+        Raises:
+            ValueError: If a destination has no entry in the "Nodes:" section.
+        """
+        self.default_problem = SearchProblem(self, self.origin, self.destinations)
+        self.destination_set = self.default_problem.destination_set
+        self.goal_flags = self.default_problem.goal_flags
+
+    def index_of(self, node_identifier: int) -> int:
+        """
+        Translates an external node ID into its dense index, building the index on first use 
+        for graphs that were assembled programmatically rather than loaded from a file.
+        
+        Architectural Note:
+        An unknown ID on an already indexed graph is a caller error, not a reason to rebuild: a 
+        rebuild costs O(V + E), would fail the lookup anyway, and drops an attached reachability 
+        index. Only a graph that was never indexed (`default_problem` still None) is built here.
+        
+        Args:
+            node_identifier (int): The external node ID.
+            
+        Returns:
+            int: The dense index of the node.
+            
+        Raises:
+            KeyError: If the ID is not part of the graph.
+        """
+        if self.default_problem is None:
+            self.build_index()
+        return self.node_index[node_identifier]
+
+    def build_reachability_index(self) -> ReachabilityIndex:
+        """
+        Builds the strongly connected component index of the topology and attaches it, so that every 
+        later `SearchEngine.solve` on this graph answers unreachable queries without searching and 
+        skips the nodes that cannot lead to a destination.
+        
+        Architectural Note:
+        Building the index costs about as much as one exhaustive search, so it pays off for graphs 
+        that answer many queries (services, batches), not for a single CLI run. It is therefore 
+        opt-in, and imported lazily to keep it off the CLI's startup path.
+        
+        Returns:
+            ReachabilityIndex: The attached index.
+        """
+        from reachability import ReachabilityIndex
+        self.reachability_index = ReachabilityIndex(self)
+        return self.reachability_index
+
+    @property
+    def node_count(self) -> int:
+        """The number of dense indices, i.e. the required length of any per-node engine array."""
+        return len(self.node_ids)
+
+    def get_adjacency_slice(self, node_index: int) -> Tuple[array, array, int, int]:
+        """
+        Exposes the CSR row of a node without copying it.
+        
+        Args:
+            node_index (int): The dense index of the node undergoing expansion.
+            
+        Returns:
+            Tuple[array, array, int, int]: The (targets, weights) arrays and the [start, stop) 
+                                           positions of the row. Targets are ascending dense indices.
+        """
+        return (
+            self.adjacency_targets,
+            self.adjacency_weights,
+            self.adjacency_offsets[node_index],
+            self.adjacency_offsets[node_index + 1],
+        )
 
     # ---------------------------------------------------------------------------
     # Traversal & Heuristic Computations
@@ -128,60 +353,131 @@ class Graph:
 
     def heuristic(self, node_identifier: int) -> float:
         """
-        Calculates the estimated cost (h-value) from the current node to the nearest destination.
-        
-        Architectural Note:
-        This utilizes the Euclidean distance formula. For a 2D spatial grid, Euclidean distance 
-        represents the shortest possible physical path ("as the crow flies"). Because a real path 
-        cannot be shorter than a straight line, this heuristic is mathematically guaranteed to be 
-        both Admissible (never overestimates cost) and Consistent (satisfies the triangle inequality). 
-        This is a strict requirement for ensuring A* Search yields perfectly optimal solutions.
+        Calculates the estimated cost (h-value) from an external node ID to the nearest destination.
         
         Args:
             node_identifier (int): The ID of the node currently being evaluated.
             
         Returns:
             float: The minimal straight-line distance to any defined destination.
-            
-        Internal Variables:
-            current_x, current_y (float): The specific spatial coordinates of the node under evaluation.
-            minimum_heuristic_distance (float): A tracker that continuously updates to hold the lowest 
-                                                calculated distance across all potential goals.
-            destination_x, destination_y (float): The coordinates of the target goal being compared against.
-            euclidean_distance (float): The actual geometric straight-line distance computed using Pythagorean theorem.
-        """
-        # Base case: If no destinations exist, the heuristic cost to finish is zero.
-        if not self.destinations:
-            return 0.0
-            
-        # Extract the specific 2D coordinates (X and Y) of the node currently being evaluated.
-        # current_x represents the horizontal position, current_y represents the vertical position.
-        current_x, current_y = self.node_coordinates[node_identifier]
+        """
+        return self.heuristic_by_index(self.index_of(node_identifier))
+
+    def heuristic_by_index(self, node_index: int) -> float:
+        """
+        Calculates the Euclidean estimate (h-value) from a dense index to the nearest destination of 
+        the file's own query (`default_problem`), building the index on first use for graphs that were 
+        assembled programmatically (as `index_of` does).
         
-        # Initialize the minimum distance to infinity. This acts as a baseline tracker 
-        # so that any calculated valid distance will successfully overwrite it on the first iteration.
-        minimum_heuristic_distance = float("inf")
+        Raises:
+            KeyError: If the node has no coordinates in the "Nodes:" section.
+        """
+        if self.default_problem is None:
+            self.build_index()
+        return self.default_problem.heuristic_by_index(node_index)
+
+
+# ---------------------------------------------------------------------------
+# Sorted Identifier Index
+# ---------------------------------------------------------------------------
+class SortedIdentifierIndex:
+    """
+    A read-only, dictionary-like view mapping external node IDs to dense indices by binary search
+    over the sorted ID array, so no per-node hash table has to be resident. Used by the graph 
+    variants whose node table lives outside the Python heap (on-disk tiles, shared memory).
+    """
+
+    def __init__(self, node_ids: array) -> None:
+        self.node_ids = node_ids
+
+    def get(self, node_identifier: int, default: Optional[int] = None) -> Optional[int]:
+        position = bisect_left(self.node_ids, node_identifier)
+        if position < len(self.node_ids) and self.node_ids[position] == node_identifier:
+            return position
+        return default
+
+    def __getitem__(self, node_identifier: int) -> int:
+        node_index = self.get(node_identifier)
+        if node_index is None:
+            raise KeyError(node_identifier)
+        return node_index
+
+    def __contains__(self, node_identifier: object) -> bool:
+        return isinstance(node_identifier, int) and self.get(node_identifier) is not None
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+
+# ---------------------------------------------------------------------------
+# Read-Only Graph Views
+# ---------------------------------------------------------------------------
+class ReadOnlyGraphView:
+    """
+    The engine-facing surface shared by the graph variants that keep only arrays, without the 
+    parser's dictionaries (`SharedGraph`, `TiledGraph`, `CompactGraph`).
+    
+    Architectural Note:
+    A subclass only provides the storage: `node_ids` (sorted), `coordinate_x`, `coordinate_y` and 
+    either the CSR arrays read by `get_adjacency_slice` or its own override of it. It then calls 
+    `_attach_default_query`. Everything else (ID lookups by binary search, neighbour listing, 
+    the file's default query and the heuristic accessors) lives here once, so the views answer 
+    exactly like `Graph`.
+    
+    Attributes:
+        origin (Optional[int]): The origin node ID.
+        destinations (List[int]): The destination node IDs.
+        destination_set (FrozenSet[int]): A hashed view of `destinations`.
+        node_index (SortedIdentifierIndex): The ID-to-index view over `node_ids`.
+        default_problem (SearchProblem): The file's own query.
+        goal_flags (bytearray): The goal bitmap of `default_problem`.
+        reachability_index (Optional[ReachabilityIndex]): See `Graph.build_reachability_index`.
+    """
+
+    # The convenience accessors are shared verbatim with Graph.
+    heuristic = Graph.heuristic
+    heuristic_by_index = Graph.heuristic_by_index
+    get_adjacency_slice = Graph.get_adjacency_slice
+    build_reachability_index = Graph.build_reachability_index
+
+    def _attach_default_query(self, origin: Optional[int], destinations: List[int]) -> None:
+        """
+        Builds the ID index and the default query once the subclass has set up its arrays.
         
-        # Iterate through all valid destination nodes to find the one physically closest 
-        # to our current node. (Required for multi-destination routing problems).
-        for destination_identifier in self.destinations:
+        Raises:
+            ValueError: If the origin is unknown, or a destination has no coordinates.
+        """
+        self.origin = origin
+        self.destinations = list(destinations)
+        self.destination_set = frozenset(self.destinations)
+        self.node_index = SortedIdentifierIndex(self.node_ids)
+        self.default_problem = SearchProblem(self, self.origin, self.destinations)
+        self.goal_flags = self.default_problem.goal_flags
+        self.reachability_index = None
 
-            # Extract the specific 2D coordinates (X and Y) of the target destination node.
-            destination_x, destination_y = self.node_coordinates[destination_identifier]
-            
-            # Calculate the straight-line (Euclidean) distance between the current node and the target destination.
-            # Formula: sqrt((x1 - x2)^2 + (y1 - y2)^2)
-            # This represents the absolute shortest possible physical path (as the crow flies) 
-            # between the two coordinates, fulfilling the heuristic's admissibility requirement.
-            euclidean_distance = math.sqrt(
-                (current_x - destination_x) ** 2 + 
-                (current_y - destination_y) ** 2
-            )
-            
-            # Update the tracker if the calculated distance to this specific destination 
-            # is smaller than the smallest distance found so far.
-            if euclidean_distance < minimum_heuristic_distance:
-                minimum_heuristic_distance = euclidean_distance
+    @property
+    def node_count(self) -> int:
+        """The number of dense indices, i.e. the required length of any per-node engine array."""
+        return len(self.node_ids)
 
-        # Return the shortest calculated distance to represent the 'h(n)' value for this node.        
-        return minimum_heuristic_distance
\ No newline at end of file
+    def index_of(self, node_identifier: int) -> int:
+        """
+        Translates an external node ID into its dense index.
+        
+        Raises:
+            KeyError: If the ID is not part of the graph.
+        """
+        return self.node_index[node_identifier]
+
+    def get_neighbors(self, node_identifier: int) -> List[Tuple[int, float]]:
+        """
+        Retrieves the outbound connections of a node ID, sorted by ascending target ID.
+        
+        Returns:
+            List[Tuple[int, float]]: (Target Node ID, Edge Cost) pairs; empty for unknown IDs.
+        """
+        node_index = self.node_index.get(node_identifier)
+        if node_index is None:
+            return []
+        targets, weights, row_start, row_stop = self.get_adjacency_slice(node_index)
+        return [(self.node_ids[targets[position]], weights[position]) for position in range(row_start, row_stop)]
@@ -0,0 +1,229 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+from __future__ import annotations
+
+import marshal
+import os
+import sys
+from array import array
+from graph import Graph
+
+# `hashlib` and `tempfile` are imported inside the methods that need them, keeping this module
+# cheap to import on the CLI's startup path (see tests/startup_benchmark.py).
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Dict, Optional
+
+
+# ---------------------------------------------------------------------------
+# On-Disk Graph Cache
+# ---------------------------------------------------------------------------
+class GraphCache:
+    """
+    Persists fully parsed and indexed Graphs on disk, keyed by the SHA-256 of the source file.
+
+    Architectural Note:
+    Parsing the text format dominates the run time of a single CLI query on large maps, while
+    loading a marshalled snapshot of the finished Graph (dictionaries, node order and the raw bytes
+    of the CSR and coordinate arrays) is roughly an order of magnitude cheaper. Entries are named
+    after the map's file name, a short hash of its absolute path, the source file's content hash
+    and the interpreter's bytecode tag (marshal's format is version-specific), so an edited map or
+    a different Python simply misses the cache. When an entry is written, the older entries of the
+    same map path and interpreter are deleted, so every interpreter keeps its own entry and
+    alternating runs under two Pythons do not evict each other. Entries in the earlier naming scheme
+    (without the path hash) can never be read again, so those of the same file name are deleted
+    too. The path hash keeps maps that share a file name in different directories (with a shared
+    `$PATHFINDER_CACHE_DIR`) from evicting each other.
+
+    Writes are atomic: the snapshot goes to a uniquely named temporary file in the cache directory
+    and is moved into place with `os.replace`. Concurrent processes may race to write the same
+    entry, but a reader only ever sees a complete file. An unreadable, truncated or mismatched
+    entry is treated as a miss, and a cache directory that cannot be written to only disables the
+    write; neither ever fails the query.
+
+    Attributes:
+        CACHE_DIRECTORY_NAME (str): The directory created next to each map when no location is configured.
+        CACHE_DIRECTORY_VARIABLE (str): The environment variable that overrides the cache location.
+        cache_directory (Optional[str]): The configured location (None = next to each map file).
+        cache_hits (int): Loads answered from the cache.
+        cache_misses (int): Loads that had to parse the source file.
+        PATH_HASH_LENGTH (int): The number of hexadecimal digits of the path hash in an entry name.
+    """
+
+    CACHE_DIRECTORY_NAME: str = ".graph_cache"
+    CACHE_DIRECTORY_VARIABLE: str = "PATHFINDER_CACHE_DIR"
+    CACHE_FORMAT_VERSION: int = 1
+    CACHE_MAGIC: str = "pathfinder-graph"
+    PATH_HASH_LENGTH: int = 12
+    ARRAY_ATTRIBUTES = ("adjacency_offsets", "adjacency_targets", "adjacency_weights", "coordinate_x", "coordinate_y")
+
+    def __init__(self, cache_directory: Optional[str] = None) -> None:
+        """
+        Args:
+            cache_directory (Optional[str]): Where entries are stored. Defaults to the
+                                             `PATHFINDER_CACHE_DIR` environment variable, then to a
+                                             `.graph_cache` directory next to each map.
+        """
+        self.cache_directory = cache_directory or os.environ.get(self.CACHE_DIRECTORY_VARIABLE) or None
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def load(self, filepath: str) -> Graph:
+        """
+        Returns the Graph for `filepath`, from the cache when its content is unchanged.
+
+        Args:
+            filepath (str): The configuration file.
+
+        Returns:
+            Graph: A fully indexed Graph, identical to `Graph().load_from_file(filepath)`.
+
+        Raises:
+            FileNotFoundError: If the source file does not exist.
+            ValueError: If a destination refers to a node without coordinates.
+
+        Internal Variables:
+            source_bytes (bytes): The raw file content; hashed, and parsed on a miss, so the key
+                                  always describes exactly what was parsed.
+            content_key (str): The hexadecimal SHA-256 of `source_bytes`.
+        """
+        import hashlib
+
+        with open(filepath, "rb") as source_stream:
+            source_bytes = source_stream.read()
+        content_key = hashlib.sha256(source_bytes).hexdigest()
+        cache_path = self._cache_path(filepath, content_key)
+
+        cached_graph = self._read_entry(cache_path, content_key)
+        if cached_graph is not None:
+            self.cache_hits += 1
+            return cached_graph
+
+        self.cache_misses += 1
+        problem_graph = Graph()
+        # Decoding like text-mode `open` (UTF-8, universal newlines) keeps the parse identical.
+        problem_graph.load_from_string(source_bytes.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n"))
+        self._write_entry(cache_path, content_key, problem_graph)
+        return problem_graph
+
+    def _cache_path(self, filepath: str, content_key: str) -> str:
+        """Builds the entry path: <directory>/<map name>.<path hash>.<content hash>.<interpreter tag>.graph"""
+        import hashlib
+
+        absolute_path = os.path.abspath(filepath)
+        cache_directory = self.cache_directory or os.path.join(os.path.dirname(absolute_path), self.CACHE_DIRECTORY_NAME)
+        path_key = hashlib.sha256(absolute_path.encode("utf-8", "surrogatepass")).hexdigest()[:self.PATH_HASH_LENGTH]
+        entry_name = f"{os.path.basename(absolute_path)}.{path_key}.{content_key}.{sys.implementation.cache_tag}.graph"
+        return os.path.join(cache_directory, entry_name)
+
+    def _read_entry(self, cache_path: str, content_key: str) -> Optional[Graph]:
+        """
+        Rebuilds a Graph from a cache entry.
+
+        Returns:
+            Optional[Graph]: The Graph, or None if the entry is missing, corrupt or for another key.
+        """
+        try:
+            with open(cache_path, "rb") as cache_stream:
+                magic, format_version, entry_key, snapshot = marshal.loads(cache_stream.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if magic != self.CACHE_MAGIC or format_version != self.CACHE_FORMAT_VERSION or entry_key != content_key:
+            return None
+
+        try:
+            return self._restore_snapshot(snapshot)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _write_entry(self, cache_path: str, content_key: str, problem_graph: Graph) -> None:
+        """
+        Atomically publishes a cache entry and removes stale entries for the same map path.
+        Failures (read-only directory, full disk) are silently ignored.
+        """
+        import tempfile
+
+        cache_directory = os.path.dirname(cache_path)
+        entry_payload = (self.CACHE_MAGIC, self.CACHE_FORMAT_VERSION, content_key, self._take_snapshot(problem_graph))
+        temporary_path = None
+        try:
+            os.makedirs(cache_directory, exist_ok=True)
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=cache_directory, suffix=".tmp")
+            with os.fdopen(file_descriptor, "wb") as temporary_stream:
+                temporary_stream.write(marshal.dumps(entry_payload))
+            os.replace(temporary_path, cache_path)
+            temporary_path = None
+            self._remove_stale_entries(cache_path)
+        except OSError:
+            pass
+        finally:
+            if temporary_path is not None:
+                try:
+                    os.remove(temporary_path)
+                except OSError:
+                    pass
+
+    def _remove_stale_entries(self, cache_path: str) -> None:
+        """
+        Deletes the entries of the same map path and interpreter that belong to other content
+        hashes, and every entry of the same file name in the earlier '<map name>.<content hash>.
+        <interpreter tag>.graph' scheme. The content hash and interpreter tag never contain a dot,
+        so stripping them leaves the map label: '<map name>.<path hash>', or the bare map name for
+        an entry in the earlier scheme.
+
+        Internal Variables:
+            map_label (str): '<map name>.<path hash>' of the entry just written.
+            legacy_label (str): The bare map name, i.e. the map label of earlier-scheme entries.
+        """
+        cache_directory, entry_name = os.path.split(cache_path)
+        map_label, _, interpreter_tag = entry_name[:-len(".graph")].rsplit(".", 2)
+        legacy_label = map_label.rsplit(".", 1)[0]
+        for existing_name in os.listdir(cache_directory):
+            if existing_name == entry_name or not existing_name.endswith(".graph"):
+                continue
+            existing_parts = existing_name[:-len(".graph")].rsplit(".", 2)
+            if len(existing_parts) != 3:
+                continue
+            existing_label, _, existing_tag = existing_parts
+            if (existing_label == map_label and existing_tag == interpreter_tag) or existing_label == legacy_label:
+                try:
+                    os.remove(os.path.join(cache_directory, existing_name))
+                except OSError:
+                    pass
+
+    def _take_snapshot(self, problem_graph: Graph) -> Dict[str, Any]:
+        """Captures the parsed dictionaries and the raw bytes of every index array."""
+        snapshot: Dict[str, Any] = {
+            "node_coordinates": problem_graph.node_coordinates,
+            "adjacency_list": problem_graph.adjacency_list,
+            "origin": problem_graph.origin,
+            "destinations": problem_graph.destinations,
+            "node_ids": problem_graph.node_ids,
+        }
+        for attribute_name in self.ARRAY_ATTRIBUTES:
+            index_array = getattr(problem_graph, attribute_name)
+            snapshot[attribute_name] = (index_array.typecode, index_array.tobytes())
+        return snapshot
+
+    def _restore_snapshot(self, snapshot: Dict[str, Any]) -> Graph:
+        """
+        Rebuilds a Graph from a snapshot. Only the cheap derived views (the ID-to-index dictionary
+        and the destination index) are recomputed.
+        """
+        problem_graph = Graph()
+        problem_graph.node_coordinates = snapshot["node_coordinates"]
+        problem_graph.adjacency_list = snapshot["adjacency_list"]
+        problem_graph.origin = snapshot["origin"]
+        problem_graph.destinations = snapshot["destinations"]
+        problem_graph.node_ids = snapshot["node_ids"]
+        problem_graph.node_index = {node_identifier: index for index, node_identifier in enumerate(problem_graph.node_ids)}
+
+        for attribute_name in self.ARRAY_ATTRIBUTES:
+            typecode, raw_bytes = snapshot[attribute_name]
+            index_array = array(typecode)
+            index_array.frombytes(raw_bytes)
+            setattr(problem_graph, attribute_name, index_array)
+
+        problem_graph._build_destination_index()
+        return problem_graph
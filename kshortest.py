@@ -0,0 +1,285 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+import heapq
+from array import array
+from bisect import bisect_left
+from typing import Any, List, NamedTuple, Optional, Set, Tuple
+from engine import SearchEngine
+from problem import SearchProblem
+
+
+# ---------------------------------------------------------------------------
+# Data Transfer Objects (DTOs)
+# ---------------------------------------------------------------------------
+class RouteCandidate(NamedTuple):
+    """
+    An immutable Data Transfer Object (DTO) describing one loopless route found by Yen's algorithm.
+
+    Attributes:
+        path_cost (float): The summed edge weight of the route.
+        path_indices (Tuple[int, ...]): The route as dense node indices, origin first.
+        deviation_position (int): The position at which this route branched off its parent route.
+                                  Spur searches for this route only need to start from here (Lawler's
+                                  refinement), because earlier spur nodes were already explored for the parent.
+    """
+    path_cost: float
+    path_indices: Tuple[int, ...]
+    deviation_position: int
+
+
+# ---------------------------------------------------------------------------
+# Exact Goal-Distance Heuristic
+# ---------------------------------------------------------------------------
+class _GoalDistanceView:
+    """
+    A read-only SearchProblem adapter whose heuristic is the exact distance to the nearest destination.
+
+    Architectural Note:
+    The distances come from one reverse Dijkstra run on the unmodified graph. Blocking nodes or 
+    edges can only lengthen routes, so these distances remain an admissible and consistent lower 
+    bound for every spur search, and A* then only explores where a spur has to deviate. Every 
+    other attribute is delegated to the wrapped problem.
+
+    Attributes:
+        problem (SearchProblem): The wrapped query.
+        goal_distances (array): The exact distance from each dense index to its nearest destination 
+                                (inf when no destination is reachable).
+    """
+
+    def __init__(self, problem: SearchProblem, goal_distances: array) -> None:
+        self.problem = problem
+        self.goal_distances = goal_distances
+
+    def __getattr__(self, attribute_name: str) -> Any:
+        return getattr(self.problem, attribute_name)
+
+    def heuristic_by_index(self, node_index: int) -> float:
+        return self.goal_distances[node_index]
+
+
+# ---------------------------------------------------------------------------
+# K-Shortest Loopless Paths (Yen's Algorithm)
+# ---------------------------------------------------------------------------
+class KShortestPathsFinder:
+    """
+    Computes the top-k loopless routes from a query's origin to any of its destinations.
+
+    Architectural Note:
+    This is Yen's algorithm layered on top of SearchEngine. Every spur search is a single run of
+    `SearchEngine._run_priority_search`, with the root path's nodes pre-closed and the
+    already-used next hops blocked. Three refinements keep k ≈ 10 tractable on large graphs:
+    1. Lawler's refinement: an accepted route only spurs from its own deviation position onward.
+    2. The spur searches stop at the first destination settled instead of growing full Dijkstra trees.
+    3. With the default 'as' method, the Euclidean heuristic is tightened to the exact distance to
+       the nearest destination (one reverse Dijkstra per `find` call, see `_GoalDistanceView`). The
+       plain Euclidean estimate (`exact_heuristic=False`) skips that run but lets every spur search on
+       a grid-like map flood most of the graph. It also trades optimality for speed: on maps where an
+       edge costs less than its length (T07_HeuristicTrap), the estimate overestimates, and spur
+       searches may return costlier routes, so the k routes are no longer guaranteed to be the k shortest.
+
+    Attributes:
+        graph (Any): The loaded Graph.
+        problem (SearchProblem): The query (the graph's own origin and destinations by default).
+        search_method (str): The best-first method used for spur searches ('as' by default, or 'cus1').
+        exact_heuristic (bool): Whether 'as' spur searches use exact goal distances instead of Euclidean ones
+                                (only the exact distances guarantee cost-optimal routes on every map).
+        search_engine (SearchEngine): The engine shared by all spur searches of one `find` call.
+        total_nodes_created (int): The nodes-created metric summed over every spur search.
+    """
+
+    def __init__(
+        self,
+        graph: Any,
+        search_method: str = "as",
+        exact_heuristic: bool = True,
+        problem: Optional[SearchProblem] = None
+    ) -> None:
+        """
+        Args:
+            graph (Any): The loaded Graph.
+            search_method (str): 'as' (default) or 'cus1'. 'cus1' and 'as' with exact goal distances
+                                 return cost-optimal spur paths.
+            exact_heuristic (bool): Replace the Euclidean estimate of 'as' with exact goal distances. Turning
+                                    it off is faster to set up, but spur paths are only cost-optimal where
+                                    the Euclidean estimate never overestimates (every weight at least its length).
+            problem (Optional[SearchProblem]): The query; defaults to the graph's own origin and destinations.
+
+        Raises:
+            ValueError: If the method does not yield cost-optimal spur paths.
+        """
+        if search_method.lower() not in ("as", "cus1"):
+            raise ValueError(f"K-shortest paths require 'as' or 'cus1', not '{search_method}'.")
+        self.graph = graph
+        self.problem = problem if problem is not None else SearchProblem.from_graph(graph)
+        self.search_method = search_method.lower()
+        self.exact_heuristic = exact_heuristic
+        self.search_engine = SearchEngine(graph, self.problem)
+        self.total_nodes_created = 0
+
+    def find(self, path_count: int) -> List[Tuple[float, List[int]]]:
+        """
+        Returns up to `path_count` loopless routes in ascending cost order.
+
+        Args:
+            path_count (int): The number of routes requested (k).
+
+        Returns:
+            List[Tuple[float, List[int]]]: (Path Cost, Path of node IDs) pairs, cheapest first. Ties are
+                                           ordered by the node-ID sequence for determinism.
+
+        Internal Variables:
+            accepted_routes (List[RouteCandidate]): The routes already confirmed (Yen's list A).
+            candidate_heap (List[RouteCandidate]): Discovered but unconfirmed routes (Yen's list B).
+            known_paths (Set[Tuple[int, ...]]): Every route ever queued, to keep B free of duplicates.
+        """
+        self.search_engine = SearchEngine(self.graph, self.problem)
+        if path_count < 1 or self.problem.origin_index is None:
+            return []
+        if self.search_method == "as" and self.exact_heuristic:
+            self.search_engine = SearchEngine(self.graph, _GoalDistanceView(self.problem, self._compute_goal_distances()))
+
+        origin_index = self.problem.origin_index
+        shortest_route = self._search_spur(origin_index, None, None)
+        if shortest_route is None:
+            self._collect_metrics()
+            return []
+
+        accepted_routes: List[RouteCandidate] = [RouteCandidate(self._path_cost(shortest_route), tuple(shortest_route), 0)]
+        candidate_heap: List[Tuple[float, Tuple[int, ...], int]] = []
+        known_paths: Set[Tuple[int, ...]] = {accepted_routes[0].path_indices}
+
+        while len(accepted_routes) < path_count:
+            previous_route = accepted_routes[-1]
+            self._queue_spur_routes(previous_route, accepted_routes, candidate_heap, known_paths)
+
+            if not candidate_heap:
+                break
+            path_cost, path_indices, deviation_position = heapq.heappop(candidate_heap)
+            accepted_routes.append(RouteCandidate(path_cost, path_indices, deviation_position))
+
+        self._collect_metrics()
+        return [
+            (route.path_cost, [self.graph.node_ids[node_index] for node_index in route.path_indices])
+            for route in accepted_routes
+        ]
+
+    def _queue_spur_routes(
+        self,
+        previous_route: RouteCandidate,
+        accepted_routes: List[RouteCandidate],
+        candidate_heap: List[Tuple[float, Tuple[int, ...], int]],
+        known_paths: Set[Tuple[int, ...]]
+    ) -> None:
+        """
+        Runs one spur search per spur node of the latest accepted route and queues the new routes.
+
+        Args:
+            previous_route (RouteCandidate): The route accepted last.
+            accepted_routes (List[RouteCandidate]): Every accepted route (their shared roots block next hops).
+            candidate_heap (List): Yen's candidate list B, as a (cost, path, deviation) min-heap.
+            known_paths (Set[Tuple[int, ...]]): Paths already accepted or queued.
+        """
+        previous_path = previous_route.path_indices
+
+        for spur_position in range(previous_route.deviation_position, len(previous_path) - 1):
+            spur_index = previous_path[spur_position]
+            root_path = previous_path[:spur_position + 1]
+
+            # Block the next hop of every accepted route that shares this root, so the spur must deviate.
+            blocked_edges = {
+                (spur_index, accepted_route.path_indices[spur_position + 1])
+                for accepted_route in accepted_routes
+                if len(accepted_route.path_indices) > spur_position + 1
+                and accepted_route.path_indices[:spur_position + 1] == root_path
+            }
+
+            # The root nodes before the spur are off-limits, which keeps every route loopless.
+            blocked_nodes = bytearray(self.graph.node_count)
+            for root_index in root_path[:-1]:
+                blocked_nodes[root_index] = 1
+
+            spur_path = self._search_spur(spur_index, blocked_nodes, blocked_edges)
+            if spur_path is None:
+                continue
+
+            candidate_path = root_path[:-1] + tuple(spur_path)
+            if candidate_path in known_paths:
+                continue
+            known_paths.add(candidate_path)
+            heapq.heappush(candidate_heap, (self._path_cost(candidate_path), candidate_path, spur_position))
+
+    def _search_spur(
+        self,
+        spur_index: int,
+        blocked_nodes: Optional[bytearray],
+        blocked_edges: Optional[Set[Tuple[int, int]]]
+    ) -> Optional[List[int]]:
+        """
+        Finds the cheapest route from `spur_index` to any destination, avoiding the blocked elements.
+
+        Returns:
+            Optional[List[int]]: The spur path as dense indices (spur first), or None if none exists.
+        """
+        settled_goals = self.search_engine._run_priority_search(
+            self.search_method, [spur_index], 1, blocked_nodes=blocked_nodes, blocked_edges=blocked_edges
+        )
+        if not settled_goals:
+            return None
+        _, _, path_identifiers = settled_goals[0]
+        return [self.graph.node_index[node_identifier] for node_identifier in path_identifiers]
+
+    def _compute_goal_distances(self) -> array:
+        """
+        Runs a multi-source Dijkstra from every destination over the reversed edges.
+
+        Returns:
+            array: The exact distance from each dense index to its nearest destination (inf if unreachable).
+
+        Internal Variables:
+            reverse_adjacency (List[List[Tuple[int, float]]]): (source index, weight) pairs per target index.
+            goal_distances (array): The tentative, then final, distance of every node.
+        """
+        node_count = self.graph.node_count
+        reverse_adjacency: List[List[Tuple[int, float]]] = [[] for _ in range(node_count)]
+        for source_index in range(node_count):
+            targets, weights, row_start, row_stop = self.graph.get_adjacency_slice(source_index)
+            for position in range(row_start, row_stop):
+                reverse_adjacency[targets[position]].append((source_index, weights[position]))
+
+        goal_distances = array("d", [float("inf")]) * node_count
+        distance_heap: List[Tuple[float, int]] = []
+        for node_index in range(node_count):
+            if self.problem.goal_flags[node_index]:
+                goal_distances[node_index] = 0.0
+                distance_heap.append((0.0, node_index))
+        heapq.heapify(distance_heap)
+
+        while distance_heap:
+            distance, node_index = heapq.heappop(distance_heap)
+            if distance > goal_distances[node_index]:
+                continue
+            for source_index, weight in reverse_adjacency[node_index]:
+                candidate_distance = distance + weight
+                if candidate_distance < goal_distances[source_index]:
+                    goal_distances[source_index] = candidate_distance
+                    heapq.heappush(distance_heap, (candidate_distance, source_index))
+        return goal_distances
+
+    def _path_cost(self, path_indices: Tuple[int, ...]) -> float:
+        """
+        Sums the edge weights along a route, left to right (the same order the engines accumulate g).
+
+        Architectural Note:
+        CSR rows are sorted by target index, so each edge is located with a binary search.
+        """
+        path_cost = 0.0
+        for source_index, target_index in zip(path_indices, path_indices[1:]):
+            targets, weights, row_start, row_stop = self.graph.get_adjacency_slice(source_index)
+            position = bisect_left(targets, target_index, row_start, row_stop)
+            path_cost += weights[position]
+        return path_cost
+
+    def _collect_metrics(self) -> None:
+        """Publishes the nodes-created metric of the spur searches."""
+        self.total_nodes_created = self.search_engine.total_nodes_created
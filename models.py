@@ -1,16 +1,44 @@
 # ---------------------------------------------------------------------------
 # Imports & Dependencies
 # ---------------------------------------------------------------------------
+from __future__ import annotations
+
 import math
-from dataclasses import dataclass, field
-from typing import Optional
+
+# The CLI imports this module on every invocation, so `typing` (and `dataclasses`, which drags in 
+# `inspect` and `re`) are kept off the runtime import path; annotations are never evaluated.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import List, Optional
+
+
+# ---------------------------------------------------------------------------
+# Record Base Class
+# ---------------------------------------------------------------------------
+class _SlotsRecord:
+    """
+    A minimal stand-in for `dataclasses.dataclass`: field-wise `__eq__` and `__repr__` derived from
+    `__slots__`. Slotted records also skip the per-instance `__dict__`, which matters for the
+    millions of SearchStates a large search allocates.
+    """
+    __slots__ = ()
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        field_values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{self.__class__.__name__}({field_values})"
 
 
 # ---------------------------------------------------------------------------
 # Data Structures & State Management
 # ---------------------------------------------------------------------------
-@dataclass(order=False)
-class SearchState:
+class SearchState(_SlotsRecord):
     """
     An immutable-style Data Transfer Object (DTO) representing a single node 
     (or state) within the search tree during traversal.
@@ -24,42 +52,52 @@ class SearchState:
     3. Tertiary: Chronological generation order (nodes generated earlier are expanded first).
     
     Attributes:
-        node_id (int): The unique integer identifier of the graph node represented by this state.
-        parent (Optional[SearchState]): The predecessor state that generated this state. 
-                                        Crucial for backtracking to reconstruct the final path.
+        node_id (int): The dense index of the graph node represented by this state (see `Graph.build_index`). 
+                       Dense indices are assigned in ascending ID order, so the secondary tie-breaker 
+                       compares exactly as the external IDs would.
+        parent (int): The dense index of the predecessor node that generated this state, or -1 for the origin. 
+                      The engine copies it into a flat parent array when the node is expanded, which is 
+                      what the final path is reconstructed from.
         g (float): The cumulative path cost from the origin to this specific node. 
                    (Retained as 'g' to universally adhere to standard mathematical pathfinding notation).
         h (float): The estimated heuristic cost from this node to the nearest goal. 
                    (Retained as 'h' to universally adhere to standard mathematical pathfinding notation).
         search_method (str): The identifier of the search algorithm evaluating this state (e.g., 'as', 'gbfs').
         timestamp (int): A strictly increasing integer marking exactly when this state was instantiated.
+        heuristic_weight (float): The inflation factor ε applied to h by weighted/anytime A* ('ara'); 1.0 otherwise.
         priority_score (float): The computed evaluation metric used to rank this node in a priority queue.
     """
-    node_id: int
-    parent: Optional['SearchState']
-    g: float
-    h: float
-    search_method: str
-    timestamp: int
-    
-    # field(init=False) tells the dataclass NOT to expect this in the constructor, 
-    # as we will dynamically compute it immediately after initialization.
-    priority_score: float = field(init=False)
+    __slots__ = ("node_id", "parent", "g", "h", "search_method", "timestamp", "heuristic_weight", "priority_score")
 
     # ---------------------------------------------------------------------------
     # Lifecycle Hooks
     # ---------------------------------------------------------------------------
-    def __post_init__(self) -> None:
+    def __init__(
+        self, 
+        node_id: int, 
+        parent: int, 
+        g: float, 
+        h: float, 
+        search_method: str, 
+        timestamp: int, 
+        heuristic_weight: float = 1.0
+    ) -> None:
         """
-        A built-in dataclass lifecycle hook that executes immediately after instantiation.
-        
-        It computes the specific evaluation priority score (f-value) for the node 
-        based strictly on the designated search algorithm's mathematical strategy.
+        Stores the state's fields, then computes the specific evaluation priority score (f-value) 
+        for the node based strictly on the designated search algorithm's mathematical strategy.
         
         Internal Variables:
             method (str): The normalized, lowercase identifier of the active search algorithm.
         """
-        method = self.search_method.lower()
+        self.node_id = node_id
+        self.parent = parent
+        self.g = g
+        self.h = h
+        self.search_method = search_method
+        self.timestamp = timestamp
+        self.heuristic_weight = heuristic_weight
+
+        method = search_method.lower()
         
         # Uninformed searches (BFS, DFS) do not utilize priority scoring for exploration.
         # Setting a baseline of 0.0 maintains structural compatibility across the engine.
@@ -78,6 +116,10 @@ class SearchState:
         elif method == 'cus1':
             self.priority_score = self.g
             
+        # Anytime Repairing A* (ARA) evaluates on an inflated total cost: f(n) = g(n) + ε·h(n)
+        elif method == 'ara':
+            self.priority_score = self.g + self.heuristic_weight * self.h
+            
         # Fail-safe fallback to prevent math operation exceptions on undefined methods
         else:
             self.priority_score = 0.0
@@ -112,4 +154,84 @@ class SearchState:
         # 3. Tertiary Tie-Breaker: Chronological Order
         # If priority scores and node IDs are both equal (e.g., cyclic redundant paths), 
         # the node added to the frontier earliest (lowest timestamp) is expanded first.
-        return self.timestamp < other.timestamp
\ No newline at end of file
+        return self.timestamp < other.timestamp
+
+
+# ---------------------------------------------------------------------------
+# Search Budgets & Outcomes
+# ---------------------------------------------------------------------------
+class SearchBudget(_SlotsRecord):
+    """
+    A set of cooperative resource limits enforced from inside the SearchEngine loops.
+    
+    Architectural Note:
+    Unlike the benchmark runner's subprocess timeout, which kills the process and loses everything, 
+    a budget is checked from inside the search. When any limit trips, the search unwinds cleanly 
+    and reports the best node reached so far. `max_nodes_created` is a hard limit, checked where 
+    nodes are generated: a search never creates more nodes than it allows. The time and frontier 
+    limits are checked once per node expansion.
+    
+    Attributes:
+        max_nodes_created (Optional[int]): The ceiling on the nodes-created metric (None = unlimited).
+        time_limit_seconds (Optional[float]): The wall-clock allowance, measured from the start of `solve`. 
+                                              Relative rather than absolute so it survives being sent 
+                                              to another process.
+        max_frontier_size (Optional[int]): The ceiling on the frontier length (stack, queue, heap, or 
+                                           IDA* branch depth), bounding the search's memory footprint.
+    """
+    __slots__ = ("max_nodes_created", "time_limit_seconds", "max_frontier_size")
+
+    def __init__(
+        self, 
+        max_nodes_created: Optional[int] = None, 
+        time_limit_seconds: Optional[float] = None, 
+        max_frontier_size: Optional[int] = None
+    ) -> None:
+        self.max_nodes_created = max_nodes_created
+        self.time_limit_seconds = time_limit_seconds
+        self.max_frontier_size = max_frontier_size
+
+
+class SearchOutcome(_SlotsRecord):
+    """
+    The full result of one `SearchEngine.solve` call, including the partial progress of a search 
+    that was stopped by its budget.
+    
+    Attributes:
+        status (str): 'SUCCESS', 'No_Solution', or 'BUDGET_EXHAUSTED'.
+        reached_goal_id (Optional[int]): The destination reached (SUCCESS only).
+        total_nodes_created (int): The nodes-created metric at termination.
+        path_sequence (List[int]): The route to the goal (SUCCESS only).
+        exhausted_limit (Optional[str]): The budget field that tripped ('max_nodes_created', 
+                                         'time_limit_seconds' or 'max_frontier_size').
+        best_node_id (Optional[int]): On exhaustion, the explored node with the lowest heuristic estimate, 
+                                      i.e. the node believed closest to a destination.
+        best_path (List[int]): On exhaustion, the route from the origin to `best_node_id`.
+        suboptimality_bound (Optional[float]): For anytime methods ('ara'), the proven factor by which the 
+                                               returned path cost may exceed the optimum (1.0 = optimal), 
+                                               valid whenever the heuristic is admissible.
+    """
+    __slots__ = (
+        "status", "reached_goal_id", "total_nodes_created", "path_sequence", 
+        "exhausted_limit", "best_node_id", "best_path", "suboptimality_bound"
+    )
+
+    def __init__(
+        self, 
+        status: str, 
+        reached_goal_id: Optional[int] = None, 
+        total_nodes_created: int = 0, 
+        path_sequence: Optional[List[int]] = None, 
+        exhausted_limit: Optional[str] = None, 
+        best_node_id: Optional[int] = None, 
+        best_path: Optional[List[int]] = None, 
+        suboptimality_bound: Optional[float] = None
+    ) -> None:
+        self.status = status
+        self.reached_goal_id = reached_goal_id
+        self.total_nodes_created = total_nodes_created
+        self.path_sequence = [] if path_sequence is None else path_sequence
+        self.exhausted_limit = exhausted_limit
+        self.best_node_id = best_node_id
+        self.best_path = [] if best_path is None else best_path
+        self.suboptimality_bound = suboptimality_bound
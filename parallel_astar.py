@@ -0,0 +1,391 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+import heapq
+import math
+import multiprocessing
+import time
+from array import array
+from queue import Empty
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+import shared_graph
+from models import SearchOutcome
+from problem import SearchProblem
+
+
+# Knuth's multiplicative hash constant; spreads consecutive node IDs evenly over the workers.
+OWNER_HASH_MULTIPLIER: int = 2654435761
+
+
+def owner_of(node_identifier: int, worker_count: int) -> int:
+    """
+    Assigns a node to the worker that owns its open and closed entries.
+
+    Args:
+        node_identifier (int): The external node ID (not the dense index, so ownership is stable
+                               across graphs that share IDs).
+        worker_count (int): The number of workers.
+
+    Returns:
+        int: The owning worker's number.
+    """
+    return (((node_identifier * OWNER_HASH_MULTIPLIER) & 0xFFFFFFFF) >> 8) % worker_count
+
+
+# ---------------------------------------------------------------------------
+# Data Transfer Objects (DTOs)
+# ---------------------------------------------------------------------------
+class SharedSearchState(NamedTuple):
+    """
+    The synchronization objects of one HDA* query, handed to every worker at process creation.
+
+    Attributes:
+        inboxes (List[Any]): One `multiprocessing.Queue` per worker, carrying batches of
+                             (dense index, g, parent index) triples for the nodes it owns.
+        incumbent (Any): A shared double array [best goal cost found so far] (inf = none yet).
+        incumbent_goal (Any): A shared integer array [dense index of the incumbent's goal].
+        incumbent_lock (Any): Serializes updates of `incumbent` and `incumbent_goal`.
+        parent_indices (Any): A shared integer array of the best known predecessor of every node.
+                              Only the owner of a node ever writes its entry.
+        sent_counts (Any): Batches sent by each worker (written only by that worker).
+        received_counts (Any): Batches received by each worker (written only by that worker).
+        idle_flags (Any): 1 while a worker has no useful work and nothing left to send.
+        stop_event (Any): Set by the coordinator once termination has been detected.
+        result_queue (Any): Carries each worker's nodes-created count back to the coordinator.
+    """
+    inboxes: List[Any]
+    incumbent: Any
+    incumbent_goal: Any
+    incumbent_lock: Any
+    parent_indices: Any
+    sent_counts: Any
+    received_counts: Any
+    idle_flags: Any
+    stop_event: Any
+    result_queue: Any
+
+
+# ---------------------------------------------------------------------------
+# Worker Side
+# ---------------------------------------------------------------------------
+class _HashDistributedWorker:
+    """
+    One HDA* worker: the open list and closed costs of the nodes it owns.
+
+    Architectural Note:
+    A node arriving with a cheaper g than its owner has seen is (re)opened, so inconsistent
+    heuristics are handled by re-expansion, as in sequential A* with reopening. Arrivals and
+    expansions whose f-cost reaches the shared incumbent are dropped: with an admissible heuristic
+    they can never lead to a cheaper goal. Children owned by other workers are buffered per owner
+    and sent in batches of `batch_size` (or whenever the worker runs out of local work).
+
+    Attributes:
+        EXPANSIONS_PER_POLL (int): Expansions between two checks of the inbox and the stop event.
+    """
+
+    EXPANSIONS_PER_POLL: int = 64
+
+    def __init__(
+        self,
+        worker_number: int,
+        handle: shared_graph.SharedGraphHandle,
+        origin_id: int,
+        destination_ids: Tuple[int, ...],
+        batch_size: int,
+        shared_state: SharedSearchState
+    ) -> None:
+        self.worker_number = worker_number
+        self.worker_count = len(shared_state.inboxes)
+        self.graph = shared_graph.SharedGraph(handle)
+        self.problem = SearchProblem(self.graph, origin_id, destination_ids)
+        self.batch_size = batch_size
+        self.shared_state = shared_state
+        self.best_costs = array("d", [math.inf]) * self.graph.node_count
+        self.open_heap: List[Tuple[float, int, float]] = []
+        self.outgoing_batches: List[List[Tuple[int, float, int]]] = [[] for _ in range(self.worker_count)]
+        self.total_nodes_created = 0
+
+    def run(self) -> None:
+        """Processes arrivals and expansions until the coordinator sets the stop event."""
+        shared_state = self.shared_state
+        inbox = shared_state.inboxes[self.worker_number]
+        origin_index = self.problem.origin_index
+        if owner_of(self.graph.node_ids[origin_index], self.worker_count) == self.worker_number:
+            self._receive(origin_index, 0.0, -1)
+
+        while not shared_state.stop_event.is_set():
+            self._drain_inbox(inbox)
+            if self.open_heap:
+                shared_state.idle_flags[self.worker_number] = 0
+                self._expand_some()
+                continue
+
+            for owner_number in range(self.worker_count):
+                self._flush(owner_number)
+            shared_state.idle_flags[self.worker_number] = 1
+            try:
+                arrived_batch = inbox.get(timeout=0.005)
+            except Empty:
+                continue
+            self._accept_batch(arrived_batch)
+
+        self.graph.close()
+        shared_state.result_queue.put(self.total_nodes_created)
+
+    def _drain_inbox(self, inbox: Any) -> None:
+        """Accepts every batch already waiting in the inbox."""
+        while True:
+            try:
+                arrived_batch = inbox.get_nowait()
+            except Empty:
+                return
+            self._accept_batch(arrived_batch)
+
+    def _accept_batch(self, arrived_batch: List[Tuple[int, float, int]]) -> None:
+        """Counts a received batch (after leaving the idle state) and processes its nodes."""
+        self.shared_state.idle_flags[self.worker_number] = 0
+        self.shared_state.received_counts[self.worker_number] += 1
+        for node_index, cumulative_cost, parent_index in arrived_batch:
+            self._receive(node_index, cumulative_cost, parent_index)
+
+    def _receive(self, node_index: int, cumulative_cost: float, parent_index: int) -> None:
+        """
+        Opens an owned node if the new g improves on every earlier arrival, or records a new incumbent
+        when the node is a goal.
+        """
+        if cumulative_cost >= self.best_costs[node_index]:
+            return
+        heuristic_cost = self.problem.heuristic_by_index(node_index)
+        incumbent = self.shared_state.incumbent
+        if cumulative_cost + heuristic_cost >= incumbent[0]:
+            return
+
+        self.best_costs[node_index] = cumulative_cost
+        self.shared_state.parent_indices[node_index] = parent_index
+        if self.problem.goal_flags[node_index]:
+            with self.shared_state.incumbent_lock:
+                if cumulative_cost < incumbent[0]:
+                    incumbent[0] = cumulative_cost
+                    self.shared_state.incumbent_goal[0] = node_index
+            return
+        heapq.heappush(self.open_heap, (cumulative_cost + heuristic_cost, node_index, cumulative_cost))
+
+    def _expand_some(self) -> None:
+        """Expands up to `EXPANSIONS_PER_POLL` nodes, routing each child to its owner."""
+        open_heap = self.open_heap
+        best_costs = self.best_costs
+        incumbent = self.shared_state.incumbent
+        node_ids = self.graph.node_ids
+        worker_count = self.worker_count
+
+        for _ in range(self.EXPANSIONS_PER_POLL):
+            if not open_heap:
+                return
+            total_estimated_cost, node_index, cumulative_cost = heapq.heappop(open_heap)
+            if cumulative_cost > best_costs[node_index]:
+                continue
+            if total_estimated_cost >= incumbent[0]:
+                # The incumbent only ever decreases, so nothing left in this heap can beat it.
+                open_heap.clear()
+                return
+
+            targets, weights, row_start, row_stop = self.graph.get_adjacency_slice(node_index)
+            self.total_nodes_created += row_stop - row_start
+            for position in range(row_start, row_stop):
+                neighbor_index = targets[position]
+                owner_number = owner_of(node_ids[neighbor_index], worker_count)
+                if owner_number == self.worker_number:
+                    self._receive(neighbor_index, cumulative_cost + weights[position], node_index)
+                else:
+                    outgoing_batch = self.outgoing_batches[owner_number]
+                    outgoing_batch.append((neighbor_index, cumulative_cost + weights[position], node_index))
+                    if len(outgoing_batch) >= self.batch_size:
+                        self._flush(owner_number)
+
+    def _flush(self, owner_number: int) -> None:
+        """Sends the buffered children of one owner. The send is counted before the batch leaves."""
+        outgoing_batch = self.outgoing_batches[owner_number]
+        if not outgoing_batch:
+            return
+        self.shared_state.sent_counts[self.worker_number] += 1
+        self.shared_state.inboxes[owner_number].put(outgoing_batch)
+        self.outgoing_batches[owner_number] = []
+
+
+def run_worker(
+    worker_number: int,
+    handle: shared_graph.SharedGraphHandle,
+    origin_id: int,
+    destination_ids: Tuple[int, ...],
+    batch_size: int,
+    shared_state: SharedSearchState
+) -> None:
+    """
+    The entry point of a worker process. This must stay a module-level function so that it can
+    be the target of a spawned process.
+    """
+    _HashDistributedWorker(worker_number, handle, origin_id, destination_ids, batch_size, shared_state).run()
+
+
+# ---------------------------------------------------------------------------
+# Hash-Distributed A* (HDA*) Coordinator
+# ---------------------------------------------------------------------------
+class HashDistributedAStarSearch:
+    """
+    Answers one large A* query with several processes (Hash Distributed A*, Kishimoto et al.).
+
+    Architectural Note:
+    Every node is owned by the worker `owner_of(node ID)` selects. Each worker keeps its own open
+    list and closed costs; generated children travel to their owners in batches over per-worker
+    queues, and every worker expands its best local nodes without any global ordering. The first
+    goal reached therefore need not be optimal: it only sets the shared incumbent, which prunes
+    every node whose f-cost reaches it.
+
+    The search ends when no worker holds a node below the incumbent and no batch is in flight. The
+    coordinator detects this with the double-counting method: the sent and received batch counters
+    and the idle flags are read twice, and the search stops only if all workers were idle both times
+    and both rounds saw the same, balanced counts. At that point, with an admissible heuristic, the
+    incumbent is the optimal cost. Among several optimal routes, the one returned may differ from
+    sequential AS's tie-breaking, since expansion order is not global.
+
+    The topology is published once to shared memory (see `SharedGraphPublisher`); workers are
+    started per query, so this pays off on the single very large queries it is built for.
+
+    Attributes:
+        graph (Any): The loaded Graph.
+        worker_count (int): The number of worker processes per query.
+        batch_size (int): The number of children buffered per destination worker before sending.
+        total_nodes_created (int): Children generated by all workers during the last `solve` call.
+        path_cost (Optional[float]): The cost of the route found by the last `solve` call.
+        search_outcome (Optional[SearchOutcome]): The detailed outcome of the last `solve` call.
+    """
+
+    TERMINATION_POLL_SECONDS: float = 0.002
+
+    def __init__(self, graph: Any, worker_count: Optional[int] = None, batch_size: int = 256) -> None:
+        """
+        Args:
+            graph (Any): The loaded Graph to publish.
+            worker_count (Optional[int]): The number of processes (defaults to the CPU count).
+            batch_size (int): The number of children buffered per destination worker before sending.
+        """
+        self.graph = graph
+        self.worker_count = worker_count or multiprocessing.cpu_count()
+        self.batch_size = batch_size
+        self.total_nodes_created = 0
+        self.path_cost: Optional[float] = None
+        self.search_outcome: Optional[SearchOutcome] = None
+        self.graph_publisher = shared_graph.SharedGraphPublisher(graph)
+
+    def __enter__(self) -> "HashDistributedAStarSearch":
+        return self
+
+    def __exit__(self, *exception_details: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Destroys the shared block. No query may be running."""
+        self.graph_publisher.close()
+
+    def solve(self, problem: Optional[SearchProblem] = None) -> Optional[Tuple[int, int, List[int]]]:
+        """
+        Finds a cheapest route from the origin to any destination.
+
+        Args:
+            problem (Optional[SearchProblem]): The query; defaults to the graph's own origin and destinations.
+
+        Returns:
+            Optional[Tuple[int, int, List[int]]]: (Goal ID, Nodes Created, Path), or None if no
+                                                  destination is reachable.
+
+        Raises:
+            RuntimeError: If a worker process dies before the search terminates.
+        """
+        search_problem = problem if problem is not None else SearchProblem.from_graph(self.graph)
+        self.total_nodes_created = 0
+        self.path_cost = None
+        if search_problem.origin_index is None:
+            self.search_outcome = SearchOutcome("No_Solution")
+            return None
+
+        shared_state = SharedSearchState(
+            inboxes=[multiprocessing.Queue() for _ in range(self.worker_count)],
+            incumbent=multiprocessing.RawArray("d", [math.inf]),
+            incumbent_goal=multiprocessing.RawArray("q", [-1]),
+            incumbent_lock=multiprocessing.Lock(),
+            parent_indices=multiprocessing.RawArray("q", self.graph.node_count),
+            sent_counts=multiprocessing.RawArray("q", self.worker_count),
+            received_counts=multiprocessing.RawArray("q", self.worker_count),
+            idle_flags=multiprocessing.RawArray("b", self.worker_count),
+            stop_event=multiprocessing.Event(),
+            result_queue=multiprocessing.Queue(),
+        )
+        worker_processes = [
+            multiprocessing.Process(
+                target=run_worker,
+                args=(worker_number, self.graph_publisher.handle, search_problem.origin,
+                      tuple(search_problem.destinations), self.batch_size, shared_state),
+                daemon=True,
+            )
+            for worker_number in range(self.worker_count)
+        ]
+        for worker_process in worker_processes:
+            worker_process.start()
+
+        try:
+            self._await_termination(shared_state, worker_processes)
+        finally:
+            shared_state.stop_event.set()
+        self.total_nodes_created = 1 + sum(shared_state.result_queue.get() for _ in worker_processes)
+        for worker_process in worker_processes:
+            worker_process.join()
+
+        goal_index = shared_state.incumbent_goal[0]
+        if goal_index < 0:
+            self.search_outcome = SearchOutcome("No_Solution", total_nodes_created=self.total_nodes_created)
+            return None
+
+        self.path_cost = shared_state.incumbent[0]
+        path_sequence = self._reconstruct_path(goal_index, shared_state.parent_indices)
+        self.search_outcome = SearchOutcome("SUCCESS", path_sequence[-1], self.total_nodes_created, path_sequence)
+        return path_sequence[-1], self.total_nodes_created, path_sequence
+
+    def _await_termination(self, shared_state: SharedSearchState, worker_processes: List[Any]) -> None:
+        """
+        Blocks until two consecutive snapshots show every worker idle and the same balanced counts.
+
+        Internal Variables:
+            previous_snapshot (Optional[Tuple]): The (received, sent) totals of the last all-idle round.
+        """
+        previous_snapshot: Optional[Tuple[int, int]] = None
+        while True:
+            time.sleep(self.TERMINATION_POLL_SECONDS)
+            if any(worker_process.exitcode is not None for worker_process in worker_processes):
+                raise RuntimeError("An HDA* worker process exited before the search terminated.")
+
+            received_total = sum(shared_state.received_counts)
+            all_idle = all(shared_state.idle_flags)
+            sent_total = sum(shared_state.sent_counts)
+            if not all_idle or received_total != sent_total:
+                previous_snapshot = None
+                continue
+            if previous_snapshot == (received_total, sent_total):
+                return
+            previous_snapshot = (received_total, sent_total)
+
+    def _reconstruct_path(self, goal_index: int, parent_indices: Any) -> List[int]:
+        """
+        Follows the shared parent array from the goal back to the origin.
+
+        Raises:
+            RuntimeError: If the parent chain does not reach the origin (it can never be longer than the graph).
+        """
+        path_sequence: List[int] = []
+        current_index = goal_index
+        while current_index != -1:
+            if len(path_sequence) > self.graph.node_count:
+                raise RuntimeError("The HDA* parent chain does not lead back to the origin.")
+            path_sequence.append(self.graph.node_ids[current_index])
+            current_index = parent_indices[current_index]
+        return path_sequence[::-1]
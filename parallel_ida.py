@@ -0,0 +1,413 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+import math
+import multiprocessing
+import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+import shared_graph
+from engine import SearchEngine
+from models import SearchBudget, SearchOutcome
+from problem import SearchProblem
+
+
+# ---------------------------------------------------------------------------
+# Data Transfer Objects (DTOs)
+# ---------------------------------------------------------------------------
+class SubtreeTask(NamedTuple):
+    """
+    An immutable Data Transfer Object (DTO) describing one work unit of an IDA* threshold pass.
+
+    Attributes:
+        rank (int): The unit's position in the sequential depth-first order of the pass.
+        prefix_path (Tuple[int, ...]): The dense indices from the origin down to the unit's root.
+        cumulative_cost (float): The g-value of the unit's root.
+        heuristic_cost (float): The h-value of the unit's root.
+        current_threshold (float): The f-cost bound of the pass.
+        origin_id (int): The query's origin node ID (workers build their own SearchProblem).
+        destination_ids (Tuple[int, ...]): The query's destination node IDs.
+        heuristic_scale (float): The query's `SearchProblem.heuristic_scale`.
+    """
+    rank: int
+    prefix_path: Tuple[int, ...]
+    cumulative_cost: float
+    heuristic_cost: float
+    current_threshold: float
+    origin_id: int
+    destination_ids: Tuple[int, ...]
+    heuristic_scale: float = 1.0
+
+
+class SubtreeResult(NamedTuple):
+    """
+    An immutable Data Transfer Object (DTO) returned by a worker for one SubtreeTask.
+
+    Attributes:
+        rank (int): The rank of the task.
+        goal_path (Optional[Tuple[int, ...]]): The dense-index route to the first goal of the subtree in
+                                               depth-first order, or None.
+        total_nodes_created (int): The nodes generated inside the subtree.
+        cancelled (bool): Whether the worker stopped early because a lower rank had found a goal.
+    """
+    rank: int
+    goal_path: Optional[Tuple[int, ...]]
+    total_nodes_created: int
+    cancelled: bool
+
+
+# ---------------------------------------------------------------------------
+# Worker Side
+# ---------------------------------------------------------------------------
+class _SubtreeCancelled(Exception):
+    """Unwinds a worker's recursion once a lower-ranked unit has found a goal."""
+
+
+class _SubtreeSearchEngine(SearchEngine):
+    """
+    A SearchEngine that runs the sequential IDA* recursion on one subtree and polls the pool's shared
+    goal rank through the cooperative budget hook.
+
+    Attributes:
+        task_rank (int): The rank of the subtree being searched.
+        CANCELLATION_POLL_INTERVAL (int): The number of recursion frames between two reads of the shared rank.
+    """
+
+    CANCELLATION_POLL_INTERVAL: int = 256
+
+    def __init__(self, graph: Any, problem: SearchProblem, task_rank: int) -> None:
+        super().__init__(graph, problem)
+        self.task_rank = task_rank
+        self._frames_until_poll = self.CANCELLATION_POLL_INTERVAL
+        # A non-None budget makes `_iterative_deepening_recursive` call `_enforce_budget` per frame.
+        self.budget = SearchBudget()
+
+    def _enforce_budget(self, frontier_size: int) -> None:
+        self._frames_until_poll -= 1
+        if self._frames_until_poll:
+            return
+        self._frames_until_poll = self.CANCELLATION_POLL_INTERVAL
+        if _worker_goal_rank.value < self.task_rank:
+            raise _SubtreeCancelled()
+
+
+_worker_goal_rank: Any = None
+_worker_next_threshold: Any = None
+_worker_problems: Dict[Tuple[int, Tuple[int, ...], float], SearchProblem] = {}
+
+
+def initialize_worker(handle: shared_graph.SharedGraphHandle, goal_rank: Any, next_threshold: Any) -> None:
+    """
+    A `ProcessPoolExecutor` initializer that attaches the worker to the published graph and to the
+    pass-wide shared values.
+
+    Args:
+        handle (SharedGraphHandle): The publisher's handle.
+        goal_rank (Any): A shared integer holding the lowest rank that has found a goal in this pass.
+        next_threshold (Any): A shared double holding the minimum f-cost that exceeded the pass's bound.
+    """
+    global _worker_goal_rank, _worker_next_threshold
+    shared_graph.initialize_worker(handle)
+    _worker_goal_rank = goal_rank
+    _worker_next_threshold = next_threshold
+
+
+def search_subtree(subtree_task: SubtreeTask) -> SubtreeResult:
+    """
+    Runs one bounded depth-first pass over a subtree inside a worker process.
+    This must stay a module-level function so that the process pool can pickle a reference to it.
+
+    Args:
+        subtree_task (SubtreeTask): The unit to search.
+
+    Returns:
+        SubtreeResult: The first goal reached in depth-first order (if any) and the nodes generated.
+    """
+    if _worker_goal_rank.value < subtree_task.rank:
+        return SubtreeResult(subtree_task.rank, None, 0, True)
+
+    graph = shared_graph.worker_graph()
+    problem_key = (subtree_task.origin_id, subtree_task.destination_ids, subtree_task.heuristic_scale)
+    search_problem = _worker_problems.get(problem_key)
+    if search_problem is None:
+        _worker_problems.clear()
+        search_problem = _worker_problems[problem_key] = SearchProblem(
+            graph, subtree_task.origin_id, subtree_task.destination_ids, subtree_task.heuristic_scale
+        )
+
+    search_engine = _SubtreeSearchEngine(graph, search_problem, subtree_task.rank)
+    active_path = list(subtree_task.prefix_path)
+    on_path_flags = bytearray(graph.node_count)
+    for path_index in active_path:
+        on_path_flags[path_index] = 1
+
+    try:
+        search_result = search_engine._iterative_deepening_recursive(
+            active_path[-1], subtree_task.cumulative_cost, subtree_task.heuristic_cost,
+            subtree_task.current_threshold, active_path, on_path_flags
+        )
+    except _SubtreeCancelled:
+        return SubtreeResult(subtree_task.rank, None, search_engine.total_nodes_created, True)
+
+    if isinstance(search_result, int):
+        with _worker_goal_rank.get_lock():
+            if subtree_task.rank < _worker_goal_rank.value:
+                _worker_goal_rank.value = subtree_task.rank
+        return SubtreeResult(subtree_task.rank, tuple(active_path), search_engine.total_nodes_created, False)
+
+    with _worker_next_threshold.get_lock():
+        if search_result < _worker_next_threshold.value:
+            _worker_next_threshold.value = search_result
+    return SubtreeResult(subtree_task.rank, None, search_engine.total_nodes_created, False)
+
+
+# ---------------------------------------------------------------------------
+# Parallel IDA* (CUS2) Orchestrator
+# ---------------------------------------------------------------------------
+class ParallelIterativeDeepeningSearch:
+    """
+    Runs the CUS2 method (IDA*) with every threshold pass distributed across a process pool.
+
+    Architectural Note:
+    Each threshold pass is an independent bounded DFS. The parent expands the top of the search tree
+    with exactly the child order of `SearchEngine._iterative_deepening_recursive` (f-cost, then
+    ascending node ID) until it holds about `units_per_worker` subtrees per worker, and ranks them in
+    sequential depth-first order. The pool's shared call queue hands the next unit to whichever
+    worker is idle, so many small units balance unevenly sized subtrees. A unit that generated more
+    than `HEAVY_UNIT_RATIO` times the average is split one level deeper in every following pass,
+    because consecutive passes explore nearly the same tree.
+
+    Workers share two values: the lowest rank that has found a goal, and the minimum f-cost that
+    exceeded the bound. A worker whose rank is above the goal rank abandons its subtree. Units
+    ranked below it always run to completion, and the goal of the lowest-ranked successful unit is
+    returned. That is exactly the goal and path the sequential depth-first order reaches first.
+    `total_nodes_created` counts every node the parent and the workers generated, including
+    speculative work in abandoned subtrees, so it is usually higher than sequential CUS2's.
+
+    Attributes:
+        graph (Any): The loaded Graph (the parent splits passes on it; workers use a shared-memory copy).
+        max_workers (int): The number of worker processes.
+        units_per_worker (int): The number of subtrees a pass is split into, per worker.
+        max_split_depth (int): The deepest level the parent expands while splitting.
+        total_nodes_created (int): The nodes-created metric of the last `solve` call.
+        search_outcome (Optional[SearchOutcome]): The detailed outcome of the last `solve` call.
+    """
+
+    HEAVY_UNIT_RATIO: float = 4.0
+
+    def __init__(self, graph: Any, max_workers: Optional[int] = None, units_per_worker: int = 8, max_split_depth: int = 6) -> None:
+        """
+        Args:
+            graph (Any): The loaded Graph to publish.
+            max_workers (Optional[int]): The number of processes (defaults to the CPU count).
+            units_per_worker (int): The target number of subtrees per worker and pass.
+            max_split_depth (int): The deepest tree level the parent expands while splitting.
+        """
+        self.graph = graph
+        self.max_workers = max_workers or multiprocessing.cpu_count()
+        self.units_per_worker = units_per_worker
+        self.max_split_depth = max_split_depth
+        self.total_nodes_created = 0
+        self.search_outcome: Optional[SearchOutcome] = None
+
+        self._goal_rank = multiprocessing.Value("q", sys.maxsize)
+        self._next_threshold = multiprocessing.Value("d", math.inf)
+        self.graph_publisher = shared_graph.SharedGraphPublisher(graph)
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=initialize_worker,
+            initargs=(self.graph_publisher.handle, self._goal_rank, self._next_threshold),
+        )
+
+    def __enter__(self) -> "ParallelIterativeDeepeningSearch":
+        return self
+
+    def __exit__(self, *exception_details: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stops the workers, then destroys the shared block (which must outlive them)."""
+        self.executor.shutdown(wait=True)
+        self.graph_publisher.close()
+
+    def solve(self, problem: Optional[SearchProblem] = None) -> Optional[Tuple[int, int, List[int]]]:
+        """
+        Finds the route sequential CUS2 would return, using the whole pool for every threshold pass.
+        Queries must not overlap: the shared goal rank and threshold belong to one pass at a time.
+
+        Args:
+            problem (Optional[SearchProblem]): The query; defaults to the graph's own origin and destinations.
+
+        Returns:
+            Optional[Tuple[int, int, List[int]]]: (Goal ID, Nodes Created, Path), or None if no
+                                                  destination is reachable.
+
+        Internal Variables:
+            current_threshold (float): The f-cost bound of the active pass.
+            heavy_prefixes (Set[Tuple[int, ...]]): The roots of the units that earlier passes found too heavy.
+        """
+        search_problem = problem if problem is not None else SearchProblem.from_graph(self.graph)
+        self.total_nodes_created = 0
+        origin_index = search_problem.origin_index
+        if origin_index is None:
+            self.search_outcome = SearchOutcome("No_Solution")
+            return None
+
+        current_threshold = search_problem.heuristic_by_index(origin_index)
+        heavy_prefixes: Set[Tuple[int, ...]] = set()
+        while True:
+            # As in the sequential engine, every pass generates a fresh start node.
+            self.total_nodes_created += 1
+            goal_path, next_threshold, heavy_prefixes = self._run_pass(search_problem, current_threshold, heavy_prefixes)
+
+            if goal_path is not None:
+                path_sequence = [self.graph.node_ids[path_index] for path_index in goal_path]
+                self.search_outcome = SearchOutcome("SUCCESS", path_sequence[-1], self.total_nodes_created, path_sequence)
+                return path_sequence[-1], self.total_nodes_created, path_sequence
+
+            if next_threshold == math.inf:
+                self.search_outcome = SearchOutcome("No_Solution", total_nodes_created=self.total_nodes_created)
+                return None
+            current_threshold = next_threshold
+
+    def _run_pass(
+        self,
+        search_problem: SearchProblem,
+        current_threshold: float,
+        heavy_prefixes: Set[Tuple[int, ...]]
+    ) -> Tuple[Optional[Tuple[int, ...]], float, Set[Tuple[int, ...]]]:
+        """
+        Splits one threshold pass into ranked units, runs them on the pool and merges the results.
+
+        Returns:
+            Tuple[Optional[Tuple[int, ...]], float, Set[Tuple[int, ...]]]: The winning goal path (or None),
+                the next threshold, and the unit roots to split deeper in the next pass.
+        """
+        work_units, goal_path, minimum_exceeded_threshold = self._split_pass(search_problem, current_threshold, heavy_prefixes)
+        if goal_path is not None or not work_units:
+            return goal_path, minimum_exceeded_threshold, set()
+
+        self._goal_rank.value = sys.maxsize
+        self._next_threshold.value = math.inf
+        destination_ids = tuple(search_problem.destinations)
+        pending_futures: Dict[Future, int] = {
+            self.executor.submit(
+                search_subtree,
+                SubtreeTask(
+                    rank, prefix_path, cumulative_cost, heuristic_cost, current_threshold,
+                    search_problem.origin, destination_ids, search_problem.heuristic_scale,
+                )
+            ): rank
+            for rank, (prefix_path, cumulative_cost, heuristic_cost) in enumerate(work_units)
+        }
+
+        unit_results: List[SubtreeResult] = []
+        winning_result: Optional[SubtreeResult] = None
+        while pending_futures:
+            completed_futures, _ = wait(pending_futures, return_when=FIRST_COMPLETED)
+            for completed_future in completed_futures:
+                del pending_futures[completed_future]
+                if completed_future.cancelled():
+                    continue
+                unit_result = completed_future.result()
+                unit_results.append(unit_result)
+                self.total_nodes_created += unit_result.total_nodes_created
+                if unit_result.goal_path is not None and (winning_result is None or unit_result.rank < winning_result.rank):
+                    winning_result = unit_result
+
+            if winning_result is not None:
+                # Units that have not started yet and rank after the winner can never change the answer.
+                for pending_future, rank in list(pending_futures.items()):
+                    if rank > winning_result.rank and pending_future.cancel():
+                        del pending_futures[pending_future]
+
+        if winning_result is not None:
+            return winning_result.goal_path, math.inf, set()
+
+        average_nodes = sum(unit_result.total_nodes_created for unit_result in unit_results) / len(unit_results)
+        next_heavy_prefixes = heavy_prefixes | {
+            work_units[unit_result.rank][0]
+            for unit_result in unit_results
+            if unit_result.total_nodes_created > self.HEAVY_UNIT_RATIO * average_nodes
+        }
+        return None, min(minimum_exceeded_threshold, self._next_threshold.value), next_heavy_prefixes
+
+    def _split_pass(
+        self,
+        search_problem: SearchProblem,
+        current_threshold: float,
+        heavy_prefixes: Set[Tuple[int, ...]]
+    ) -> Tuple[List[Tuple[Tuple[int, ...], float, float]], Optional[Tuple[int, ...]], float]:
+        """
+        Expands the top of the pass's search tree into units listed in sequential depth-first order.
+
+        Architectural Note:
+        A unit is only expanded if its root is within the bound and is not a goal, exactly when the
+        sequential recursion would expand it; children above the bound are pruned here and their
+        f-costs recorded. The tree is first expanded level by level until the target unit count is
+        reached, then every unit rooted at one of `heavy_prefixes` is expanded again, which repeats
+        the refinements of all earlier passes.
+
+        Returns:
+            Tuple[List[Tuple[Tuple[int, ...], float, float]], Optional[Tuple[int, ...]], float]:
+                The (prefix path, g, h) units, a goal path if the origin itself is a goal, and the
+                minimum f-cost pruned while splitting.
+        """
+        origin_index = search_problem.origin_index
+        origin_heuristic = search_problem.heuristic_by_index(origin_index)
+        if origin_heuristic > current_threshold:
+            return [], None, origin_heuristic
+        if search_problem.goal_flags[origin_index]:
+            return [], (origin_index,), math.inf
+
+        minimum_exceeded_threshold = math.inf
+        work_units: List[Tuple[Tuple[int, ...], float, float]] = [((origin_index,), 0.0, origin_heuristic)]
+        target_unit_count = self.max_workers * self.units_per_worker
+        split_depth = 0
+
+        def expand_unit(prefix_path: Tuple[int, ...], cumulative_cost: float) -> List[Tuple[Tuple[int, ...], float, float]]:
+            nonlocal minimum_exceeded_threshold
+            targets, weights, row_start, row_stop = self.graph.get_adjacency_slice(prefix_path[-1])
+            child_units = []
+            for position in range(row_start, row_stop):
+                neighbor_index = targets[position]
+                if neighbor_index not in prefix_path:
+                    child_cost = cumulative_cost + weights[position]
+                    child_heuristic = search_problem.heuristic_by_index(neighbor_index)
+                    child_units.append((child_cost + child_heuristic, neighbor_index, child_cost, child_heuristic))
+            self.total_nodes_created += len(child_units)
+            child_units.sort(key=lambda child: (child[0], child[1]))
+
+            expanded_units = []
+            for total_estimated_cost, child_index, child_cost, child_heuristic in child_units:
+                if total_estimated_cost > current_threshold:
+                    minimum_exceeded_threshold = min(minimum_exceeded_threshold, total_estimated_cost)
+                else:
+                    expanded_units.append((prefix_path + (child_index,), child_cost, child_heuristic))
+            return expanded_units
+
+        def is_expandable(work_unit: Tuple[Tuple[int, ...], float, float]) -> bool:
+            return not search_problem.goal_flags[work_unit[0][-1]]
+
+        while len(work_units) < target_unit_count and split_depth < self.max_split_depth:
+            if not any(is_expandable(work_unit) for work_unit in work_units):
+                break
+            split_depth += 1
+            work_units = [
+                split_unit
+                for work_unit in work_units
+                for split_unit in (expand_unit(work_unit[0], work_unit[1]) if is_expandable(work_unit) else [work_unit])
+            ]
+
+        while any(work_unit[0] in heavy_prefixes and is_expandable(work_unit) for work_unit in work_units):
+            work_units = [
+                split_unit
+                for work_unit in work_units
+                for split_unit in (
+                    expand_unit(work_unit[0], work_unit[1])
+                    if work_unit[0] in heavy_prefixes and is_expandable(work_unit) else [work_unit]
+                )
+            ]
+
+        return work_units, None, minimum_exceeded_threshold
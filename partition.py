@@ -0,0 +1,342 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+import heapq
+import math
+from array import array
+from typing import Any, Dict, List, Optional, Set, Tuple
+from problem import SearchProblem
+
+
+# ---------------------------------------------------------------------------
+# Spatial Partition & Boundary Distance Tables (Preprocessing)
+# ---------------------------------------------------------------------------
+class GraphPartition:
+    """
+    Splits a loaded Graph into spatial cells and precomputes, for every cell, the shortest
+    in-cell distance from each of its entry nodes to each of its exit nodes.
+
+    Architectural Note:
+    Cells come from a k-d split of the node coordinates: a cell holding more than `cell_size`
+    nodes is halved at the median of its wider axis (ties broken by dense index) until every
+    cell fits. Nodes without coordinates are placed as if they sat at (0, 0); the geometry only
+    affects how good the cells are, never the correctness of the distances.
+
+    An edge whose endpoints lie in different cells is a "cut edge". Its source is an exit node
+    and its target an entry node of their respective cells. The entry-to-exit distance tables
+    (a "clique" per cell), together with the cut edges, form the overlay graph that
+    `MultiLevelSearch` jumps across. A long-range query then settles boundary nodes only, instead
+    of every interior node between the origin and the destination.
+
+    Attributes:
+        graph (Any): The partitioned Graph.
+        cell_size (int): The maximum number of nodes per cell.
+        cell_of (array): The cell number of every dense index.
+        cell_members (List[List[int]]): The ascending dense indices of every cell.
+        entry_nodes (List[List[int]]): Per cell, the ascending nodes with an inbound cut edge.
+        exit_nodes (List[List[int]]): Per cell, the ascending nodes with an outbound cut edge.
+        boundary_tables (List[array]): Per cell, the row-major |entry| x |exit| distance table
+                                       (inf where the exit cannot be reached inside the cell).
+        entry_rows (Dict[int, int]): The table row of every entry node.
+        overlay_arcs (Dict[int, List[Tuple[int, float, bool]]]): The (target, weight, is table jump) arcs
+                                                                 leaving every boundary node on the overlay.
+    """
+
+    DEFAULT_CELL_SIZE: int = 256
+
+    def __init__(self, graph: Any, cell_size: int = DEFAULT_CELL_SIZE) -> None:
+        """
+        Args:
+            graph (Any): A Graph whose index has been built (e.g., by `load_from_file`).
+            cell_size (int): The maximum number of nodes per cell.
+
+        Raises:
+            ValueError: If `cell_size` is smaller than 1.
+        """
+        if cell_size < 1:
+            raise ValueError("The cell size must be at least 1.")
+        self.graph = graph
+        self.cell_size = cell_size
+        self.cell_of: array = array("q")
+        self.cell_members: List[List[int]] = []
+        self.entry_nodes: List[List[int]] = []
+        self.exit_nodes: List[List[int]] = []
+        self.boundary_tables: List[array] = []
+        self.entry_rows: Dict[int, int] = {}
+        self.overlay_arcs: Dict[int, List[Tuple[int, float, bool]]] = {}
+
+    def build(self) -> "GraphPartition":
+        """
+        Runs the full preprocessing stage.
+
+        Returns:
+            GraphPartition: The partition itself, so that construction and building can be chained.
+        """
+        self._split_into_cells()
+        self._collect_boundary_nodes()
+        self._compute_boundary_tables()
+        self._build_overlay_arcs()
+        return self
+
+    @property
+    def cell_count(self) -> int:
+        """The number of cells produced by the split."""
+        return len(self.cell_members)
+
+    def _split_into_cells(self) -> None:
+        """
+        Recursively halves the node set along its wider coordinate axis (k-d split).
+
+        Internal Variables:
+            pending_groups (List[List[int]]): The node groups still larger than `cell_size` (a LIFO stack,
+                                              so the final cell numbering is deterministic).
+            split_axis (array): The coordinate array the current group is sorted by.
+        """
+        node_count = self.graph.node_count
+        coordinate_x = [0.0 if math.isnan(value) else value for value in self.graph.coordinate_x]
+        coordinate_y = [0.0 if math.isnan(value) else value for value in self.graph.coordinate_y]
+
+        self.cell_of = array("q", [0]) * node_count
+        self.cell_members = []
+        pending_groups: List[List[int]] = [list(range(node_count))] if node_count else []
+
+        while pending_groups:
+            node_group = pending_groups.pop()
+            if len(node_group) <= self.cell_size:
+                for node_index in node_group:
+                    self.cell_of[node_index] = len(self.cell_members)
+                self.cell_members.append(sorted(node_group))
+                continue
+
+            x_spread = max(coordinate_x[i] for i in node_group) - min(coordinate_x[i] for i in node_group)
+            y_spread = max(coordinate_y[i] for i in node_group) - min(coordinate_y[i] for i in node_group)
+            split_axis = coordinate_x if x_spread >= y_spread else coordinate_y
+
+            node_group.sort(key=lambda node_index: (split_axis[node_index], node_index))
+            median_position = len(node_group) // 2
+            pending_groups.append(node_group[median_position:])
+            pending_groups.append(node_group[:median_position])
+
+    def _collect_boundary_nodes(self) -> None:
+        """Classifies the endpoints of every cut edge as exit (source) or entry (target) nodes."""
+        is_entry = bytearray(self.graph.node_count)
+        is_exit = bytearray(self.graph.node_count)
+
+        for source_index in range(self.graph.node_count):
+            targets, _, row_start, row_stop = self.graph.get_adjacency_slice(source_index)
+            for position in range(row_start, row_stop):
+                target_index = targets[position]
+                if self.cell_of[source_index] != self.cell_of[target_index]:
+                    is_exit[source_index] = 1
+                    is_entry[target_index] = 1
+
+        self.entry_nodes = [[i for i in members if is_entry[i]] for members in self.cell_members]
+        self.exit_nodes = [[i for i in members if is_exit[i]] for members in self.cell_members]
+        self.entry_rows = {}
+        for cell_entries in self.entry_nodes:
+            for row, node_index in enumerate(cell_entries):
+                self.entry_rows[node_index] = row
+
+    def _compute_boundary_tables(self) -> None:
+        """Fills every cell's entry-to-exit table with one in-cell Dijkstra per entry node."""
+        self.boundary_tables = []
+        for cell, cell_entries in enumerate(self.entry_nodes):
+            cell_exits = self.exit_nodes[cell]
+            boundary_table = array("d", [math.inf]) * (len(cell_entries) * len(cell_exits))
+
+            for row, entry_index in enumerate(cell_entries):
+                distances, _ = self.search_within_cell(entry_index)
+                row_offset = row * len(cell_exits)
+                for column, exit_index in enumerate(cell_exits):
+                    boundary_table[row_offset + column] = distances.get(exit_index, math.inf)
+            self.boundary_tables.append(boundary_table)
+
+    def _build_overlay_arcs(self) -> None:
+        """
+        Materializes the overlay adjacency of every boundary node: its cut edges, followed (for
+        entry nodes) by the reachable table jumps to the other exit nodes of its cell.
+        """
+        self.overlay_arcs = {}
+        for cell, cell_members in enumerate(self.cell_members):
+            cell_exits = self.exit_nodes[cell]
+            boundary_table = self.boundary_tables[cell]
+            for node_index in cell_members:
+                entry_row = self.entry_rows.get(node_index)
+                targets, weights, row_start, row_stop = self.graph.get_adjacency_slice(node_index)
+                node_arcs = [
+                    (targets[position], weights[position], False) for position in range(row_start, row_stop)
+                    if self.cell_of[targets[position]] != cell
+                ]
+                if entry_row is not None:
+                    row_offset = entry_row * len(cell_exits)
+                    for column, exit_index in enumerate(cell_exits):
+                        jump_distance = boundary_table[row_offset + column]
+                        if exit_index != node_index and jump_distance != math.inf:
+                            node_arcs.append((exit_index, jump_distance, True))
+                if node_arcs:
+                    self.overlay_arcs[node_index] = node_arcs
+
+    def search_within_cell(self, source_index: int, target_index: Optional[int] = None) -> Tuple[Dict[int, float], Dict[int, int]]:
+        """
+        Runs Dijkstra from `source_index` without leaving its cell.
+
+        Args:
+            source_index (int): The dense index to start from.
+            target_index (Optional[int]): Stop as soon as this node is settled (None = settle the whole cell).
+
+        Returns:
+            Tuple[Dict[int, float], Dict[int, int]]: The settled distances and the predecessor of
+                                                     every reached node (the source has none).
+        """
+        cell = self.cell_of[source_index]
+        distances: Dict[int, float] = {source_index: 0.0}
+        predecessors: Dict[int, int] = {}
+        settled_nodes: Set[int] = set()
+        distance_heap: List[Tuple[float, int]] = [(0.0, source_index)]
+
+        while distance_heap:
+            distance, node_index = heapq.heappop(distance_heap)
+            if node_index in settled_nodes:
+                continue
+            settled_nodes.add(node_index)
+            if node_index == target_index:
+                break
+
+            targets, weights, row_start, row_stop = self.graph.get_adjacency_slice(node_index)
+            for position in range(row_start, row_stop):
+                neighbor_index = targets[position]
+                if self.cell_of[neighbor_index] != cell or neighbor_index in settled_nodes:
+                    continue
+                candidate_distance = distance + weights[position]
+                if candidate_distance < distances.get(neighbor_index, math.inf):
+                    distances[neighbor_index] = candidate_distance
+                    predecessors[neighbor_index] = node_index
+                    heapq.heappush(distance_heap, (candidate_distance, neighbor_index))
+
+        return distances, predecessors
+
+
+# ---------------------------------------------------------------------------
+# Multi-Level Query Mode
+# ---------------------------------------------------------------------------
+class MultiLevelSearch:
+    """
+    Answers origin-to-nearest-destination queries over a prepared GraphPartition.
+
+    Architectural Note:
+    The query is a single Dijkstra over a hybrid graph. Inside the origin cell and the
+    destination cells ("query cells") it follows the original edges. Anywhere else it only ever
+    stands on boundary nodes: from an entry node it jumps straight to the cell's exit nodes using
+    the precomputed table, and from any boundary node it may follow its cut edges. Every overlay
+    arc is the length of a real in-cell path, so the settled costs are exactly those of CUS1;
+    only the number of settled nodes drops. After a destination is settled, every table jump on
+    the winning route is unpacked back into original edges by an in-cell search.
+
+    Attributes:
+        partition (GraphPartition): The preprocessed partition.
+        total_nodes_created (int): Frontier insertions made by the last query (table unpacking excluded).
+    """
+
+    def __init__(self, partition: GraphPartition) -> None:
+        self.partition = partition
+        self.total_nodes_created = 0
+
+    def solve(
+        self,
+        origin_id: Optional[int] = None,
+        destination_ids: Optional[List[int]] = None,
+        problem: Optional[SearchProblem] = None
+    ) -> Optional[Tuple[int, float, List[int]]]:
+        """
+        Finds the cheapest route from the origin to the nearest destination.
+
+        Args:
+            origin_id (Optional[int]): The start node ID (defaults to the problem's, then the graph's origin).
+            destination_ids (Optional[List[int]]): The goal node IDs (default to the problem's, then the 
+                                                   graph's destinations).
+            problem (Optional[SearchProblem]): A per-query problem supplying both defaults.
+
+        Returns:
+            Optional[Tuple[int, float, List[int]]]: (Reached Goal ID, Path Cost, Path of node IDs),
+                                                    or None if no destination is reachable.
+
+        Internal Variables:
+            query_cells (Set[int]): The cells searched on their original edges.
+            distances (Dict[int, float]): The tentative cost of every reached node.
+            predecessors (Dict[int, Tuple[int, bool]]): (previous node, reached by a table jump) per node.
+        """
+        graph = self.partition.graph
+        cell_of = self.partition.cell_of
+        query_source = graph if problem is None else problem
+        origin_id = query_source.origin if origin_id is None else origin_id
+        destination_ids = query_source.destinations if destination_ids is None else destination_ids
+        self.total_nodes_created = 0
+        if origin_id is None or origin_id not in graph.node_index:
+            return None
+
+        origin_index = graph.node_index[origin_id]
+        goal_indices = {graph.node_index[d] for d in destination_ids if d in graph.node_index}
+        query_cells = {cell_of[origin_index]} | {cell_of[goal_index] for goal_index in goal_indices}
+
+        distances: Dict[int, float] = {origin_index: 0.0}
+        predecessors: Dict[int, Tuple[int, bool]] = {}
+        settled_nodes: Set[int] = set()
+        distance_heap: List[Tuple[float, int]] = [(0.0, origin_index)]
+        self.total_nodes_created = 1
+
+        while distance_heap:
+            distance, node_index = heapq.heappop(distance_heap)
+            if node_index in settled_nodes:
+                continue
+            settled_nodes.add(node_index)
+
+            if node_index in goal_indices:
+                return graph.node_ids[node_index], distance, self._unpack_route(node_index, predecessors)
+
+            for neighbor_index, arc_weight, is_table_jump in self._overlay_arcs(node_index, query_cells):
+                if neighbor_index in settled_nodes:
+                    continue
+                candidate_distance = distance + arc_weight
+                if candidate_distance < distances.get(neighbor_index, math.inf):
+                    distances[neighbor_index] = candidate_distance
+                    predecessors[neighbor_index] = (node_index, is_table_jump)
+                    heapq.heappush(distance_heap, (candidate_distance, neighbor_index))
+                    self.total_nodes_created += 1
+
+        return None
+
+    def _overlay_arcs(self, node_index: int, query_cells: Set[int]) -> List[Tuple[int, float, bool]]:
+        """
+        Lists the arcs the hybrid search may follow out of a node.
+
+        Returns:
+            List[Tuple[int, float, bool]]: (target index, weight, is table jump) triples.
+        """
+        partition = self.partition
+        if partition.cell_of[node_index] in query_cells:
+            targets, weights, row_start, row_stop = partition.graph.get_adjacency_slice(node_index)
+            return [(targets[position], weights[position], False) for position in range(row_start, row_stop)]
+        return partition.overlay_arcs.get(node_index, [])
+
+    def _unpack_route(self, goal_index: int, predecessors: Dict[int, Tuple[int, bool]]) -> List[int]:
+        """
+        Rebuilds the route in original edges, expanding every table jump with an in-cell search.
+
+        Returns:
+            List[int]: The node IDs from the origin to the goal.
+        """
+        reversed_route = [goal_index]
+        current_index = goal_index
+        while current_index in predecessors:
+            previous_index, is_table_jump = predecessors[current_index]
+            if is_table_jump:
+                _, cell_predecessors = self.partition.search_within_cell(previous_index, current_index)
+                hop_index = current_index
+                while cell_predecessors[hop_index] != previous_index:
+                    hop_index = cell_predecessors[hop_index]
+                    reversed_route.append(hop_index)
+            reversed_route.append(previous_index)
+            current_index = previous_index
+
+        node_ids = self.partition.graph.node_ids
+        return [node_ids[node_index] for node_index in reversed(reversed_route)]
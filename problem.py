@@ -0,0 +1,191 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+from __future__ import annotations
+
+import math
+from array import array
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, FrozenSet, Iterable, List, Optional, Tuple
+
+
+# ---------------------------------------------------------------------------
+# Per-Query Routing Problem
+# ---------------------------------------------------------------------------
+class SearchProblem:
+    """
+    One routing query (an origin and its destinations) posed against a shared, read-only graph.
+
+    Architectural Note:
+    The graph holds only topology: node IDs, CSR adjacency and coordinates. Everything that
+    depends on the query lives here instead: the origin and destination indices, the dense goal
+    bitmap, the cached destination coordinates and the memoized heuristic values. A single loaded
+    graph (or a `TiledGraph`/`SharedGraph` view) can therefore serve any number of concurrent
+    queries from threads or async tasks without being copied or mutated; each query simply gets
+    its own problem, whose cost is one bytearray of `node_count` bytes plus the heuristic cache,
+    which is only allocated on the first heuristic call.
+
+    A problem is not itself synchronized: the heuristic cache is filled as the search runs, so one
+    problem should be used by one search at a time.
+
+    Attributes:
+        graph (Any): The topology the query runs on (`Graph`, `TiledGraph` or `SharedGraph`).
+        origin (Optional[int]): The starting node ID (None = no query, every search returns None).
+        origin_index (Optional[int]): The dense index of `origin`.
+        destinations (List[int]): The destination node IDs, in the given order without duplicates.
+        destination_set (FrozenSet[int]): A hashed view of `destinations` for O(1) ID membership tests.
+        destination_indices (List[int]): The dense indices of `destinations`, in the same order.
+        goal_flags (bytearray): A dense goal bitmap; `goal_flags[i]` is 1 when dense index `i` is a destination.
+        heuristic_scale (float): The factor applied to every h-value (1.0 = plain Euclidean distance).
+    """
+
+    def __init__(self, graph: Any, origin: Optional[int], destinations: Iterable[int], heuristic_scale: float = 1.0) -> None:
+        """
+        Validates the query against the graph and builds its goal index.
+
+        Args:
+            graph (Any): The topology the query runs on.
+            origin (Optional[int]): The starting node ID.
+            destinations (Iterable[int]): The acceptable goal node IDs (duplicates are dropped).
+            heuristic_scale (float): Multiplies the Euclidean heuristic. Values other than 1.0 should
+                                     come from `calibration.calibrate_heuristic_scale`, which keeps
+                                     h admissible and consistent.
+
+        Raises:
+            ValueError: If the origin is not part of the graph, or a destination has no coordinates.
+        """
+        self.graph = graph
+        self.origin = origin
+        self.destinations: List[int] = list(dict.fromkeys(destinations))
+        self.destination_set: FrozenSet[int] = frozenset(self.destinations)
+        self.heuristic_scale = heuristic_scale
+
+        self.origin_index: Optional[int] = None
+        if origin is not None:
+            self.origin_index = graph.node_index.get(origin)
+            if self.origin_index is None:
+                raise ValueError(f"Origin node {origin} is not part of the graph.")
+
+        destination_indices = [self._index_with_coordinates(destination_identifier) for destination_identifier in self.destinations]
+        missing_destinations = [
+            destination_identifier for destination_identifier, destination_index in zip(self.destinations, destination_indices)
+            if destination_index is None
+        ]
+        if missing_destinations:
+            raise ValueError(f"Destination node(s) without coordinates: {', '.join(map(str, missing_destinations))}")
+
+        self.destination_indices: List[int] = destination_indices
+        self.goal_flags = bytearray(graph.node_count)
+        for destination_index in destination_indices:
+            self.goal_flags[destination_index] = 1
+
+        self._destination_coordinates: List[Tuple[float, float]] = [
+            (graph.coordinate_x[destination_index], graph.coordinate_y[destination_index])
+            for destination_index in destination_indices
+        ]
+        self._heuristic_cache: Optional[array] = None
+
+    @classmethod
+    def from_graph(cls, graph: Any) -> "SearchProblem":
+        """
+        Builds the query a configuration file defines, from the graph's own origin and destinations.
+
+        Architectural Note:
+        Resolving the origin through `index_of` first lets a `Graph` that was assembled in code
+        (rather than loaded from a file) build its index on first use, as it always has. Problems
+        for other queries only perform read-only lookups, so they never trigger such a rebuild on a
+        graph that may be shared.
+
+        Args:
+            graph (Any): A graph exposing `origin` and `destinations`.
+
+        Returns:
+            SearchProblem: A new, independent problem for that query.
+        """
+        if graph.origin is not None:
+            graph.index_of(graph.origin)
+        return cls(graph, graph.origin, graph.destinations)
+
+    def _index_with_coordinates(self, node_identifier: int) -> Optional[int]:
+        """Returns the dense index of a node ID, or None if the node is unknown or has no coordinates."""
+        node_index = self.graph.node_index.get(node_identifier)
+        if node_index is None or math.isnan(self.graph.coordinate_x[node_index]):
+            return None
+        return node_index
+
+    def is_goal(self, node_index: int) -> bool:
+        """Reports whether a dense index is one of this query's destinations."""
+        return self.goal_flags[node_index] == 1
+
+    # ---------------------------------------------------------------------------
+    # Heuristic Computations
+    # ---------------------------------------------------------------------------
+    def heuristic(self, node_identifier: int) -> float:
+        """
+        Calculates the estimated cost (h-value) from an external node ID to the nearest destination.
+
+        Raises:
+            KeyError: If the node is unknown or has no coordinates.
+        """
+        return self.heuristic_by_index(self.graph.node_index[node_identifier])
+
+    def heuristic_by_index(self, node_index: int) -> float:
+        """
+        Calculates the estimated cost (h-value) from a dense index to the nearest destination.
+
+        Architectural Note:
+        This is the Euclidean distance to the closest destination, times `heuristic_scale`. For a
+        2D spatial map, Euclidean distance represents the shortest possible physical path ("as the
+        crow flies"). Because a real path cannot be shorter than a straight line, this heuristic
+        is both Admissible (never overestimates cost) and Consistent (satisfies the triangle
+        inequality), which is what guarantees that A* yields optimal solutions. Both properties
+        hold as long as every edge costs at least `heuristic_scale` times its straight-line length
+        (see `calibrate_heuristic_scale`).
+
+        The value of a node never changes during a query, yet searches evaluate it repeatedly
+        (every re-generation of a node, and every iteration of IDA*), and with many destinations
+        each evaluation scans all of them. The result is therefore memoized in a NaN-initialized
+        float array, allocated on first use.
+
+        Args:
+            node_index (int): The dense index of the node currently being evaluated.
+
+        Returns:
+            float: The scaled minimal straight-line distance to any destination (0.0 when there are none).
+
+        Raises:
+            KeyError: If the node has no coordinates.
+
+        Internal Variables:
+            heuristic_cache (array): The memoized h-value of each dense index (NaN = not computed yet).
+            minimum_heuristic_distance (float): The lowest distance found across all destinations.
+        """
+        if not self._destination_coordinates:
+            return 0.0
+
+        heuristic_cache = self._heuristic_cache
+        if heuristic_cache is None:
+            heuristic_cache = self._heuristic_cache = array("d", [math.nan]) * self.graph.node_count
+        cached_heuristic = heuristic_cache[node_index]
+        if cached_heuristic == cached_heuristic:
+            return cached_heuristic
+
+        current_x = self.graph.coordinate_x[node_index]
+        if math.isnan(current_x):
+            raise KeyError(self.graph.node_ids[node_index])
+        current_y = self.graph.coordinate_y[node_index]
+
+        minimum_heuristic_distance = float("inf")
+        for destination_x, destination_y in self._destination_coordinates:
+            euclidean_distance = math.sqrt(
+                (current_x - destination_x) ** 2 +
+                (current_y - destination_y) ** 2
+            )
+            if euclidean_distance < minimum_heuristic_distance:
+                minimum_heuristic_distance = euclidean_distance
+
+        minimum_heuristic_distance *= self.heuristic_scale
+        heuristic_cache[node_index] = minimum_heuristic_distance
+        return minimum_heuristic_distance
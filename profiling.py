@@ -0,0 +1,165 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+import cProfile
+import os
+import pstats
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+FunctionKey = Tuple[str, int, str]
+
+
+# ---------------------------------------------------------------------------
+# Per-Phase Profiler
+# ---------------------------------------------------------------------------
+class PhaseProfiler:
+    """
+    Profiles the phases of one CLI run (parse, preprocess, solve) separately with `cProfile`.
+
+    Architectural Note:
+    Each phase gets its own `cProfile.Profile`, so the start-up work of loading a map never blurs
+    the profile of the search, and a regression shows up in the phase it belongs to. `write`
+    produces, per (map, method) pair:
+    - `<map>.<method>.<phase>.pstats`: the raw statistics of every phase, for `python -m pstats`
+      or snakeviz.
+    - `<map>.<method>.collapsed`: collapsed stacks ("frame;frame;frame microseconds" per line),
+      the input format of flamegraph.pl and speedscope, with the phase as the root frame.
+    cProfile records caller/callee edges rather than whole stacks, so the stacks are rebuilt from
+    the call graph: a function's time is split between its callers in proportion to the time each
+    caller spent in it. This is exact wherever a function has a single caller, as the hot paths
+    (`get_adjacency_slice`, `heuristic_by_index`, `SearchState.__lt__`) usually do. Recursion
+    (IDA*) is folded into its outermost frame.
+
+    Attributes:
+        output_directory (Path): Where the profiles are written (created on demand).
+        run_label (str): The file name prefix, '<map stem>.<method>'.
+        phase_statistics (Dict[str, pstats.Stats]): The statistics of every finished phase, in run order.
+        OUTPUT_DIRECTORY_VARIABLE (str): The environment variable that overrides the output directory.
+        DEFAULT_OUTPUT_DIRECTORY (str): The directory used when the variable is unset, relative to the working directory.
+        MAX_STACK_DEPTH (int): Deeper frames are folded into their ancestor at this depth.
+        MIN_FRAME_MICROSECONDS (float): Stacks below this inclusive time are dropped from the collapsed output.
+    """
+
+    OUTPUT_DIRECTORY_VARIABLE: str = "PATHFINDER_PROFILE_DIR"
+    DEFAULT_OUTPUT_DIRECTORY: str = "profiles"
+    MAX_STACK_DEPTH: int = 64
+    MIN_FRAME_MICROSECONDS: float = 1.0
+
+    def __init__(self, map_filepath: str, search_method: str, output_directory: Optional[str] = None) -> None:
+        """
+        Args:
+            map_filepath (str): The profiled map; its stem prefixes the output files.
+            search_method (str): The profiled method.
+            output_directory (Optional[str]): Defaults to `$PATHFINDER_PROFILE_DIR`, then to './profiles'.
+        """
+        self.output_directory = Path(
+            output_directory or os.environ.get(self.OUTPUT_DIRECTORY_VARIABLE) or self.DEFAULT_OUTPUT_DIRECTORY
+        )
+        self.run_label = f"{Path(map_filepath).stem}.{search_method}"
+        self.phase_statistics: Dict[str, pstats.Stats] = {}
+
+    def run(self, phase_name: str, phase_function: Callable[..., Any], *arguments: Any) -> Any:
+        """
+        Calls `phase_function(*arguments)` under a fresh profiler and keeps its statistics.
+        A phase that runs more than once accumulates into the same entry.
+
+        Returns:
+            Any: Whatever the function returns (exceptions propagate after profiling stops).
+        """
+        phase_profile = cProfile.Profile()
+        try:
+            return phase_profile.runcall(phase_function, *arguments)
+        finally:
+            phase_profile.create_stats()
+            if phase_name in self.phase_statistics:
+                self.phase_statistics[phase_name].add(phase_profile)
+            else:
+                self.phase_statistics[phase_name] = pstats.Stats(phase_profile)
+
+    # ---------------------------------------------------------------------------
+    # Output
+    # ---------------------------------------------------------------------------
+    def write(self) -> List[Path]:
+        """
+        Writes the per-phase statistics and the collapsed stacks of the whole run.
+
+        Returns:
+            List[Path]: The files written, the collapsed stacks last.
+        """
+        self.output_directory.mkdir(parents=True, exist_ok=True)
+        written_paths: List[Path] = []
+        collapsed_lines: List[str] = []
+        for phase_name, phase_statistics in self.phase_statistics.items():
+            statistics_path = self.output_directory / f"{self.run_label}.{phase_name}.pstats"
+            phase_statistics.dump_stats(str(statistics_path))
+            written_paths.append(statistics_path)
+            collapsed_lines.extend(self._collapse_stacks(phase_name, phase_statistics.stats))
+
+        collapsed_path = self.output_directory / f"{self.run_label}.collapsed"
+        collapsed_path.write_text("".join(f"{line}\n" for line in collapsed_lines), encoding="utf-8")
+        written_paths.append(collapsed_path)
+        return written_paths
+
+    @staticmethod
+    def _frame_name(function_key: FunctionKey) -> str:
+        """Renders a pstats function key as 'module.function' (built-ins keep their own label)."""
+        filename, _, function_name = function_key
+        if filename == "~":
+            return function_name.replace(";", ",")
+        return f"{Path(filename).stem}.{function_name}"
+
+    def _collapse_stacks(self, phase_name: str, raw_statistics: Dict[FunctionKey, tuple]) -> List[str]:
+        """
+        Rebuilds root-to-leaf stacks with their self time from the caller/callee edges of one phase.
+
+        Args:
+            phase_name (str): The root frame of every stack.
+            raw_statistics (Dict): `pstats.Stats.stats`: function -> (cc, nc, tt, ct, callers), where
+                                   callers maps a caller to the (cc, nc, tt, ct) of that edge.
+
+        Returns:
+            List[str]: "stack count" lines, the count in microseconds of self time.
+
+        Internal Variables:
+            callee_edges (Dict): caller -> [(callee, inclusive seconds of the edge)].
+            stack_times (Dict[str, float]): Accumulated self seconds per stack string.
+        """
+        callee_edges: Dict[FunctionKey, List[Tuple[FunctionKey, float]]] = {}
+        root_functions: List[FunctionKey] = []
+        for function_key, (_, _, _, _, callers) in raw_statistics.items():
+            external_callers = [caller for caller in callers if caller != function_key]
+            if not external_callers:
+                root_functions.append(function_key)
+            for caller_key in external_callers:
+                callee_edges.setdefault(caller_key, []).append((function_key, callers[caller_key][3]))
+
+        stack_times: Dict[str, float] = {}
+        minimum_seconds = self.MIN_FRAME_MICROSECONDS / 1e6
+
+        def visit(function_key: FunctionKey, stack_prefix: str, inclusive_seconds: float, active_keys: set, depth: int) -> None:
+            _, _, total_self, total_inclusive, _ = raw_statistics[function_key]
+            share = inclusive_seconds / total_inclusive if total_inclusive > 0 else 1.0
+            stack_name = f"{stack_prefix};{self._frame_name(function_key)}"
+            child_seconds = 0.0
+            if depth < self.MAX_STACK_DEPTH:
+                active_keys.add(function_key)
+                for callee_key, edge_seconds in callee_edges.get(function_key, ()):
+                    scaled_seconds = edge_seconds * share
+                    if callee_key in active_keys or scaled_seconds < minimum_seconds:
+                        continue
+                    child_seconds += scaled_seconds
+                    visit(callee_key, stack_name, scaled_seconds, active_keys, depth + 1)
+                active_keys.discard(function_key)
+            # Self time, plus whatever was cut off (cycles, depth limit, tiny children).
+            stack_times[stack_name] = stack_times.get(stack_name, 0.0) + max(0.0, inclusive_seconds - child_seconds)
+
+        for root_key in sorted(root_functions):
+            root_inclusive = raw_statistics[root_key][3]
+            if root_inclusive >= minimum_seconds:
+                visit(root_key, phase_name, root_inclusive, set(), 1)
+
+        return [
+            f"{stack_name} {round(seconds * 1e6)}"
+            for stack_name, seconds in stack_times.items() if round(seconds * 1e6) > 0
+        ]
@@ -0,0 +1,275 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+from __future__ import annotations
+
+from array import array
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Dict, FrozenSet, Iterable, List, Optional
+
+
+# ---------------------------------------------------------------------------
+# Strongly Connected Component Reachability Index
+# ---------------------------------------------------------------------------
+class ReachabilityIndex:
+    """
+    The condensation of a graph into strongly connected components (SCCs), with reachability
+    labels between the components.
+
+    Architectural Note:
+    Every node of an SCC reaches every other node of it, so "can u reach v" only depends on the
+    components of u and v, and the components form a DAG (the condensation). Tarjan's algorithm
+    numbers the components in the order it completes them, which is a reverse topological order:
+    every condensation edge leads from a component to one with a smaller number. That order makes
+    both labels below a single forward sweep:
+    - The descendant label of component c is a bitset (a Python int) of every component c reaches,
+      the OR of its successors' labels plus its own bit. With it, "does the origin reach any
+      destination" is one AND against the destinations' bits. The labels take C^2 bits for C
+      components, so they are only built up to `CLOSURE_COMPONENT_LIMIT` components; above it,
+      the same question is answered by a walk over the condensation.
+    - The productive components of a query (those that can reach a destination) follow from the
+      sweep "c is productive if it holds a destination or a successor is productive".
+
+    The index is built once per topology (see `Graph.build_reachability_index`) and is read-only
+    afterwards, so it serves any number of queries and threads.
+
+    Attributes:
+        node_count (int): The number of dense indices covered.
+        component_count (int): The number of SCCs.
+        component_of (array): The component of every dense index.
+        component_offsets, component_targets (array): The condensation DAG in CSR form; every
+                                                      target is smaller than its source.
+        member_offsets, component_members (array): The dense indices of every component, grouped in CSR form.
+        CLOSURE_COMPONENT_LIMIT (int): The largest component count for which descendant labels are built.
+        UNPRODUCTIVE_CACHE_LIMIT (int): The number of destination sets whose unproductive bitmaps are kept.
+    """
+
+    CLOSURE_COMPONENT_LIMIT: int = 8192
+    UNPRODUCTIVE_CACHE_LIMIT: int = 64
+
+    def __init__(self, graph: Any) -> None:
+        """
+        Computes the components, the condensation and (if small enough) the descendant labels.
+
+        Args:
+            graph (Any): An indexed topology exposing `node_count` and `get_adjacency_slice`.
+        """
+        self.node_count = graph.node_count
+        self.component_of = array("q", [-1]) * self.node_count
+        self.component_count = self._find_components(graph)
+        self._group_members()
+        self._build_condensation(graph)
+        self._descendant_masks: Optional[List[int]] = None
+        if self.component_count <= self.CLOSURE_COMPONENT_LIMIT:
+            self._descendant_masks = self._build_descendant_masks()
+        self._unproductive_cache: Dict[FrozenSet[int], Optional[bytearray]] = {}
+
+    # ---------------------------------------------------------------------------
+    # Index Construction
+    # ---------------------------------------------------------------------------
+    def _find_components(self, graph: Any) -> int:
+        """
+        Labels every node with its SCC using an iterative Tarjan's algorithm (no recursion limit).
+
+        Returns:
+            int: The number of components.
+
+        Internal Variables:
+            discovery_order (array): The DFS number of every node (-1 = not visited yet).
+            low_links (array): The smallest DFS number reachable through the node's DFS subtree.
+            open_nodes (List[int]): Tarjan's stack of visited nodes not yet assigned a component.
+            call_stack (List[list]): The simulated recursion, one [node, next position, stop, targets] per frame.
+        """
+        node_count = self.node_count
+        component_of = self.component_of
+        discovery_order = array("q", [-1]) * node_count
+        low_links = array("q", [0]) * node_count
+        on_stack_flags = bytearray(node_count)
+        open_nodes: List[int] = []
+        visit_counter = 0
+        component_count = 0
+
+        for root_index in range(node_count):
+            if discovery_order[root_index] != -1:
+                continue
+
+            discovery_order[root_index] = low_links[root_index] = visit_counter
+            visit_counter += 1
+            open_nodes.append(root_index)
+            on_stack_flags[root_index] = 1
+            targets, _, row_start, row_stop = graph.get_adjacency_slice(root_index)
+            call_stack = [[root_index, row_start, row_stop, targets]]
+
+            while call_stack:
+                frame = call_stack[-1]
+                node_index, position, row_stop, targets = frame
+                descended = False
+                while position < row_stop:
+                    neighbor_index = targets[position]
+                    position += 1
+                    if discovery_order[neighbor_index] == -1:
+                        frame[1] = position
+                        discovery_order[neighbor_index] = low_links[neighbor_index] = visit_counter
+                        visit_counter += 1
+                        open_nodes.append(neighbor_index)
+                        on_stack_flags[neighbor_index] = 1
+                        neighbor_targets, _, neighbor_start, neighbor_stop = graph.get_adjacency_slice(neighbor_index)
+                        call_stack.append([neighbor_index, neighbor_start, neighbor_stop, neighbor_targets])
+                        descended = True
+                        break
+                    if on_stack_flags[neighbor_index] and discovery_order[neighbor_index] < low_links[node_index]:
+                        low_links[node_index] = discovery_order[neighbor_index]
+                if descended:
+                    continue
+
+                call_stack.pop()
+                if call_stack:
+                    parent_index = call_stack[-1][0]
+                    if low_links[node_index] < low_links[parent_index]:
+                        low_links[parent_index] = low_links[node_index]
+
+                # A root of its own component: everything above it on Tarjan's stack belongs to it.
+                if low_links[node_index] == discovery_order[node_index]:
+                    while True:
+                        member_index = open_nodes.pop()
+                        on_stack_flags[member_index] = 0
+                        component_of[member_index] = component_count
+                        if member_index == node_index:
+                            break
+                    component_count += 1
+
+        return component_count
+
+    def _group_members(self) -> None:
+        """Buckets the dense indices by component (a counting sort), so a component's nodes can be listed."""
+        member_counts = array("q", [0]) * (self.component_count + 1)
+        for component_index in self.component_of:
+            member_counts[component_index + 1] += 1
+        for component_index in range(self.component_count):
+            member_counts[component_index + 1] += member_counts[component_index]
+        self.member_offsets = member_counts
+
+        insert_positions = array("q", member_counts)
+        self.component_members = array("q", [0]) * self.node_count
+        for node_index, component_index in enumerate(self.component_of):
+            self.component_members[insert_positions[component_index]] = node_index
+            insert_positions[component_index] += 1
+
+    def _build_condensation(self, graph: Any) -> None:
+        """Collects the distinct edges between components into ascending CSR rows."""
+        component_of = self.component_of
+        self.component_offsets = array("q", [0])
+        self.component_targets = array("q")
+        for component_index in range(self.component_count):
+            successor_components = set()
+            for member_position in range(self.member_offsets[component_index], self.member_offsets[component_index + 1]):
+                targets, _, row_start, row_stop = graph.get_adjacency_slice(self.component_members[member_position])
+                for position in range(row_start, row_stop):
+                    successor_components.add(component_of[targets[position]])
+            successor_components.discard(component_index)
+            self.component_targets.extend(sorted(successor_components))
+            self.component_offsets.append(len(self.component_targets))
+
+    def _build_descendant_masks(self) -> List[int]:
+        """
+        Builds the descendant label of every component. Successors always have smaller numbers,
+        so their labels are complete when a component is reached.
+        """
+        descendant_masks: List[int] = []
+        for component_index in range(self.component_count):
+            component_mask = 1 << component_index
+            for position in range(self.component_offsets[component_index], self.component_offsets[component_index + 1]):
+                component_mask |= descendant_masks[self.component_targets[position]]
+            descendant_masks.append(component_mask)
+        return descendant_masks
+
+    # ---------------------------------------------------------------------------
+    # Reachability Queries
+    # ---------------------------------------------------------------------------
+    def reaches_any(self, source_index: int, target_indices: Iterable[int]) -> bool:
+        """
+        Reports whether any target is reachable from the source.
+
+        Args:
+            source_index (int): The dense index the route would start from.
+            target_indices (Iterable[int]): The dense indices of the acceptable targets.
+
+        Returns:
+            bool: True if some target can be reached (a source that is itself a target included).
+        """
+        target_components = {self.component_of[target_index] for target_index in target_indices}
+        if not target_components:
+            return False
+        source_component = self.component_of[source_index]
+
+        if self._descendant_masks is not None:
+            target_mask = 0
+            for target_component in target_components:
+                target_mask |= 1 << target_component
+            return self._descendant_masks[source_component] & target_mask != 0
+
+        # Without labels: walk the condensation, skipping components numbered below every target
+        # (their whole descendant DAG is numbered lower still).
+        lowest_target = min(target_components)
+        seen_components = {source_component}
+        pending_components = [source_component]
+        while pending_components:
+            component_index = pending_components.pop()
+            if component_index in target_components:
+                return True
+            for position in range(self.component_offsets[component_index], self.component_offsets[component_index + 1]):
+                successor_component = self.component_targets[position]
+                if successor_component >= lowest_target and successor_component not in seen_components:
+                    seen_components.add(successor_component)
+                    pending_components.append(successor_component)
+        return False
+
+    def unproductive_flags(self, target_indices: Iterable[int]) -> Optional[bytearray]:
+        """
+        Marks every node from which no target can be reached; a search may skip them outright.
+
+        Architectural Note:
+        Computing the bitmap sweeps the condensation and the member lists (O(C + E_c + N)). Services
+        typically ask about the same destination sets over and over, so the result is cached per
+        target set, keeping the `UNPRODUCTIVE_CACHE_LIMIT` most recently computed sets (the oldest
+        is dropped first). The cached bitmap is shared between callers and must not be modified.
+
+        Args:
+            target_indices (Iterable[int]): The dense indices of the acceptable targets.
+
+        Returns:
+            Optional[bytearray]: A per-node bitmap (1 = cannot reach a target), or None if every
+                                 node can reach one, so that callers can skip the copy.
+        """
+        target_key = frozenset(target_indices)
+        if target_key in self._unproductive_cache:
+            return self._unproductive_cache[target_key]
+        unproductive_flags = self._compute_unproductive_flags(target_key)
+        if len(self._unproductive_cache) >= self.UNPRODUCTIVE_CACHE_LIMIT:
+            self._unproductive_cache.pop(next(iter(self._unproductive_cache)), None)
+        self._unproductive_cache[target_key] = unproductive_flags
+        return unproductive_flags
+
+    def _compute_unproductive_flags(self, target_indices: FrozenSet[int]) -> Optional[bytearray]:
+        """Sweeps the condensation for `unproductive_flags` (see there)."""
+        productive_components = bytearray(self.component_count)
+        for target_index in target_indices:
+            productive_components[self.component_of[target_index]] = 1
+        for component_index in range(self.component_count):
+            if productive_components[component_index]:
+                continue
+            for position in range(self.component_offsets[component_index], self.component_offsets[component_index + 1]):
+                if productive_components[self.component_targets[position]]:
+                    productive_components[component_index] = 1
+                    break
+
+        if all(productive_components):
+            return None
+        unproductive_flags = bytearray(self.node_count)
+        for component_index, productive in enumerate(productive_components):
+            if not productive:
+                for member_position in range(self.member_offsets[component_index], self.member_offsets[component_index + 1]):
+                    unproductive_flags[self.component_members[member_position]] = 1
+        return unproductive_flags
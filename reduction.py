@@ -0,0 +1,194 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+from __future__ import annotations
+
+from graph import Graph
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+# ---------------------------------------------------------------------------
+# Reduced Graph (Chain Contraction & Dead-End Pruning)
+# ---------------------------------------------------------------------------
+class ReducedGraph(Graph):
+    """
+    A smaller Graph equivalent to a source Graph for routing between its protected nodes.
+
+    Architectural Note:
+    Road-like maps are dominated by nodes no route ever branches at. Three rules, applied until
+    none fires, remove them (the origin, the destinations and any extra `protected_nodes` are
+    never removed):
+    1. Dead ends: a node that cannot reach any destination, a node without incoming edges, and a
+       spur node whose only neighbour (in both directions) is a single node u. A simple path can
+       never pass through a spur, since it would have to return to u.
+    2. One-way chains: a node with exactly one predecessor u and one successor w (u != w) is
+       replaced by the edge u -> w weighing the sum of both edges.
+    3. Two-way chains: a node whose predecessors and successors are the same two nodes u and w is
+       replaced by u -> w and w -> u in the same way.
+    When a contracted edge meets an existing edge between the same nodes, the cheaper one is kept
+    (the direct edge on a tie). Every contracted edge remembers its interior nodes, and
+    `expand_path` puts them back, so reported routes are routes of the source graph.
+
+    Route costs are preserved: CUS1 and AS find routes of the same cost as on the source graph
+    (exactly for integer weights; summing a chain first may round the last bit of fractional
+    ones). The engines still see a different graph, though: node counts drop, and methods that
+    are not cost-optimal (DFS, BFS, GBFS) may pick different routes, since BFS counts a contracted
+    chain as a single hop.
+
+    The result is tied to its protected nodes: pruning depends on the destinations, so queries to
+    other destinations need their own reduction.
+
+    Attributes:
+        source_graph (Graph): The unreduced graph.
+        contracted_interiors (Dict[Tuple[int, int], Tuple[int, ...]]): The interior node IDs of every
+                                                                       contracted edge (source, target).
+        removed_node_count (int): The number of source nodes no longer present.
+    """
+
+    def __init__(self, source_graph: Graph, protected_nodes: Optional[Iterable[int]] = None) -> None:
+        """
+        Reduces `source_graph` and builds the index of the result.
+
+        Args:
+            source_graph (Graph): A loaded Graph; it is not modified.
+            protected_nodes (Optional[Iterable[int]]): Extra node IDs to keep besides the origin and destinations.
+
+        Internal Variables:
+            outgoing_edges, incoming_edges (Dict[int, Dict[int, float]]): The working adjacency in both directions.
+            pending_nodes (List[int]): The worklist of nodes whose neighbourhood changed.
+        """
+        super().__init__()
+        self.source_graph = source_graph
+        self.contracted_interiors: Dict[Tuple[int, int], Tuple[int, ...]] = {}
+        self.origin = source_graph.origin
+        self.destinations = list(source_graph.destinations)
+
+        kept_nodes: Set[int] = set(self.destinations)
+        if self.origin is not None:
+            kept_nodes.add(self.origin)
+        if protected_nodes is not None:
+            kept_nodes.update(protected_nodes)
+
+        # Self-loops can never be part of a simple route, so they are dropped up front.
+        self._outgoing_edges: Dict[int, Dict[int, float]] = {node_id: {} for node_id in source_graph.node_ids}
+        self._incoming_edges: Dict[int, Dict[int, float]] = {node_id: {} for node_id in source_graph.node_ids}
+        for source_node, neighbors in source_graph.adjacency_list.items():
+            for target_node, edge_weight in neighbors.items():
+                if source_node != target_node:
+                    self._outgoing_edges[source_node][target_node] = edge_weight
+                    self._incoming_edges[target_node][source_node] = edge_weight
+
+        self._prune_unproductive_nodes(kept_nodes)
+        pending_nodes: List[int] = sorted(self._outgoing_edges)
+        while pending_nodes:
+            node_id = pending_nodes.pop()
+            if node_id in self._outgoing_edges and node_id not in kept_nodes:
+                pending_nodes.extend(self._reduce_node(node_id))
+
+        self.adjacency_list = {node_id: neighbors for node_id, neighbors in self._outgoing_edges.items() if neighbors}
+        self.node_coordinates = {
+            node_id: coordinates for node_id, coordinates in source_graph.node_coordinates.items() if node_id in self._outgoing_edges
+        }
+        self.removed_node_count = len(source_graph.node_ids) - len(self._outgoing_edges)
+        del self._outgoing_edges, self._incoming_edges
+        self.build_index()
+
+    # ---------------------------------------------------------------------------
+    # Reduction Rules
+    # ---------------------------------------------------------------------------
+    def _prune_unproductive_nodes(self, kept_nodes: Set[int]) -> None:
+        """
+        Removes every node that no reverse walk from a destination reaches, i.e. that cannot reach one.
+        """
+        productive_nodes: Set[int] = {node_id for node_id in self.destinations if node_id in self._incoming_edges}
+        pending_nodes = list(productive_nodes)
+        while pending_nodes:
+            for predecessor in self._incoming_edges[pending_nodes.pop()]:
+                if predecessor not in productive_nodes:
+                    productive_nodes.add(predecessor)
+                    pending_nodes.append(predecessor)
+
+        for node_id in list(self._outgoing_edges):
+            if node_id not in productive_nodes and node_id not in kept_nodes:
+                self._remove_node(node_id)
+
+    def _reduce_node(self, node_id: int) -> List[int]:
+        """
+        Applies the first matching rule to one unprotected node.
+
+        Returns:
+            List[int]: The neighbours whose neighbourhood changed (empty if no rule applied).
+        """
+        predecessors = self._incoming_edges[node_id]
+        successors = self._outgoing_edges[node_id]
+        neighbors = set(predecessors) | set(successors)
+
+        if not predecessors or len(neighbors) == 1:
+            self._remove_node(node_id)
+            return sorted(neighbors)
+
+        if len(predecessors) == 1 and len(successors) == 1 and len(neighbors) == 2:
+            (predecessor,), (successor,) = predecessors, successors
+            self._bypass(predecessor, node_id, successor)
+            self._remove_node(node_id)
+            return [predecessor, successor]
+
+        if len(neighbors) == 2 and set(predecessors) == set(successors) == neighbors:
+            first_neighbor, second_neighbor = sorted(neighbors)
+            self._bypass(first_neighbor, node_id, second_neighbor)
+            self._bypass(second_neighbor, node_id, first_neighbor)
+            self._remove_node(node_id)
+            return [first_neighbor, second_neighbor]
+
+        return []
+
+    def _bypass(self, source_node: int, interior_node: int, target_node: int) -> None:
+        """
+        Adds the edge source -> target standing for source -> interior -> target, unless an edge
+        between them that is at least as cheap already exists.
+        """
+        bypass_weight = self._outgoing_edges[source_node][interior_node] + self._outgoing_edges[interior_node][target_node]
+        existing_weight = self._outgoing_edges[source_node].get(target_node)
+        if existing_weight is not None and existing_weight <= bypass_weight:
+            return
+
+        self._outgoing_edges[source_node][target_node] = bypass_weight
+        self._incoming_edges[target_node][source_node] = bypass_weight
+        self.contracted_interiors[(source_node, target_node)] = (
+            self.contracted_interiors.get((source_node, interior_node), ())
+            + (interior_node,)
+            + self.contracted_interiors.get((interior_node, target_node), ())
+        )
+
+    def _remove_node(self, node_id: int) -> None:
+        """Deletes a node with all its edges (and the interiors recorded for them)."""
+        for successor in self._outgoing_edges.pop(node_id):
+            del self._incoming_edges[successor][node_id]
+            self.contracted_interiors.pop((node_id, successor), None)
+        for predecessor in self._incoming_edges.pop(node_id):
+            del self._outgoing_edges[predecessor][node_id]
+            self.contracted_interiors.pop((predecessor, node_id), None)
+
+    # ---------------------------------------------------------------------------
+    # Output Expansion
+    # ---------------------------------------------------------------------------
+    def expand_path(self, path_sequence: List[int]) -> List[int]:
+        """
+        Restores the interior nodes of every contracted edge along a route of the reduced graph.
+
+        Args:
+            path_sequence (List[int]): A route of node IDs on this graph.
+
+        Returns:
+            List[int]: The same route on the source graph.
+        """
+        if not path_sequence:
+            return []
+        expanded_path = [path_sequence[0]]
+        for source_node, target_node in zip(path_sequence, path_sequence[1:]):
+            expanded_path.extend(self.contracted_interiors.get((source_node, target_node), ()))
+            expanded_path.append(target_node)
+        return expanded_path
@@ -1,10 +1,19 @@
 # ---------------------------------------------------------------------------
 # Imports & Dependencies
 # ---------------------------------------------------------------------------
+from __future__ import annotations
+
 import sys
-from typing import List, Tuple, Optional
 from graph import Graph
+from graph_cache import GraphCache
 from engine import SearchEngine
+from models import SearchBudget, SearchOutcome
+from problem import SearchProblem
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, List, Tuple, Optional
+    from profiling import PhaseProfiler
 
 
 # ---------------------------------------------------------------------------
@@ -24,9 +33,32 @@ class SearchCLI:
        
     Attributes:
         SUPPORTED_ALGORITHMS (List[str]): The authoritative registry of valid search methods.
+        BUDGET_OPTIONS (Dict[str, Tuple[str, type]]): Maps each optional budget flag to the 
+                                                      SearchBudget field it sets and its value type.
+        NO_CACHE_FLAG (str): The switch that bypasses the on-disk graph cache (see `GraphCache`).
+        REDUCE_FLAG (str): The switch that searches a chain-contracted, dead-end-pruned graph (see `ReducedGraph`).
+        TRACE_OPTION (str): The option writing a binary expansion trace to the given file (see `ExpansionTrace`).
+        PROFILE_FLAG (str): The switch that profiles the parse, preprocess and solve phases (see `PhaseProfiler`).
+        CALIBRATE_FLAG (str): The switch that scales the heuristic by the graph's minimum weight-to-length ratio
+                              (see `calibrate_heuristic_scale`); it only applies to `CALIBRATED_ALGORITHMS`.
+        CALIBRATED_ALGORITHMS (Tuple[str, ...]): The methods that opt into the calibrated heuristic.
+        SUBOPTIMAL_NOTICE (str): The stderr line, followed by the proven bound, reported when a budget 
+                                 stopped an anytime search before its route was proven optimal.
     """
     
-    SUPPORTED_ALGORITHMS: List[str] = ["dfs", "bfs", "gbfs", "as", "cus1", "cus2"]
+    SUPPORTED_ALGORITHMS: List[str] = ["dfs", "bfs", "gbfs", "as", "cus1", "cus2", "ara"]
+    BUDGET_OPTIONS: Dict[str, Tuple[str, type]] = {
+        "--max-nodes": ("max_nodes_created", int),
+        "--time-limit": ("time_limit_seconds", float),
+        "--max-frontier": ("max_frontier_size", int),
+    }
+    NO_CACHE_FLAG: str = "--no-cache"
+    REDUCE_FLAG: str = "--reduce"
+    TRACE_OPTION: str = "--trace"
+    PROFILE_FLAG: str = "--profile"
+    CALIBRATE_FLAG: str = "--calibrate"
+    CALIBRATED_ALGORITHMS: Tuple[str, ...] = ("as", "cus2")
+    SUBOPTIMAL_NOTICE: str = "Suboptimal solution; cost at most this factor above the optimum:"
 
     @classmethod
     def execute(cls) -> None:
@@ -42,8 +74,7 @@ class SearchCLI:
         """
         # 1. Input Validation: Ensure the user provided the correct number of CLI arguments.
         if len(sys.argv) < 3:
-            print("Usage: python search.py <filepath> <method>")
-            print(f"Supported methods: {', '.join(cls.SUPPORTED_ALGORITHMS)}")
+            cls._print_usage()
             sys.exit(1)
 
         target_filepath: str = sys.argv[1]
@@ -55,21 +86,155 @@ class SearchCLI:
             print(f"Supported methods: {', '.join(cls.SUPPORTED_ALGORITHMS)}")
             sys.exit(1)
 
-        # 3. Environment Instantiation: Load the graph topology from disk into memory.
-        problem_graph = Graph()
+        # Optional cooperative limits (e.g. "--time-limit 2.5") follow the two positional arguments.
+        option_arguments = sys.argv[3:]
+        trace_filepath: Optional[str] = None
+        if cls.TRACE_OPTION in option_arguments:
+            trace_position = option_arguments.index(cls.TRACE_OPTION)
+            if trace_position + 1 >= len(option_arguments):
+                print(f"Error: Option '{cls.TRACE_OPTION}' expects a file path.")
+                sys.exit(1)
+            trace_filepath = option_arguments[trace_position + 1]
+            option_arguments = option_arguments[:trace_position] + option_arguments[trace_position + 2:]
+        use_graph_cache = cls.NO_CACHE_FLAG not in option_arguments
+        use_graph_reduction = cls.REDUCE_FLAG in option_arguments
+        use_profiling = cls.PROFILE_FLAG in option_arguments
+        use_calibration = cls.CALIBRATE_FLAG in option_arguments and target_method in cls.CALIBRATED_ALGORITHMS
+        search_budget = cls._parse_budget_options([
+            argument for argument in option_arguments 
+            if argument not in (cls.NO_CACHE_FLAG, cls.REDUCE_FLAG, cls.PROFILE_FLAG, cls.CALIBRATE_FLAG)
+        ])
+
+        # Optional profiling: every phase below runs under its own profiler (imported lazily).
+        phase_profiler = None
+        if use_profiling:
+            from profiling import PhaseProfiler
+            phase_profiler = PhaseProfiler(target_filepath, target_method)
+
+        # 3. Environment Instantiation: Load the graph topology from disk into memory, reusing the 
+        # parsed and indexed snapshot cached for this exact file content when one exists.
         try:
-            problem_graph.load_from_file(target_filepath)
+            problem_graph = cls._run_phase(phase_profiler, "parse", cls._load_graph, target_filepath, use_graph_cache)
         except Exception as file_exception:
             # Catch file-not-found or parsing errors to prevent ugly stack traces for the end-user
             print(f"Critical System Error: Failed to load graph topology. Details: {file_exception}")
             sys.exit(1)
 
-        # 4. Algorithmic Execution: Delegate the traversal to the SearchEngine.
-        search_engine = SearchEngine(problem_graph)
-        search_result = search_engine.solve(target_method)
+        # Optional preprocessing: search the reduced graph, then restore the contracted chain nodes 
+        # of every reported route. Imported lazily to keep it off the default startup path.
+        if use_graph_reduction:
+            from reduction import ReducedGraph
+            problem_graph = cls._run_phase(phase_profiler, "preprocess", ReducedGraph, problem_graph)
+
+        # Optional calibration: AS and CUS2 search with the Euclidean heuristic scaled by the 
+        # searched graph's minimum weight-to-length ratio (after any reduction).
+        search_problem = None
+        if use_calibration:
+            from calibration import calibrate_heuristic_scale
+            heuristic_scale = cls._run_phase(phase_profiler, "preprocess", calibrate_heuristic_scale, problem_graph)
+            search_problem = SearchProblem(problem_graph, problem_graph.origin, problem_graph.destinations, heuristic_scale)
+
+        # 4. Algorithmic Execution: Delegate the traversal to the SearchEngine, recording its events 
+        # when a trace file was requested (imported lazily, like the reduction).
+        expansion_trace = None
+        if trace_filepath is not None:
+            from expansion_trace import ExpansionTrace
+            expansion_trace = ExpansionTrace(path=trace_filepath)
+        search_engine = SearchEngine(problem_graph, search_problem, trace=expansion_trace)
+        try:
+            search_result = cls._run_phase(phase_profiler, "solve", search_engine.solve, target_method, search_budget)
+        finally:
+            if expansion_trace is not None:
+                expansion_trace.close()
+        if use_graph_reduction:
+            search_outcome = search_engine.search_outcome
+            search_outcome.path_sequence = problem_graph.expand_path(search_outcome.path_sequence)
+            search_outcome.best_path = problem_graph.expand_path(search_outcome.best_path)
+            if search_result is not None:
+                search_result = (search_result[0], search_result[1], search_outcome.path_sequence)
 
         # 5. Output Formatting: Serialize the results strictly according to assignment requirements.
-        cls._print_standardized_output(target_filepath, target_method, search_result)
+        if search_engine.search_outcome.status == "BUDGET_EXHAUSTED":
+            cls._print_partial_output(target_filepath, target_method, search_engine.search_outcome)
+        else:
+            cls._print_standardized_output(target_filepath, target_method, search_result)
+
+        # An anytime search ('ara') stopped by its budget returns its best route, which may not be 
+        # optimal; its proven bound goes to stderr, so the three-line stdout format stays intact.
+        suboptimality_bound = search_engine.search_outcome.suboptimality_bound
+        if suboptimality_bound is not None and suboptimality_bound > 1.0:
+            print(f"{cls.SUBOPTIMAL_NOTICE} {suboptimality_bound:.6g}", file=sys.stderr)
+
+        # Profile locations go to stderr, so the three-line stdout format stays intact.
+        if phase_profiler is not None:
+            for profile_path in phase_profiler.write():
+                print(f"Profile written to {profile_path}", file=sys.stderr)
+
+    @staticmethod
+    def _load_graph(filepath: str, use_graph_cache: bool) -> Graph:
+        """
+        Loads a map, through the on-disk graph cache unless it is disabled.
+        
+        Raises:
+            Exception: Whatever the file access or the parser raises.
+        """
+        if use_graph_cache:
+            return GraphCache().load(filepath)
+        problem_graph = Graph()
+        problem_graph.load_from_file(filepath)
+        return problem_graph
+
+    @staticmethod
+    def _run_phase(phase_profiler: Optional[PhaseProfiler], phase_name: str, phase_function: Callable[..., Any], *arguments: Any) -> Any:
+        """
+        Runs one phase of the pipeline, under the profiler when profiling is enabled.
+        
+        Args:
+            phase_profiler (Optional[PhaseProfiler]): The run's profiler, or None.
+            phase_name (str): 'parse', 'preprocess' or 'solve'.
+            phase_function (Callable): The phase itself; called with `arguments`.
+        """
+        if phase_profiler is None:
+            return phase_function(*arguments)
+        return phase_profiler.run(phase_name, phase_function, *arguments)
+
+    @classmethod
+    def _print_usage(cls) -> None:
+        """Prints the command syntax, the supported methods and the optional budget flags."""
+        print("Usage: python search.py <filepath> <method> [--max-nodes N] [--time-limit SECONDS] [--max-frontier N] [--no-cache] [--reduce] [--trace FILE] [--profile] [--calibrate]")
+        print(f"Supported methods: {', '.join(cls.SUPPORTED_ALGORITHMS)}")
+        print(f"Parsed maps are cached in {GraphCache.CACHE_DIRECTORY_NAME}/ next to each map (or ${GraphCache.CACHE_DIRECTORY_VARIABLE}); {cls.NO_CACHE_FLAG} skips the cache.")
+
+    @classmethod
+    def _parse_budget_options(cls, option_arguments: List[str]) -> Optional[SearchBudget]:
+        """
+        Parses the optional "--flag value" pairs into a SearchBudget.
+        
+        Args:
+            option_arguments (List[str]): The command-line arguments after <filepath> and <method>.
+            
+        Returns:
+            Optional[SearchBudget]: The requested limits, or None when no flag was given.
+        """
+        if not option_arguments:
+            return None
+
+        budget_fields: Dict[str, float] = {}
+        for position in range(0, len(option_arguments), 2):
+            flag = option_arguments[position]
+            if flag not in cls.BUDGET_OPTIONS or position + 1 >= len(option_arguments):
+                print(f"Error: Invalid option '{flag}'.")
+                cls._print_usage()
+                sys.exit(1)
+
+            field_name, value_type = cls.BUDGET_OPTIONS[flag]
+            try:
+                budget_fields[field_name] = value_type(option_arguments[position + 1])
+            except ValueError:
+                print(f"Error: Option '{flag}' expects a number.")
+                sys.exit(1)
+
+        return SearchBudget(**budget_fields)
 
     @staticmethod
     def _print_standardized_output(
@@ -109,6 +274,30 @@ class SearchCLI:
             print("No solution found.")
 
 
+    @staticmethod
+    def _print_partial_output(filepath: str, method: str, search_outcome: SearchOutcome) -> None:
+        """
+        Formats the output of a search that was stopped by its budget.
+        
+        Architectural Note:
+        This only occurs when a budget flag was passed, so the graded three-line schema of the 
+        default invocation is untouched. The same three-line shape is kept: the second line names 
+        the exhausted limit, the best node reached and the nodes created; the third line is the 
+        partial route to that node.
+        
+        Args:
+            filepath (str): The name/path of the tested graph file.
+            method (str): The algorithm utilized.
+            search_outcome (SearchOutcome): The 'BUDGET_EXHAUSTED' outcome reported by the engine.
+        """
+        print(f"{filepath} {method.upper()}")
+        print(
+            f"Search budget exhausted ({search_outcome.exhausted_limit}). "
+            f"Best node {search_outcome.best_node_id} after {search_outcome.total_nodes_created} nodes."
+        )
+        print(" ".join(map(str, search_outcome.best_path)))
+
+
 # ---------------------------------------------------------------------------
 # Application Entry Point
 # ---------------------------------------------------------------------------
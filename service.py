@@ -0,0 +1,373 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from graph import Graph
+from engine import SearchEngine
+from models import SearchBudget, SearchOutcome
+from search import SearchCLI
+
+
+logger = logging.getLogger("AsyncSearchService")
+
+
+# ---------------------------------------------------------------------------
+# Data Transfer Objects (DTOs)
+# ---------------------------------------------------------------------------
+class QueryResult(NamedTuple):
+    """
+    An immutable Data Transfer Object (DTO) describing the outcome of one asynchronous query.
+
+    Attributes:
+        filepath (str): The graph configuration file the query was evaluated against.
+        search_method (str): The search algorithm executed (e.g., 'dfs', 'as').
+        reached_goal_id (Optional[int]): The destination reached, or None if no route was returned.
+        total_nodes_created (int): The nodes-created metric reported by the SearchEngine (0 when unknown).
+        path_sequence (List[int]): The node IDs from origin to destination (empty if none).
+        execution_status (str): 'SUCCESS', 'No_Solution', 'TIMEOUT' or 'FAIL', mirroring the
+                                statuses reported by the benchmark runner.
+        execution_duration (float): The wall-clock time this caller waited, in seconds.
+    """
+    filepath: str
+    search_method: str
+    reached_goal_id: Optional[int]
+    total_nodes_created: int
+    path_sequence: List[int]
+    execution_status: str
+    execution_duration: float
+
+
+# ---------------------------------------------------------------------------
+# Worker Side
+# ---------------------------------------------------------------------------
+class _QueryCancelled(Exception):
+    """Unwinds a worker's search once the service has raised the computation's cancel flag."""
+
+
+class _CancellableSearchEngine(SearchEngine):
+    """
+    A SearchEngine that also polls its computation's shared cancel flag through the cooperative
+    budget hook.
+
+    Attributes:
+        cancel_slot (int): The computation's position in the pool's shared cancel flags.
+        CANCELLATION_POLL_INTERVAL (int): The number of expansions between two reads of the flag.
+    """
+
+    CANCELLATION_POLL_INTERVAL: int = 256
+
+    def __init__(self, graph: Any, cancel_slot: int) -> None:
+        super().__init__(graph)
+        self.cancel_slot = cancel_slot
+        self._expansions_until_poll = self.CANCELLATION_POLL_INTERVAL
+
+    def _enforce_budget(self, frontier_size: int) -> None:
+        super()._enforce_budget(frontier_size)
+        self._expansions_until_poll -= 1
+        if self._expansions_until_poll:
+            return
+        self._expansions_until_poll = self.CANCELLATION_POLL_INTERVAL
+        if _worker_cancel_flags[self.cancel_slot]:
+            raise _QueryCancelled()
+
+
+_worker_cancel_flags: Any = None
+
+
+def _initialize_worker(cancel_flags: Any) -> None:
+    """
+    A `ProcessPoolExecutor` initializer that attaches the worker to the service's cancel flags.
+
+    Args:
+        cancel_flags (Any): A shared byte array; a non-zero entry asks the computation in that slot to stop.
+    """
+    global _worker_cancel_flags
+    _worker_cancel_flags = cancel_flags
+
+
+def _solve_in_worker(filepath: str, search_method: str, cutoff_epoch: Optional[float], cancel_slot: Optional[int]) -> SearchOutcome:
+    """
+    Loads the graph and runs the search inside a pool process.
+
+    Architectural Note:
+    This must stay a module-level function so that the process pool can pickle a reference to it. 
+    The cutoff is an absolute wall-clock time (comparable across processes); whatever remains of it 
+    when the task actually starts becomes the engine's cooperative time budget, so a query that 
+    outlives its deadline stops inside the worker instead of occupying it. The cancel flag is 
+    polled the same way, so a query every caller has abandoned stops too.
+
+    Args:
+        filepath (str): The graph configuration file to load.
+        search_method (str): The algorithm to execute.
+        cutoff_epoch (Optional[float]): The `time.time()` value at which to give up (None = unlimited).
+        cancel_slot (Optional[int]): The computation's cancel flag (None = not cancellable once started).
+
+    Returns:
+        SearchOutcome: The engine's detailed outcome (status 'BUDGET_EXHAUSTED' when cut off, with 
+                       `exhausted_limit` 'cancelled' when abandoned).
+    """
+    search_budget = None
+    if cutoff_epoch is not None:
+        remaining_seconds = cutoff_epoch - time.time()
+        if remaining_seconds <= 0:
+            return SearchOutcome("BUDGET_EXHAUSTED", exhausted_limit="time_limit_seconds")
+        search_budget = SearchBudget(time_limit_seconds=remaining_seconds)
+
+    problem_graph = Graph()
+    problem_graph.load_from_file(filepath)
+    if cancel_slot is None:
+        search_engine = SearchEngine(problem_graph)
+    else:
+        if _worker_cancel_flags[cancel_slot]:
+            return SearchOutcome("BUDGET_EXHAUSTED", exhausted_limit="cancelled")
+        search_engine = _CancellableSearchEngine(problem_graph, cancel_slot)
+        # A non-None budget makes every algorithm loop call `_enforce_budget`, i.e. poll the flag.
+        search_budget = search_budget or SearchBudget()
+    try:
+        search_engine.solve(search_method, budget=search_budget)
+    except _QueryCancelled:
+        return SearchOutcome("BUDGET_EXHAUSTED", total_nodes_created=search_engine.total_nodes_created, exhausted_limit="cancelled")
+    return search_engine.search_outcome
+
+
+# ---------------------------------------------------------------------------
+# Asynchronous Query Front-End
+# ---------------------------------------------------------------------------
+class _InFlightQuery:
+    """
+    Book-keeping for one running computation that may be shared by several callers.
+
+    Attributes:
+        pool_future (Future): The process pool future performing the computation.
+        cutoff_epoch (float): The wall-clock time at which the worker abandons the search (inf = never).
+        cancel_slot (Optional[int]): The computation's shared cancel flag (None if every slot was taken).
+        waiter_count (int): The number of callers currently awaiting the result.
+    """
+
+    def __init__(self, pool_future: Future, cutoff_epoch: float, cancel_slot: Optional[int]) -> None:
+        self.pool_future = pool_future
+        self.cutoff_epoch = cutoff_epoch
+        self.cancel_slot = cancel_slot
+        self.waiter_count = 0
+
+
+class AsyncSearchService:
+    """
+    An asyncio front-end that dispatches CPU-bound `SearchEngine.solve` calls to a process pool.
+
+    Architectural Note:
+    Concurrent identical requests are coalesced: the first caller submits the computation and every
+    later caller with the same key awaits the same pool future. The key is the file's absolute path,
+    modification time and size, so an edited map is not answered from a stale computation, unless an
+    in-place edit keeps the size and lands within the file system's mtime granularity. Copies of
+    a map under different paths are computed separately.
+
+    Each caller awaits the shared result through `asyncio.shield`, so one caller's deadline or
+    cancellation never cancels the work for the others. When the last interested caller leaves,
+    the pool future is cancelled; a computation that has not started yet is therefore dropped
+    instead of occupying a worker for nobody. A computation that is already running gets its
+    shared cancel flag raised instead: every computation holds one of `CANCEL_SLOT_COUNT` slots of
+    a shared byte array, which the worker's engine polls through the cooperative budget hook, so
+    it stops within a few hundred expansions. A slot is only reused once its computation has
+    finished. The deadline also travels into the engine as a `SearchBudget`, so a running
+    computation stops by itself at the cutoff.
+    Callers always join the running computation, even if its cutoff is earlier than their own 
+    deadline; a caller whose shared computation is cut off while it still has time left simply 
+    re-submits with its own cutoff.
+
+    Attributes:
+        executor (ProcessPoolExecutor): The pool running the searches.
+        default_deadline_seconds (Optional[float]): The deadline applied when a query supplies none.
+        in_flight_queries (Dict[Tuple, _InFlightQuery]): The running computations by coalescing key.
+        CANCEL_SLOT_COUNT (int): The number of shared cancel flags; further concurrent computations
+                                 run without one and can only be cancelled before they start.
+    """
+
+    CANCEL_SLOT_COUNT: int = 1024
+
+    def __init__(self, max_workers: Optional[int] = None, default_deadline_seconds: Optional[float] = None) -> None:
+        """
+        Initializes the service and its process pool.
+
+        Args:
+            max_workers (Optional[int]): The number of pool processes (defaults to the CPU count).
+            default_deadline_seconds (Optional[float]): The per-query deadline used when none is given.
+        """
+        self._cancel_flags = multiprocessing.Array("b", self.CANCEL_SLOT_COUNT, lock=False)
+        self._free_cancel_slots: List[int] = list(range(self.CANCEL_SLOT_COUNT))
+        self.executor = ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_initialize_worker, initargs=(self._cancel_flags,)
+        )
+        self.default_deadline_seconds = default_deadline_seconds
+        self.in_flight_queries: Dict[Tuple, _InFlightQuery] = {}
+
+    async def __aenter__(self) -> "AsyncSearchService":
+        return self
+
+    async def __aexit__(self, *exception_details: object) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Cancels queued and running work and shuts the process pool down without blocking the event loop."""
+        for in_flight_query in self.in_flight_queries.values():
+            self._cancel_computation(in_flight_query)
+        self.in_flight_queries.clear()
+        await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
+
+    def _build_query_key(self, filepath: str, search_method: str) -> Tuple:
+        """
+        Derives the coalescing key for a request.
+
+        Args:
+            filepath (str): The graph configuration file.
+            search_method (str): The normalized algorithm identifier.
+
+        Returns:
+            Tuple: (absolute path, method, mtime_ns, size); a missing file keys on the path alone so
+                   that the worker reports the error.
+        """
+        absolute_path = os.path.abspath(filepath)
+        try:
+            file_status = os.stat(absolute_path)
+        except OSError:
+            return absolute_path, search_method, None, None
+        return absolute_path, search_method, file_status.st_mtime_ns, file_status.st_size
+
+    def _acquire_query(self, query_key: Tuple, filepath: str, search_method: str, cutoff_epoch: float) -> _InFlightQuery:
+        """
+        Joins the running computation for `query_key`, or submits a new one.
+
+        Args:
+            query_key (Tuple): The coalescing key from `_build_query_key`.
+            filepath (str): The graph configuration file.
+            search_method (str): The normalized algorithm identifier.
+            cutoff_epoch (float): The caller's absolute deadline (inf = none).
+
+        Returns:
+            _InFlightQuery: The shared computation, with this caller already counted as a waiter.
+        """
+        in_flight_query = self.in_flight_queries.get(query_key)
+
+        # A finished entry may linger until its clean-up callback runs; never join it.
+        if in_flight_query is None or in_flight_query.pool_future.done():
+            worker_cutoff = None if cutoff_epoch == float("inf") else cutoff_epoch
+            cancel_slot = self._free_cancel_slots.pop() if self._free_cancel_slots else None
+            if cancel_slot is not None:
+                self._cancel_flags[cancel_slot] = 0
+            pool_future = self.executor.submit(_solve_in_worker, filepath, search_method, worker_cutoff, cancel_slot)
+            in_flight_query = _InFlightQuery(pool_future, cutoff_epoch, cancel_slot)
+            self.in_flight_queries[query_key] = in_flight_query
+
+            loop = asyncio.get_running_loop()
+            pool_future.add_done_callback(
+                lambda _: self._schedule_finish(loop, query_key, in_flight_query)
+            )
+
+        in_flight_query.waiter_count += 1
+        return in_flight_query
+
+    def _release_query(self, query_key: Tuple, in_flight_query: _InFlightQuery) -> None:
+        """
+        Removes one waiter. The last waiter to leave an unfinished computation cancels it.
+        """
+        in_flight_query.waiter_count -= 1
+        if in_flight_query.waiter_count == 0 and not in_flight_query.pool_future.done():
+            self._cancel_computation(in_flight_query)
+            self._forget_query(query_key, in_flight_query)
+
+    def _cancel_computation(self, in_flight_query: _InFlightQuery) -> None:
+        """Drops a queued computation, or raises the cancel flag of one a worker is already running."""
+        if not in_flight_query.pool_future.cancel() and in_flight_query.cancel_slot is not None:
+            self._cancel_flags[in_flight_query.cancel_slot] = 1
+
+    def _schedule_finish(self, loop: asyncio.AbstractEventLoop, query_key: Tuple, in_flight_query: _InFlightQuery) -> None:
+        """
+        Hands the clean-up of a finished computation back to the event loop thread. The pool
+        invokes this from its own thread, possibly after the loop has already been closed.
+        """
+        try:
+            loop.call_soon_threadsafe(self._finish_query, query_key, in_flight_query)
+        except RuntimeError:
+            pass
+
+    def _finish_query(self, query_key: Tuple, in_flight_query: _InFlightQuery) -> None:
+        """Returns a finished computation's cancel slot to the pool and drops it from the coalescing table."""
+        if in_flight_query.cancel_slot is not None:
+            self._free_cancel_slots.append(in_flight_query.cancel_slot)
+            in_flight_query.cancel_slot = None
+        self._forget_query(query_key, in_flight_query)
+
+    def _forget_query(self, query_key: Tuple, in_flight_query: _InFlightQuery) -> None:
+        """Drops a finished or abandoned computation from the coalescing table."""
+        if self.in_flight_queries.get(query_key) is in_flight_query:
+            del self.in_flight_queries[query_key]
+
+    async def solve(self, filepath: str, search_method: str, deadline_seconds: Optional[float] = None) -> QueryResult:
+        """
+        Answers one routing query asynchronously.
+
+        Args:
+            filepath (str): The graph configuration file.
+            search_method (str): The algorithm acronym (e.g., 'as').
+            deadline_seconds (Optional[float]): The maximum time to wait; falls back to the service default.
+
+        Returns:
+            QueryResult: The outcome. Exceeding the deadline yields a 'TIMEOUT' status instead of raising; 
+                         an unknown method or an unreadable file yields 'FAIL'.
+
+        Raises:
+            asyncio.CancelledError: If the awaiting task is cancelled. The shared computation is
+                                    released (and cancelled if nobody else is waiting).
+        """
+        normalized_method = search_method.lower()
+        effective_deadline = deadline_seconds if deadline_seconds is not None else self.default_deadline_seconds
+        start_time_counter = time.perf_counter()
+
+        # The engine answers an unknown method with "no route", which would read as a property of the map.
+        if normalized_method not in SearchCLI.SUPPORTED_ALGORITHMS:
+            logger.error(f"Unknown search method '{search_method}' for {filepath}")
+            return QueryResult(filepath, normalized_method, None, 0, [], "FAIL", time.perf_counter() - start_time_counter)
+
+        cutoff_epoch = float("inf") if effective_deadline is None else time.time() + effective_deadline
+
+        query_key = self._build_query_key(filepath, normalized_method)
+
+        while True:
+            in_flight_query = self._acquire_query(query_key, filepath, normalized_method, cutoff_epoch)
+            remaining_seconds = None if effective_deadline is None else max(0.0, cutoff_epoch - time.time())
+
+            try:
+                search_outcome = await asyncio.wait_for(
+                    asyncio.shield(asyncio.wrap_future(in_flight_query.pool_future)),
+                    timeout=remaining_seconds,
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"Deadline exceeded ({effective_deadline}s) for {normalized_method.upper()} on {filepath}")
+                return QueryResult(filepath, normalized_method, None, 0, [], "TIMEOUT", time.perf_counter() - start_time_counter)
+            except Exception as query_exception:
+                logger.error(f"Query failed for {normalized_method.upper()} on {filepath}: {query_exception}")
+                return QueryResult(filepath, normalized_method, None, 0, [], "FAIL", time.perf_counter() - start_time_counter)
+            finally:
+                self._release_query(query_key, in_flight_query)
+
+            # A shared computation with an earlier cutoff than ours gave up; retry under our own deadline.
+            if search_outcome.status != "BUDGET_EXHAUSTED" or in_flight_query.cutoff_epoch >= cutoff_epoch:
+                break
+
+        elapsed_duration = time.perf_counter() - start_time_counter
+        if search_outcome.status == "BUDGET_EXHAUSTED":
+            # The worker hit the cutoff just before the event loop did; report it the same way.
+            logger.warning(f"Deadline exceeded ({effective_deadline}s) for {normalized_method.upper()} on {filepath}")
+            return QueryResult(filepath, normalized_method, None, search_outcome.total_nodes_created, [], "TIMEOUT", elapsed_duration)
+
+        return QueryResult(
+            filepath, normalized_method, search_outcome.reached_goal_id, search_outcome.total_nodes_created, 
+            search_outcome.path_sequence, search_outcome.status, elapsed_duration
+        )
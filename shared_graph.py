@@ -0,0 +1,231 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+import sys
+from array import array
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+from graph import Graph, ReadOnlyGraphView
+
+
+# ---------------------------------------------------------------------------
+# Data Transfer Objects (DTOs)
+# ---------------------------------------------------------------------------
+class SharedArrayLayout(NamedTuple):
+    """
+    The position of one array inside the shared memory block.
+
+    Attributes:
+        attribute_name (str): The Graph attribute the array mirrors (e.g., 'adjacency_targets').
+        typecode (str): The `array`/`memoryview` format code ('q', 'd' or 'B').
+        byte_offset (int): The 8-byte aligned start of the array within the block.
+        item_count (int): The number of elements.
+    """
+    attribute_name: str
+    typecode: str
+    byte_offset: int
+    item_count: int
+
+
+class SharedGraphHandle(NamedTuple):
+    """
+    The small, picklable description a worker needs to attach to a published graph.
+
+    Attributes:
+        memory_name (str): The name of the `SharedMemory` block.
+        array_layouts (Tuple[SharedArrayLayout, ...]): Where each array lives in the block.
+        origin (Optional[int]): The origin node ID.
+        destinations (List[int]): The destination node IDs, in file order.
+    """
+    memory_name: str
+    array_layouts: Tuple[SharedArrayLayout, ...]
+    origin: Optional[int]
+    destinations: List[int]
+
+
+# ---------------------------------------------------------------------------
+# Publishing (Owner Process)
+# ---------------------------------------------------------------------------
+class SharedGraphPublisher:
+    """
+    Copies a loaded Graph's array-backed data into one `multiprocessing.shared_memory` block.
+
+    Architectural Note:
+    Only the flat topology arrays the engines read are published: the sorted node IDs, the CSR
+    offsets, targets and weights, and the coordinates. The goal bitmap belongs to a query (see
+    `SearchProblem`) and is rebuilt per process. The dictionaries kept for parsing
+    (`adjacency_list`, `node_coordinates`, `node_index`) stay behind; the attached view answers
+    the same questions from the arrays. Each array starts on an 8-byte boundary so that it can be
+    reinterpreted in place with `memoryview.cast`.
+
+    The publisher owns the block: it must outlive every attached worker, and `close()` (or leaving
+    the `with` block) unlinks it.
+
+    Attributes:
+        shared_block (SharedMemory): The published block.
+        handle (SharedGraphHandle): The picklable attach description to send to workers.
+    """
+
+    PUBLISHED_ARRAYS: Tuple[Tuple[str, str], ...] = (
+        ("node_ids", "q"),
+        ("adjacency_offsets", "q"),
+        ("adjacency_targets", "q"),
+        ("adjacency_weights", "d"),
+        ("coordinate_x", "d"),
+        ("coordinate_y", "d"),
+    )
+
+    def __init__(self, graph: Graph) -> None:
+        """
+        Publishes `graph`.
+
+        Args:
+            graph (Graph): A Graph whose index has been built.
+
+        Internal Variables:
+            source_arrays (List[array]): The typed copies of every published attribute.
+            array_layouts (List[SharedArrayLayout]): The computed placement of each array.
+        """
+        source_arrays: List[array] = [
+            array(typecode, getattr(graph, attribute_name)) for attribute_name, typecode in self.PUBLISHED_ARRAYS
+        ]
+
+        array_layouts: List[SharedArrayLayout] = []
+        byte_offset = 0
+        for (attribute_name, typecode), source_array in zip(self.PUBLISHED_ARRAYS, source_arrays):
+            array_layouts.append(SharedArrayLayout(attribute_name, typecode, byte_offset, len(source_array)))
+            byte_offset += (len(source_array) * source_array.itemsize + 7) // 8 * 8
+
+        self.shared_block = shared_memory.SharedMemory(create=True, size=max(byte_offset, 1))
+        for array_layout, source_array in zip(array_layouts, source_arrays):
+            source_bytes = memoryview(source_array).cast("B")
+            self.shared_block.buf[array_layout.byte_offset:array_layout.byte_offset + len(source_bytes)] = source_bytes
+            source_bytes.release()
+
+        self.handle = SharedGraphHandle(self.shared_block.name, tuple(array_layouts), graph.origin, list(graph.destinations))
+
+    def __enter__(self) -> "SharedGraphPublisher":
+        return self
+
+    def __exit__(self, *exception_details: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Detaches from and destroys the block. Workers must have detached first."""
+        self.shared_block.close()
+        self.shared_block.unlink()
+
+
+# ---------------------------------------------------------------------------
+# Attached Read-Only View (Worker Processes)
+# ---------------------------------------------------------------------------
+class SharedGraph(ReadOnlyGraphView):
+    """
+    A zero-copy, read-only Graph view over a block published by `SharedGraphPublisher`.
+
+    Architectural Note:
+    Every array attribute is a read-only `memoryview` cast onto the shared block, so attaching
+    costs no copy and any number of workers share one physical copy of the topology. The views
+    support exactly the operations the engines use (indexing, slicing, `len`, iteration and
+    binary search), so `SearchEngine` runs on this class unchanged. ID lookups use a binary
+    search over the sorted node IDs instead of a per-process dictionary, and queries are the same
+    `SearchProblem` objects as on a Graph, so results are identical to the source Graph. The
+    lookups, neighbour listing and the publisher's query (rebuilt in this process) come from
+    `ReadOnlyGraphView`.
+
+    Attributes:
+        node_ids, adjacency_offsets, adjacency_targets, adjacency_weights,
+        coordinate_x, coordinate_y (memoryview): The shared arrays.
+    """
+
+    def __init__(self, handle: SharedGraphHandle) -> None:
+        """
+        Attaches to a published block.
+
+        Args:
+            handle (SharedGraphHandle): The description produced by the publisher.
+
+        Raises:
+            FileNotFoundError: If the block no longer exists.
+        """
+        self._shared_block = _attach_untracked(handle.memory_name)
+        self._block_view = self._shared_block.buf.toreadonly()
+        self._array_views: List[memoryview] = []
+
+        for array_layout in handle.array_layouts:
+            item_size = array(array_layout.typecode).itemsize
+            byte_stop = array_layout.byte_offset + array_layout.item_count * item_size
+            array_view = self._block_view[array_layout.byte_offset:byte_stop].cast(array_layout.typecode)
+            self._array_views.append(array_view)
+            setattr(self, array_layout.attribute_name, array_view)
+
+        self._attach_default_query(handle.origin, handle.destinations)
+
+    def __enter__(self) -> "SharedGraph":
+        return self
+
+    def __exit__(self, *exception_details: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Releases every view and detaches from the block (the publisher remains responsible for
+        destroying it). The graph must not be used afterwards.
+        """
+        for array_view in self._array_views:
+            array_view.release()
+        self._array_views.clear()
+        self._block_view.release()
+        self._shared_block.close()
+
+
+def _attach_untracked(memory_name: str) -> shared_memory.SharedMemory:
+    """
+    Attaches to an existing block without registering it with a resource tracker.
+
+    Architectural Note:
+    Before Python 3.13, merely attaching registers the block with the resource tracker. A worker
+    with a tracker of its own would then unlink the block on exit, destroying it for the publisher
+    and every other worker, while unregistering afterwards would corrupt the bookkeeping of a
+    tracker shared with the publisher. Python 3.13 exposes `track=False`; on older versions the
+    registration is skipped for the duration of the attach.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=memory_name, track=False)
+
+    original_register = resource_tracker.register
+    resource_tracker.register = lambda *_: None  # type: ignore[assignment]
+    try:
+        return shared_memory.SharedMemory(name=memory_name)
+    finally:
+        resource_tracker.register = original_register  # type: ignore[assignment]
+
+
+# ---------------------------------------------------------------------------
+# Process Pool Integration
+# ---------------------------------------------------------------------------
+_worker_graph: Optional[SharedGraph] = None
+
+
+def initialize_worker(handle: SharedGraphHandle) -> None:
+    """
+    A `ProcessPoolExecutor` initializer that attaches the worker to the published graph once.
+
+    Args:
+        handle (SharedGraphHandle): The publisher's handle (passed through `initargs`).
+    """
+    global _worker_graph
+    _worker_graph = SharedGraph(handle)
+
+
+def worker_graph() -> Any:
+    """
+    Returns the graph attached by `initialize_worker` in the current worker process.
+
+    Raises:
+        RuntimeError: If the pool was created without `initialize_worker`.
+    """
+    if _worker_graph is None:
+        raise RuntimeError("This process was not initialized with shared_graph.initialize_worker.")
+    return _worker_graph
@@ -0,0 +1,146 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+import os
+import random
+import sys
+import sysconfig
+import time
+import logging
+from typing import Callable, List, NamedTuple
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from batch import BatchQuery, BatchResult, SharedMemoryBatchExecutor, ThreadedBatchExecutor, is_gil_enabled, solve_batch_query
+from factory import build_grid_graph
+from graph import Graph
+
+
+# ---------------------------------------------------------------------------
+# Configuration & Telemetry Setup
+# ---------------------------------------------------------------------------
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger("BatchBenchmark")
+
+
+# ---------------------------------------------------------------------------
+# Data Transfer Objects (DTOs)
+# ---------------------------------------------------------------------------
+class ThroughputMeasurement(NamedTuple):
+    """
+    An immutable Data Transfer Object (DTO) holding the throughput of one execution strategy.
+
+    Attributes:
+        strategy_name (str): A label such as 'threads x4' or 'processes x4'.
+        batch_duration (float): The wall-clock time for the whole batch, in seconds.
+        queries_per_second (float): The batch size divided by `batch_duration`.
+        results_match (bool): Whether every outcome equals the sequential reference.
+    """
+    strategy_name: str
+    batch_duration: float
+    queries_per_second: float
+    results_match: bool
+
+
+# ---------------------------------------------------------------------------
+# Batch Throughput Benchmark
+# ---------------------------------------------------------------------------
+class BatchBenchmark:
+    """
+    Compares the throughput of a query batch on one shared graph: sequentially, with
+    `ThreadedBatchExecutor` and with the shared-memory process pool.
+
+    Architectural Note:
+    The graph is a generated square grid with jittered edge weights, so queries cover long routes
+    and every strategy answers exactly the same batch. Each strategy's outcomes are compared with
+    the sequential run, which doubles as a thread-safety check. On a standard build the threaded
+    numbers are expected to match the sequential ones (the GIL serializes the searches); on a
+    free-threaded build (e.g. `python3.13t`) they should scale with the worker count. Run the
+    script under both interpreters to compare them.
+
+    Attributes:
+        grid_width (int): The side length of the generated grid (grid_width² nodes).
+        query_count (int): The number of queries in the batch.
+        worker_counts (List[int]): The pool sizes to measure.
+        search_method (str): The algorithm every query runs.
+    """
+
+    def __init__(self, grid_width: int = 120, query_count: int = 64, worker_counts: List[int] = None, search_method: str = "as") -> None:
+        self.grid_width = grid_width
+        self.query_count = query_count
+        self.worker_counts = worker_counts or sorted({1, 2, 4, os.cpu_count() or 1})
+        self.search_method = search_method
+
+    def _build_queries(self, problem_graph: Graph) -> List[BatchQuery]:
+        """Draws a reproducible batch of origin / destination-set queries."""
+        query_generator = random.Random(11)
+        return [
+            BatchQuery(
+                query_generator.choice(problem_graph.node_ids),
+                query_generator.sample(problem_graph.node_ids, query_generator.randint(1, 3)),
+                self.search_method,
+            )
+            for _ in range(self.query_count)
+        ]
+
+    @staticmethod
+    def _time_batch(strategy_name: str, run_batch: Callable[[], List[BatchResult]], reference_results: List[BatchResult]) -> ThroughputMeasurement:
+        """Runs one strategy and compares its outcomes with the sequential reference."""
+        start_time_counter = time.perf_counter()
+        batch_results = run_batch()
+        batch_duration = time.perf_counter() - start_time_counter
+
+        results_match = [batch_result.search_outcome for batch_result in batch_results] == [
+            reference_result.search_outcome for reference_result in reference_results
+        ]
+        return ThroughputMeasurement(strategy_name, batch_duration, len(batch_results) / batch_duration, results_match)
+
+    def run(self) -> List[ThroughputMeasurement]:
+        """
+        Executes every strategy and logs a comparison table.
+
+        Returns:
+            List[ThroughputMeasurement]: The sequential run first, then threads and processes per pool size.
+        """
+        free_threaded_build = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+        logger.info(f"Python {sys.version.split()[0]}, free-threaded build: {free_threaded_build}, GIL enabled: {is_gil_enabled()}")
+
+        problem_graph = build_grid_graph(self.grid_width)
+        batch_queries = self._build_queries(problem_graph)
+        logger.info(f"{self.grid_width ** 2} nodes, {len(batch_queries)} '{self.search_method}' queries")
+
+        start_time_counter = time.perf_counter()
+        reference_results = [solve_batch_query(problem_graph, batch_query) for batch_query in batch_queries]
+        sequential_duration = time.perf_counter() - start_time_counter
+        measurements = [ThroughputMeasurement("sequential", sequential_duration, len(batch_queries) / sequential_duration, True)]
+
+        for worker_count in self.worker_counts:
+            with ThreadedBatchExecutor(problem_graph, max_workers=worker_count) as thread_executor:
+                measurements.append(self._time_batch(f"threads x{worker_count}", lambda: thread_executor.run(batch_queries), reference_results))
+            # Pool start-up (process creation and attaching) is excluded, as in a long-running service.
+            with SharedMemoryBatchExecutor(problem_graph, max_workers=worker_count) as process_executor:
+                process_executor.run(batch_queries[:worker_count])
+                measurements.append(self._time_batch(f"processes x{worker_count}", lambda: process_executor.run(batch_queries), reference_results))
+
+        for measurement in measurements:
+            logger.info(
+                f"{measurement.strategy_name:<14} {measurement.batch_duration:8.3f} s "
+                f"{measurement.queries_per_second:8.1f} q/s "
+                f"speed-up {sequential_duration / measurement.batch_duration:5.2f} "
+                f"{'OK' if measurement.results_match else 'MISMATCH'}"
+            )
+        return measurements
+
+
+# ---------------------------------------------------------------------------
+# Application Entry Point
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    batch_benchmark = BatchBenchmark()
+    benchmark_measurements = batch_benchmark.run()
+    sys.exit(0 if all(measurement.results_match for measurement in benchmark_measurements) else 1)
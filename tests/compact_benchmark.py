@@ -0,0 +1,166 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+import random
+import sys
+import time
+import tracemalloc
+import logging
+from typing import List, NamedTuple, Optional, Tuple
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from compact_graph import CompactGraph
+from engine import SearchEngine
+from factory import build_grid_graph
+from graph import Graph
+from problem import SearchProblem
+
+
+# ---------------------------------------------------------------------------
+# Configuration & Telemetry Setup
+# ---------------------------------------------------------------------------
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger("CompactBenchmark")
+
+SEARCH_METHODS: List[str] = ["dfs", "bfs", "gbfs", "as", "cus1", "cus2", "ara"]
+PRECISIONS: List[Tuple[str, str]] = [("float32", "int32"), ("float64", "int32"), ("float64", "int64")]
+
+
+# ---------------------------------------------------------------------------
+# Data Transfer Objects (DTOs)
+# ---------------------------------------------------------------------------
+class StorageMeasurement(NamedTuple):
+    """
+    An immutable Data Transfer Object (DTO) holding the footprint and speed of one storage mode.
+
+    Attributes:
+        storage_name (str): A label such as 'Graph' or 'float32/int32'.
+        retained_bytes (int): The memory the loaded graph keeps alive, measured with tracemalloc.
+        search_duration (float): The wall-clock time of the A* query batch, in seconds.
+        results_match (bool): Whether every outcome equals the one on the full `Graph`.
+    """
+    storage_name: str
+    retained_bytes: int
+    search_duration: float
+    results_match: bool
+
+
+# ---------------------------------------------------------------------------
+# Compact Storage Benchmark
+# ---------------------------------------------------------------------------
+class CompactBenchmark:
+    """
+    Verifies that `CompactGraph` answers exactly like `Graph`, then compares their memory footprint.
+
+    Architectural Note:
+    The conformance pass runs every method on every supplied test map, in every precision the map
+    is accepted for, and requires identical (goal, node count, path) outcomes. This covers the
+    isclose tie-breaks (T04_TieBreak) and zero-cost edges (T10_ZeroCost). The footprint pass
+    then loads a generated grid with integer weights, which fits float32, and measures what each
+    representation keeps alive, along with the time of a fixed A* query batch.
+
+    Attributes:
+        case_directory (Path): The directory of the supplied test maps.
+        grid_width (int): The side length of the generated grid (grid_width² nodes).
+        query_count (int): The number of A* queries timed on each representation.
+    """
+
+    def __init__(self, case_directory: Path = Path(__file__).parent / "cases", grid_width: int = 200, query_count: int = 20) -> None:
+        self.case_directory = case_directory
+        self.grid_width = grid_width
+        self.query_count = query_count
+
+    def verify_test_cases(self) -> bool:
+        """
+        Runs every method on every test map on both representations.
+
+        Returns:
+            bool: True if every outcome matched.
+        """
+        case_paths = sorted(self.case_directory.glob("*.txt")) + [Path(__file__).parent.parent / "PathFinder-test.txt"]
+        all_match = True
+        for case_path in case_paths:
+            reference_graph = Graph()
+            reference_graph.load_from_file(str(case_path))
+            reference_outcomes = [SearchEngine(reference_graph).solve(search_method) for search_method in SEARCH_METHODS]
+            for float_type, integer_type in PRECISIONS:
+                try:
+                    compact_graph = CompactGraph(reference_graph, float_type, integer_type)
+                except ValueError as precision_error:
+                    logger.info(f"{case_path.stem:<18} {float_type}/{integer_type}: rejected ({precision_error})")
+                    continue
+                compact_outcomes = [SearchEngine(compact_graph).solve(search_method) for search_method in SEARCH_METHODS]
+                mismatched_methods = [
+                    search_method for search_method, reference_outcome, compact_outcome
+                    in zip(SEARCH_METHODS, reference_outcomes, compact_outcomes) if reference_outcome != compact_outcome
+                ]
+                if mismatched_methods:
+                    all_match = False
+                    logger.error(f"{case_path.stem:<18} {float_type}/{integer_type}: MISMATCH in {', '.join(mismatched_methods)}")
+        logger.info(f"Conformance over {len(case_paths)} maps x {len(SEARCH_METHODS)} methods: {'OK' if all_match else 'FAILED'}")
+        return all_match
+
+    def _time_queries(self, problem_graph, reference_outcomes: Optional[List]) -> Tuple[float, bool, List]:
+        """Runs the fixed A* batch; returns its duration, whether it matched the reference, and its outcomes."""
+        query_generator = random.Random(11)
+        node_count = self.grid_width ** 2
+        queries = [(query_generator.randint(1, node_count), query_generator.randint(1, node_count)) for _ in range(self.query_count)]
+
+        start_time_counter = time.perf_counter()
+        outcomes = [
+            SearchEngine(problem_graph, SearchProblem(problem_graph, origin, [destination])).solve("as")
+            for origin, destination in queries
+        ]
+        search_duration = time.perf_counter() - start_time_counter
+        return search_duration, reference_outcomes is None or outcomes == reference_outcomes, outcomes
+
+    def measure_footprint(self) -> List[StorageMeasurement]:
+        """
+        Measures the retained memory and query time of the full Graph and of each compact mode.
+
+        Returns:
+            List[StorageMeasurement]: The full Graph first, then one entry per precision.
+        """
+        tracemalloc.start()
+        baseline_bytes = tracemalloc.get_traced_memory()[0]
+        reference_graph = build_grid_graph(self.grid_width, corner_query=True)
+        graph_bytes = tracemalloc.get_traced_memory()[0] - baseline_bytes
+        tracemalloc.stop()
+
+        reference_duration, _, reference_outcomes = self._time_queries(reference_graph, None)
+        measurements = [StorageMeasurement("Graph", graph_bytes, reference_duration, True)]
+
+        for float_type, integer_type in PRECISIONS:
+            tracemalloc.start()
+            baseline_bytes = tracemalloc.get_traced_memory()[0]
+            compact_graph = CompactGraph(reference_graph, float_type, integer_type)
+            compact_bytes = tracemalloc.get_traced_memory()[0] - baseline_bytes
+            tracemalloc.stop()
+            search_duration, results_match, _ = self._time_queries(compact_graph, reference_outcomes)
+            measurements.append(StorageMeasurement(f"{float_type}/{integer_type}", compact_bytes, search_duration, results_match))
+
+        logger.info(f"{self.grid_width ** 2} nodes, {len(reference_graph.adjacency_targets)} edges, {self.query_count} A* queries")
+        for measurement in measurements:
+            logger.info(
+                f"{measurement.storage_name:<16} {measurement.retained_bytes / 1e6:8.2f} MB "
+                f"({measurement.retained_bytes / graph_bytes:6.1%}) "
+                f"{measurement.search_duration:7.3f} s "
+                f"{'OK' if measurement.results_match else 'MISMATCH'}"
+            )
+        return measurements
+
+
+# ---------------------------------------------------------------------------
+# Application Entry Point
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    compact_benchmark = CompactBenchmark()
+    cases_match = compact_benchmark.verify_test_cases()
+    footprint_measurements = compact_benchmark.measure_footprint()
+    sys.exit(0 if cases_match and all(measurement.results_match for measurement in footprint_measurements) else 1)
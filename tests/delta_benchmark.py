@@ -0,0 +1,135 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+import random
+import sys
+import time
+import logging
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from delta_stepping import DeltaSteppingEngine
+from engine import SearchEngine
+from factory import build_grid_graph
+from graph import Graph
+from problem import SearchProblem
+
+
+# ---------------------------------------------------------------------------
+# Configuration & Telemetry Setup
+# ---------------------------------------------------------------------------
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger("DeltaSteppingBenchmark")
+
+
+# ---------------------------------------------------------------------------
+# Data Transfer Objects (DTOs)
+# ---------------------------------------------------------------------------
+class DistanceMeasurement(NamedTuple):
+    """
+    An immutable Data Transfer Object (DTO) comparing delta-stepping with CUS1 on one grid and delta.
+
+    Attributes:
+        grid_label (str): A label such as 'integer 100x100'.
+        delta_label (str): The bucket width used ('default' = the mean edge weight).
+        delta_duration (float): The seconds delta-stepping needed for every source.
+        reference_duration (float): The seconds CUS1 needed to settle every node from every source.
+        distances_match (bool): Whether every distance equals the cost with which CUS1 settled the node.
+    """
+    grid_label: str
+    delta_label: str
+    delta_duration: float
+    reference_duration: float
+    distances_match: bool
+
+
+# ---------------------------------------------------------------------------
+# Delta-Stepping Conformance Benchmark
+# ---------------------------------------------------------------------------
+class DeltaSteppingBenchmark:
+    """
+    Checks that `DeltaSteppingEngine.distance_map` equals the CUS1 costs exactly, and times both.
+
+    Architectural Note:
+    The reference is CUS1 itself: one `solve_nearest` run per source with every node as a
+    destination and `goal_count` equal to the node count settles the whole reachable graph, and
+    records the cost with which each node was settled. The comparison is exact (no tolerance), and
+    the reachable sets must match too. Two grids are used: integer weights in [1, 4], and an
+    obstacle grid with fractional weights, whose blocked cells are unreachable. Every delta is
+    checked, since a bucket width that is too small or too large exercises different relaxation
+    orders.
+
+    Attributes:
+        grid_width (int): The side length of the generated grids (grid_width² nodes).
+        source_count (int): The number of sources per grid.
+        delta_values (List[Optional[float]]): The bucket widths to check (None = the engine's default).
+    """
+
+    def __init__(self, grid_width: int = 60, source_count: int = 4, delta_values: List[Optional[float]] = None) -> None:
+        self.grid_width = grid_width
+        self.source_count = source_count
+        self.delta_values = delta_values or [None, 0.5, 2.0, 50.0]
+
+    def _build_grids(self) -> List[Tuple[str, Graph]]:
+        """Generates the integer-weight grid and the fractional-weight obstacle grid."""
+        return [
+            (f"integer {self.grid_width}x{self.grid_width}", build_grid_graph(self.grid_width)),
+            (f"obstacle {self.grid_width}x{self.grid_width}", build_grid_graph(
+                self.grid_width, seed=5, draw_weight=lambda generator: generator.uniform(1.0, 3.0), blocked_fraction=0.2,
+            )),
+        ]
+
+    @staticmethod
+    def _reference_distances(problem_graph: Graph, source_id: int) -> Dict[int, float]:
+        """Settles every node reachable from `source_id` with CUS1 and returns its settled cost by node ID."""
+        search_problem = SearchProblem(problem_graph, source_id, problem_graph.node_ids)
+        settled_goals = SearchEngine(problem_graph, search_problem).solve_nearest("cus1", goal_count=problem_graph.node_count)
+        return {goal_id: path_cost for goal_id, path_cost, _ in settled_goals}
+
+    def run(self) -> List[DistanceMeasurement]:
+        """
+        Compares every grid and delta against CUS1 and logs a table.
+
+        Returns:
+            List[DistanceMeasurement]: One measurement per (grid, delta) pair.
+        """
+        measurements: List[DistanceMeasurement] = []
+        for grid_label, problem_graph in self._build_grids():
+            source_ids = random.Random(3).sample(problem_graph.node_ids, self.source_count)
+
+            start_time_counter = time.perf_counter()
+            reference_maps = [self._reference_distances(problem_graph, source_id) for source_id in source_ids]
+            reference_duration = time.perf_counter() - start_time_counter
+
+            for delta in self.delta_values:
+                distance_engine = DeltaSteppingEngine(problem_graph, delta)
+                start_time_counter = time.perf_counter()
+                distance_maps = [distance_engine.distance_map(source_id) for source_id in source_ids]
+                delta_duration = time.perf_counter() - start_time_counter
+                measurements.append(DistanceMeasurement(
+                    grid_label, "default" if delta is None else str(delta), delta_duration, reference_duration,
+                    distance_maps == reference_maps,
+                ))
+
+        for measurement in measurements:
+            logger.info(
+                f"{measurement.grid_label:<16} delta {measurement.delta_label:<8} "
+                f"{measurement.delta_duration:8.3f} s (CUS1 {measurement.reference_duration:8.3f} s) "
+                f"{'OK' if measurement.distances_match else 'MISMATCH'}"
+            )
+        return measurements
+
+
+# ---------------------------------------------------------------------------
+# Application Entry Point
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    delta_benchmark = DeltaSteppingBenchmark()
+    benchmark_measurements = delta_benchmark.run()
+    sys.exit(0 if all(measurement.distances_match for measurement in benchmark_measurements) else 1)
@@ -2,9 +2,15 @@
 # Imports & Dependencies
 # ---------------------------------------------------------------------------
 import logging
-from typing import List, Dict, Tuple, NamedTuple, Union
+import random
+import sys
+from typing import Callable, List, Dict, Tuple, NamedTuple, Union
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from graph import Graph
+
 
 # ---------------------------------------------------------------------------
 # Configuration & Telemetry Setup
@@ -136,6 +142,73 @@ class GraphSerializer:
         logger.info(f"Successfully provisioned: {test_case.filename:<25} | Purpose: {test_case.architectural_purpose}")
 
 
+# ---------------------------------------------------------------------------
+# Synthetic Grid Generator (Benchmarks)
+# ---------------------------------------------------------------------------
+def _draw_integer_weight(weight_generator: random.Random) -> float:
+    """Draws an integer weight in [1, 4], never shorter than a unit grid edge."""
+    return float(weight_generator.randint(1, 4))
+
+
+def build_grid_graph(
+    grid_width: int,
+    seed: int = 7,
+    draw_weight: Callable[[random.Random], float] = _draw_integer_weight,
+    blocked_fraction: float = 0.0,
+    corner_query: bool = False,
+) -> Graph:
+    """
+    Generates the indexed 4-connected grid shared by the benchmark scripts.
+
+    Architectural Note:
+    Node (row, column) gets ID `row * grid_width + column + 1` and coordinates (column, row), so
+    every edge is one unit long and weights of at least 1 keep the Euclidean heuristic admissible.
+    The layout is drawn from a single seeded generator: first the blocked cells (only when
+    `blocked_fraction` is positive), then one weight per edge in row-major order. A blocked cell
+    keeps its node but has no edges in or out. The two corner cells are never blocked.
+
+    Args:
+        grid_width (int): The side length of the grid (grid_width² nodes).
+        seed (int): The seed of the layout generator.
+        draw_weight (Callable[[random.Random], float]): Draws one edge weight from the generator.
+        blocked_fraction (float): The probability that a cell is blocked.
+        corner_query (bool): Whether to attach the default query from node 1 to the opposite corner.
+
+    Returns:
+        Graph: The indexed grid.
+
+    Internal Variables:
+        blocked_cells (Set[int]): The zero-based cell numbers without edges.
+    """
+    cell_count = grid_width * grid_width
+    layout_generator = random.Random(seed)
+    blocked_cells = set()
+    if blocked_fraction > 0.0:
+        blocked_cells = {
+            cell_number for cell_number in range(cell_count) if layout_generator.random() < blocked_fraction
+        } - {0, cell_count - 1}
+
+    problem_graph = Graph()
+    for row in range(grid_width):
+        for column in range(grid_width):
+            node_identifier = row * grid_width + column + 1
+            problem_graph.node_coordinates[node_identifier] = (float(column), float(row))
+            neighbors = problem_graph.adjacency_list.setdefault(node_identifier, {})
+            if node_identifier - 1 in blocked_cells:
+                continue
+            for row_step, column_step in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+                neighbor_row, neighbor_column = row + row_step, column + column_step
+                neighbor_cell = neighbor_row * grid_width + neighbor_column
+                if 0 <= neighbor_row < grid_width and 0 <= neighbor_column < grid_width and neighbor_cell not in blocked_cells:
+                    neighbors[neighbor_cell + 1] = draw_weight(layout_generator)
+
+    if corner_query:
+        problem_graph.origin = 1
+        problem_graph.destinations = [cell_count]
+    problem_graph.build_index()
+    return problem_graph
+
+
 # ---------------------------------------------------------------------------
 # Test Generation Orchestrator
 # ---------------------------------------------------------------------------
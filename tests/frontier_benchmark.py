@@ -0,0 +1,135 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+import random
+import sys
+import time
+import logging
+from typing import List, NamedTuple, Tuple
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine import SearchEngine
+from factory import build_grid_graph
+from graph import Graph
+from problem import SearchProblem
+
+
+# ---------------------------------------------------------------------------
+# Configuration & Telemetry Setup
+# ---------------------------------------------------------------------------
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger("FrontierBenchmark")
+
+
+# ---------------------------------------------------------------------------
+# Data Transfer Objects (DTOs)
+# ---------------------------------------------------------------------------
+class FrontierMeasurement(NamedTuple):
+    """
+    An immutable Data Transfer Object (DTO) holding the timing of one method / frontier pair.
+
+    Attributes:
+        search_method (str): The algorithm that ran ('cus1' or 'as').
+        frontier_type (str): The open list it ran on ('heap', 'dial' or 'radix').
+        total_duration (float): The wall-clock time for every query, in seconds.
+        results_match (bool): Whether every result and node count equals the binary heap's.
+    """
+    search_method: str
+    frontier_type: str
+    total_duration: float
+    results_match: bool
+
+
+# ---------------------------------------------------------------------------
+# Frontier Benchmark
+# ---------------------------------------------------------------------------
+class FrontierBenchmark:
+    """
+    Compares the monotone frontiers of `frontier.py` with the default binary heap.
+
+    Architectural Note:
+    The graph is a generated square grid with integer edge weights of at least the Euclidean edge
+    length, so CUS1 produces integer priorities (valid for Dial buckets) and the Euclidean heuristic
+    stays consistent (valid for the radix heap under A*). Every frontier answers the same queries,
+    and its paths, costs and created-node counts are compared with the binary heap's, which checks
+    that the tie-break order of `SearchState.__lt__` is preserved.
+
+    Attributes:
+        grid_width (int): The side length of the generated grid (grid_width² nodes).
+        query_count (int): The number of origin / destination queries per method.
+        benchmark_plan (List[Tuple[str, List[str]]]): Each method with the frontiers it is timed on.
+    """
+
+    def __init__(self, grid_width: int = 150, query_count: int = 12) -> None:
+        self.grid_width = grid_width
+        self.query_count = query_count
+        self.benchmark_plan: List[Tuple[str, List[str]]] = [
+            ("cus1", ["heap", "dial", "radix"]),
+            ("as", ["heap", "radix"]),
+        ]
+
+    def _build_queries(self, problem_graph: Graph) -> List[Tuple[int, List[int]]]:
+        """Draws a reproducible list of (origin, destinations) queries."""
+        query_generator = random.Random(11)
+        return [
+            (query_generator.choice(problem_graph.node_ids), query_generator.sample(problem_graph.node_ids, query_generator.randint(1, 3)))
+            for _ in range(self.query_count)
+        ]
+
+    @staticmethod
+    def _run_queries(problem_graph: Graph, search_method: str, frontier_type: str, queries: List[Tuple[int, List[int]]]) -> Tuple[float, list]:
+        """
+        Answers every query on one frontier.
+
+        Returns:
+            Tuple[float, list]: The elapsed seconds and each query's (result, total_nodes_created).
+        """
+        query_outcomes = []
+        start_time_counter = time.perf_counter()
+        for origin, destinations in queries:
+            search_engine = SearchEngine(problem_graph, SearchProblem(problem_graph, origin, destinations), frontier_type=frontier_type)
+            search_result = search_engine.solve(search_method)
+            query_outcomes.append((search_result, search_engine.total_nodes_created))
+        return time.perf_counter() - start_time_counter, query_outcomes
+
+    def run(self) -> List[FrontierMeasurement]:
+        """
+        Times every method / frontier pair and logs a comparison table.
+
+        Returns:
+            List[FrontierMeasurement]: One measurement per pair, the binary heap first for each method.
+        """
+        problem_graph = build_grid_graph(self.grid_width)
+        queries = self._build_queries(problem_graph)
+        logger.info(f"{self.grid_width ** 2} nodes, {len(queries)} queries per method")
+
+        measurements: List[FrontierMeasurement] = []
+        for search_method, frontier_types in self.benchmark_plan:
+            heap_duration, reference_outcomes = self._run_queries(problem_graph, search_method, "heap", queries)
+            measurements.append(FrontierMeasurement(search_method, "heap", heap_duration, True))
+            for frontier_type in frontier_types[1:]:
+                total_duration, query_outcomes = self._run_queries(problem_graph, search_method, frontier_type, queries)
+                measurements.append(FrontierMeasurement(search_method, frontier_type, total_duration, query_outcomes == reference_outcomes))
+
+            for measurement in measurements[-len(frontier_types):]:
+                logger.info(
+                    f"{measurement.search_method:<5} {measurement.frontier_type:<6} {measurement.total_duration:8.3f} s "
+                    f"speed-up {heap_duration / measurement.total_duration:5.2f} "
+                    f"{'OK' if measurement.results_match else 'MISMATCH'}"
+                )
+        return measurements
+
+
+# ---------------------------------------------------------------------------
+# Application Entry Point
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    frontier_benchmark = FrontierBenchmark()
+    benchmark_measurements = frontier_benchmark.run()
+    sys.exit(0 if all(measurement.results_match for measurement in benchmark_measurements) else 1)
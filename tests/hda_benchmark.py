@@ -0,0 +1,137 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+import math
+import os
+import sys
+import time
+import logging
+from typing import List, NamedTuple
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine import SearchEngine
+from factory import build_grid_graph
+from graph import Graph
+from parallel_astar import HashDistributedAStarSearch
+
+
+# ---------------------------------------------------------------------------
+# Configuration & Telemetry Setup
+# ---------------------------------------------------------------------------
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger("HDABenchmark")
+
+
+# ---------------------------------------------------------------------------
+# Data Transfer Objects (DTOs)
+# ---------------------------------------------------------------------------
+class SpeedupMeasurement(NamedTuple):
+    """
+    An immutable Data Transfer Object (DTO) comparing one HDA* configuration with sequential AS.
+
+    Attributes:
+        node_count (int): The size of the generated graph.
+        strategy_name (str): 'sequential as' or 'hda* xN'.
+        solve_duration (float): The wall-clock time of the query, in seconds (graph publishing excluded).
+        total_nodes_created (int): The nodes-created metric reported by the run.
+        cost_matches (bool): Whether the route cost equals the sequential optimum.
+    """
+    node_count: int
+    strategy_name: str
+    solve_duration: float
+    total_nodes_created: int
+    cost_matches: bool
+
+
+# ---------------------------------------------------------------------------
+# HDA* Speed-Up Benchmark
+# ---------------------------------------------------------------------------
+class HashDistributedBenchmark:
+    """
+    Measures the speed-up of `HashDistributedAStarSearch` over the sequential AS method.
+
+    Architectural Note:
+    Each graph is a 4-connected square grid with random obstacles and edge weights between one and
+    three times the Euclidean edge length, so the heuristic stays admissible but far from exact and
+    A* has to expand a large share of the grid. The query runs corner to corner. The route cost of
+    every HDA* run is compared with the sequential optimum; the routes themselves may differ when
+    several are optimal. Speed-up needs as many idle cores as workers; on a single core, the
+    numbers only show the communication overhead.
+
+    Attributes:
+        node_counts (List[int]): The approximate graph sizes to generate (10^5 and 10^6 by default).
+        worker_counts (List[int]): The HDA* process counts to measure.
+    """
+
+    def __init__(self, node_counts: List[int] = None, worker_counts: List[int] = None) -> None:
+        self.node_counts = node_counts or [100_000, 1_000_000]
+        self.worker_counts = worker_counts or sorted({2, 4, os.cpu_count() or 1})
+
+    @staticmethod
+    def _route_cost(problem_graph: Graph, path_sequence: List[int]) -> float:
+        """Sums the edge weights along a route of node IDs."""
+        return sum(problem_graph.adjacency_list[source][target] for source, target in zip(path_sequence, path_sequence[1:]))
+
+    def run(self) -> List[SpeedupMeasurement]:
+        """
+        Times sequential AS and every HDA* configuration on each graph size and logs a comparison table.
+
+        Returns:
+            List[SpeedupMeasurement]: Per graph size, the sequential run first, then HDA* per worker count.
+        """
+        logger.info(f"{os.cpu_count()} CPUs available")
+        measurements: List[SpeedupMeasurement] = []
+        for node_count in self.node_counts:
+            problem_graph = build_grid_graph(
+                math.isqrt(node_count), seed=5, draw_weight=lambda generator: generator.uniform(1.0, 3.0),
+                blocked_fraction=0.2, corner_query=True,
+            )
+
+            search_engine = SearchEngine(problem_graph)
+            start_time_counter = time.perf_counter()
+            search_result = search_engine.solve("as")
+            sequential_duration = time.perf_counter() - start_time_counter
+            optimal_cost = None if search_result is None else self._route_cost(problem_graph, search_result[2])
+            size_measurements = [
+                SpeedupMeasurement(problem_graph.node_count, "sequential as", sequential_duration, search_engine.total_nodes_created, True)
+            ]
+
+            for worker_count in self.worker_counts:
+                with HashDistributedAStarSearch(problem_graph, worker_count=worker_count) as parallel_search:
+                    start_time_counter = time.perf_counter()
+                    parallel_result = parallel_search.solve()
+                    parallel_duration = time.perf_counter() - start_time_counter
+                if parallel_result is None or optimal_cost is None:
+                    cost_matches = parallel_result is None and optimal_cost is None
+                else:
+                    cost_matches = math.isclose(self._route_cost(problem_graph, parallel_result[2]), optimal_cost, rel_tol=1e-9)
+                size_measurements.append(SpeedupMeasurement(
+                    problem_graph.node_count, f"hda* x{worker_count}", parallel_duration, parallel_search.total_nodes_created, cost_matches
+                ))
+
+            for measurement in size_measurements:
+                logger.info(
+                    f"{measurement.node_count:>8} nodes {measurement.strategy_name:<14} {measurement.solve_duration:8.3f} s "
+                    f"{measurement.total_nodes_created:>9} created "
+                    f"speed-up {sequential_duration / measurement.solve_duration:5.2f} "
+                    f"{'OK' if measurement.cost_matches else 'COST MISMATCH'}"
+                )
+            measurements.extend(size_measurements)
+        return measurements
+
+
+# ---------------------------------------------------------------------------
+# Application Entry Point
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    # Optional graph sizes, e.g. `python tests/hda_benchmark.py 100000`.
+    requested_node_counts = [int(argument) for argument in sys.argv[1:]] or None
+    hda_benchmark = HashDistributedBenchmark(node_counts=requested_node_counts)
+    benchmark_measurements = hda_benchmark.run()
+    sys.exit(0 if all(measurement.cost_matches for measurement in benchmark_measurements) else 1)
@@ -0,0 +1,195 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+import random
+import sys
+import time
+import logging
+from typing import List, NamedTuple, Optional, Tuple
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine import SearchEngine
+from factory import build_grid_graph
+from graph import Graph
+from partition import GraphPartition, MultiLevelSearch
+from problem import SearchProblem
+
+
+# ---------------------------------------------------------------------------
+# Configuration & Telemetry Setup
+# ---------------------------------------------------------------------------
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger("PartitionBenchmark")
+
+
+# ---------------------------------------------------------------------------
+# Data Transfer Objects (DTOs)
+# ---------------------------------------------------------------------------
+class PartitionMeasurement(NamedTuple):
+    """
+    An immutable Data Transfer Object (DTO) comparing MultiLevelSearch with CUS1 on one map and cell size.
+
+    Attributes:
+        map_label (str): The test map's name, or a label such as 'grid 60x60'.
+        cell_size (int): The maximum number of nodes per cell.
+        build_duration (float): The seconds `GraphPartition.build` needed.
+        query_duration (float): The seconds MultiLevelSearch needed for every query.
+        reference_duration (float): The seconds CUS1 needed for every query.
+        results_match (bool): Whether every cost equals CUS1's and every route is a valid path of that cost.
+    """
+    map_label: str
+    cell_size: int
+    build_duration: float
+    query_duration: float
+    reference_duration: float
+    results_match: bool
+
+
+# ---------------------------------------------------------------------------
+# Multi-Level Query Conformance Benchmark
+# ---------------------------------------------------------------------------
+class PartitionBenchmark:
+    """
+    Checks that `MultiLevelSearch` returns CUS1's costs along valid routes, and times both.
+
+    Architectural Note:
+    The supplied test maps are queried with their own origin and destinations. The generated grids
+    (one with integer weights, one with blocked cells, so that some queries have no answer) are
+    queried with a reproducible batch of origins and 1-3 destinations each. For every query and
+    cell size, the result must be None exactly when CUS1 finds no route. Otherwise its cost must
+    equal the cost of the CUS1 route (no tolerance), and its route must start at the origin, end
+    at the reported goal, which must be a destination, and follow existing edges whose weights add
+    up to the reported cost. The reached goal itself is not compared, since both searches may pick
+    different destinations at equal cost. Cell size 1 makes every node a cell of its own, and the
+    largest sizes leave the grid in a handful of cells, so both extremes of the overlay are covered.
+
+    Attributes:
+        case_directory (Path): The directory of the supplied test maps.
+        grid_width (int): The side length of the generated grids (grid_width² nodes).
+        query_count (int): The number of queries per generated grid.
+        cell_sizes (List[int]): The cell sizes to check.
+    """
+
+    def __init__(
+        self,
+        case_directory: Path = Path(__file__).parent / "cases",
+        grid_width: int = 60,
+        query_count: int = 20,
+        cell_sizes: List[int] = None
+    ) -> None:
+        self.case_directory = case_directory
+        self.grid_width = grid_width
+        self.query_count = query_count
+        self.cell_sizes = cell_sizes or [1, 2, 3, 4, 5, 6, 7, 8, 64, 256]
+
+    def _build_maps(self) -> List[Tuple[str, Graph, List[SearchProblem]]]:
+        """Loads the test maps and generates the grids, each with its query problems."""
+        query_maps = []
+        case_paths = sorted(self.case_directory.glob("*.txt")) + [Path(__file__).parent.parent / "PathFinder-test.txt"]
+        for case_path in case_paths:
+            case_graph = Graph()
+            case_graph.load_from_file(str(case_path))
+            query_maps.append((case_path.stem, case_graph, [SearchProblem(case_graph, case_graph.origin, case_graph.destinations)]))
+
+        for grid_label, blocked_fraction in (("grid", 0.0), ("obstacle grid", 0.2)):
+            grid_graph = build_grid_graph(self.grid_width, blocked_fraction=blocked_fraction)
+            query_generator = random.Random(13)
+            grid_problems = [
+                SearchProblem(
+                    grid_graph,
+                    query_generator.choice(grid_graph.node_ids),
+                    query_generator.sample(grid_graph.node_ids, query_generator.randint(1, 3)),
+                )
+                for _ in range(self.query_count)
+            ]
+            query_maps.append((f"{grid_label} {self.grid_width}x{self.grid_width}", grid_graph, grid_problems))
+        return query_maps
+
+    @staticmethod
+    def _route_cost(problem_graph: Graph, path: List[int]) -> Optional[float]:
+        """Adds up the edge weights along `path` from the origin, or returns None if an edge does not exist."""
+        path_cost = 0.0
+        for source_id, target_id in zip(path, path[1:]):
+            neighbors = problem_graph.adjacency_list.get(source_id, {})
+            if target_id not in neighbors:
+                return None
+            path_cost += neighbors[target_id]
+        return path_cost
+
+    def _result_matches(
+        self,
+        problem_graph: Graph,
+        search_problem: SearchProblem,
+        reference_cost: Optional[float],
+        query_result: Optional[Tuple[int, float, List[int]]]
+    ) -> bool:
+        """Checks one MultiLevelSearch result against the CUS1 cost and the graph's edges."""
+        if query_result is None or reference_cost is None:
+            return query_result is None and reference_cost is None
+        reached_goal_id, path_cost, path = query_result
+        return (
+            path_cost == reference_cost
+            and reached_goal_id in search_problem.destinations
+            and path[0] == search_problem.origin
+            and path[-1] == reached_goal_id
+            and self._route_cost(problem_graph, path) == path_cost
+        )
+
+    def run(self) -> List[PartitionMeasurement]:
+        """
+        Compares every map and cell size against CUS1 and logs a table.
+
+        Returns:
+            List[PartitionMeasurement]: One measurement per (map, cell size) pair.
+        """
+        measurements: List[PartitionMeasurement] = []
+        for map_label, problem_graph, search_problems in self._build_maps():
+            start_time_counter = time.perf_counter()
+            reference_results = [SearchEngine(problem_graph, search_problem).solve("cus1") for search_problem in search_problems]
+            reference_duration = time.perf_counter() - start_time_counter
+            reference_costs = [
+                None if reference_result is None else self._route_cost(problem_graph, reference_result[2])
+                for reference_result in reference_results
+            ]
+
+            for cell_size in self.cell_sizes:
+                start_time_counter = time.perf_counter()
+                graph_partition = GraphPartition(problem_graph, cell_size).build()
+                build_duration = time.perf_counter() - start_time_counter
+
+                multi_level_search = MultiLevelSearch(graph_partition)
+                start_time_counter = time.perf_counter()
+                query_results = [multi_level_search.solve(problem=search_problem) for search_problem in search_problems]
+                query_duration = time.perf_counter() - start_time_counter
+
+                results_match = all(
+                    self._result_matches(problem_graph, search_problem, reference_cost, query_result)
+                    for search_problem, reference_cost, query_result in zip(search_problems, reference_costs, query_results)
+                )
+                measurements.append(PartitionMeasurement(
+                    map_label, cell_size, build_duration, query_duration, reference_duration, results_match,
+                ))
+
+        for measurement in measurements:
+            logger.info(
+                f"{measurement.map_label:<20} cells of {measurement.cell_size:<4} "
+                f"build {measurement.build_duration:7.3f} s query {measurement.query_duration:7.3f} s "
+                f"(CUS1 {measurement.reference_duration:7.3f} s) "
+                f"{'OK' if measurement.results_match else 'MISMATCH'}"
+            )
+        return measurements
+
+
+# ---------------------------------------------------------------------------
+# Application Entry Point
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    partition_benchmark = PartitionBenchmark()
+    benchmark_measurements = partition_benchmark.run()
+    sys.exit(0 if all(measurement.results_match for measurement in benchmark_measurements) else 1)
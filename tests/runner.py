@@ -3,10 +3,12 @@
 # ---------------------------------------------------------------------------
 import subprocess
 import csv
+import os
+import re
 import sys
 import time
 import logging
-from typing import NamedTuple, List
+from typing import NamedTuple, List, Optional
 from pathlib import Path
 
 
@@ -35,8 +37,13 @@ class SearchResult(NamedTuple):
         reached_goal_id (str): The node ID of the goal reached, or a string flag if none was found.
         total_nodes_created (int): The empirical space-complexity metric indicating memory footprint.
         path_sequence (str): A space-separated string representing the chronological traversal path.
-        execution_status (str): The operational health of the run ('SUCCESS', 'FAIL', 'TIMEOUT', 'No_Solution').
+        execution_status (str): The operational health of the run ('SUCCESS', 'SUBOPTIMAL', 'FAIL', 'TIMEOUT', 
+                                'No_Solution', 'BUDGET_EXHAUSTED'). For BUDGET_EXHAUSTED runs, the goal and path 
+                                columns hold the best node reached and the partial route to it. SUBOPTIMAL runs 
+                                reached a goal, but a budget stopped an anytime method before proving the route optimal.
         execution_duration (float): The empirical time-complexity metric, measured in precise seconds.
+        suboptimality_bound (Optional[float]): For SUBOPTIMAL runs, the proven factor by which the route's cost 
+                                               may exceed the optimum; None otherwise.
     """
     test_case_filename: str
     search_method: str
@@ -45,6 +52,7 @@ class SearchResult(NamedTuple):
     path_sequence: str
     execution_status: str
     execution_duration: float
+    suboptimality_bound: Optional[float] = None
 
 
 # ---------------------------------------------------------------------------
@@ -70,7 +78,7 @@ class CSVBenchmarkReporter:
         self.output_file_path = output_file_path
         self.headers: List[str] = [
             "TestCase", "Method", "Goal", "NodesCreated", 
-            "Path", "Status", "Duration"
+            "Path", "Status", "Duration", "SuboptimalityBound"
         ]
 
     def generate_report(self, benchmark_results: List[SearchResult]) -> None:
@@ -101,6 +109,7 @@ class CSVBenchmarkReporter:
                     result.path_sequence,
                     result.execution_status,
                     f"{result.execution_duration:.4f}",  # Format to 4 decimal places for scientific precision
+                    "" if result.suboptimality_bound is None else result.suboptimality_bound,
                 ])
                 
         logger.info(f"Telemetry report successfully generated at: {self.output_file_path.resolve()}")
@@ -119,19 +128,33 @@ class BenchmarkOrchestrator:
         supported_methods (List[str]): The authoritative array of algorithms scheduled for evaluation.
         timeout_seconds (float): A rigid execution ceiling (in seconds) to prevent infinite loops 
                                  (e.g., from poorly implemented DFS cycle checking) from freezing the suite.
+        cooperative_time_limit (Optional[float]): The `--time-limit` passed to search.py. Kept below 
+                                                  `timeout_seconds` so that a runaway search stops itself and 
+                                                  reports its partial progress before the hard kill.
+        profile_directory (Optional[Path]): When set, every run passes `--profile` to search.py and its 
+                                            per-phase profiles and collapsed stacks land here, one set 
+                                            per (file, method) pair. Profiled durations include the 
+                                            profiler's overhead.
     """
 
+    BUDGET_EXHAUSTED_PATTERN = re.compile(r"Search budget exhausted .*Best node (\S+) after (\d+) nodes")
+    SUBOPTIMAL_PATTERN = re.compile(r"Suboptimal solution;.*: (\S+)")
+
     def __init__(
         self, 
         search_executable: Path, 
         test_cases_directory: Path, 
         supported_methods: List[str],
-        timeout_seconds: float = 5.0
+        timeout_seconds: float = 5.0,
+        cooperative_time_limit: Optional[float] = None,
+        profile_directory: Optional[Path] = None
     ) -> None:
         self.search_executable = search_executable
         self.test_cases_directory = test_cases_directory
         self.supported_methods = supported_methods
         self.timeout_seconds = timeout_seconds
+        self.cooperative_time_limit = cooperative_time_limit
+        self.profile_directory = profile_directory
 
     def _execute_isolated_process(self, test_file_path: Path, search_method: str) -> SearchResult:
         """
@@ -160,11 +183,20 @@ class BenchmarkOrchestrator:
         
         try:
             # sys.executable securely targets the exact same Python binary currently running the suite
+            command_arguments = [sys.executable, str(self.search_executable), str(test_file_path), search_method]
+            if self.cooperative_time_limit is not None:
+                command_arguments += ["--time-limit", str(self.cooperative_time_limit)]
+            process_environment = None
+            if self.profile_directory is not None:
+                command_arguments.append("--profile")
+                process_environment = {**os.environ, "PATHFINDER_PROFILE_DIR": str(self.profile_directory)}
+
             process_result = subprocess.run(
-                [sys.executable, str(self.search_executable), str(test_file_path), search_method],
+                command_arguments,
                 capture_output=True,
                 text=True,
                 timeout=self.timeout_seconds,
+                env=process_environment,
             )
             
             elapsed_duration = time.perf_counter() - start_time_counter
@@ -174,7 +206,9 @@ class BenchmarkOrchestrator:
                 logger.error(f"Process crashed for {search_method.upper()} on {file_name}")
                 return SearchResult(file_name, search_method, "ERROR", 0, "Crash Detected", "FAIL", elapsed_duration)
 
-            return self._parse_standard_output(process_result.stdout, file_name, search_method, elapsed_duration)
+            return self._parse_standard_output(
+                process_result.stdout, file_name, search_method, elapsed_duration, process_result.stderr
+            )
 
         except subprocess.TimeoutExpired:
             logger.warning(f"Timeout exceeded ({self.timeout_seconds}s) for {search_method.upper()} on {file_name}")
@@ -190,7 +224,8 @@ class BenchmarkOrchestrator:
         raw_output: str, 
         file_name: str, 
         search_method: str, 
-        elapsed_duration: float
+        elapsed_duration: float,
+        raw_error_output: str = ""
     ) -> SearchResult:
         """
         Strictly parses the stdout payload returned by the targeted search executable.
@@ -205,6 +240,8 @@ class BenchmarkOrchestrator:
             file_name (str): The test case identifier used for DTO construction.
             search_method (str): The algorithm identifier used for DTO construction.
             elapsed_duration (float): The calculated execution time used for DTO construction.
+            raw_error_output (str): The captured stderr, which carries the suboptimality bound of an 
+                                    anytime search that its budget stopped early.
             
         Returns:
             SearchResult: The mapped and validated data object.
@@ -223,6 +260,15 @@ class BenchmarkOrchestrator:
         if "No solution found" in output_lines[1]:
             return SearchResult(file_name, search_method, "None", 0, "None", "No_Solution", elapsed_duration)
 
+        # Validation: A cooperative budget stopped the search; record its partial progress
+        budget_match = self.BUDGET_EXHAUSTED_PATTERN.search(output_lines[1])
+        if budget_match:
+            partial_path = output_lines[2].strip() if len(output_lines) > 2 else "[]"
+            return SearchResult(
+                file_name, search_method, budget_match.group(1), int(budget_match.group(2)), 
+                partial_path, "BUDGET_EXHAUSTED", elapsed_duration
+            )
+
         metadata_parts = output_lines[1].strip().split()
         
         if len(metadata_parts) < 2:
@@ -234,6 +280,13 @@ class BenchmarkOrchestrator:
         # Extrapolate path sequence safely; default to empty brackets if missing
         path_sequence = output_lines[2].strip() if len(output_lines) > 2 else "[]"
 
+        suboptimal_match = self.SUBOPTIMAL_PATTERN.search(raw_error_output)
+        if suboptimal_match:
+            return SearchResult(
+                file_name, search_method, reached_goal, nodes_created, path_sequence, "SUBOPTIMAL", 
+                elapsed_duration, float(suboptimal_match.group(1))
+            )
+
         return SearchResult(
             file_name, search_method, reached_goal, nodes_created, path_sequence, "SUCCESS", elapsed_duration
         )
@@ -289,12 +342,17 @@ if __name__ == "__main__":
     
     algorithms_to_evaluate = ["dfs", "bfs", "gbfs", "as", "cus1", "cus2"]
 
+    # `python tests/runner.py --profile` also writes per-phase profiles of every run to tests/profiles/.
+    target_profile_dir = base_directory / "profiles" if "--profile" in sys.argv[1:] else None
+
     # Instantiate the Orchestrator via Dependency Injection
     benchmark_orchestrator = BenchmarkOrchestrator(
         search_executable=target_executable,
         test_cases_directory=target_test_cases_dir,
         supported_methods=algorithms_to_evaluate,
-        timeout_seconds=5.0
+        timeout_seconds=5.0,
+        cooperative_time_limit=4.0,
+        profile_directory=target_profile_dir
     )
 
     # Instantiate the Reporting Engine via Dependency Injection
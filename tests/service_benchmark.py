@@ -0,0 +1,182 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+import asyncio
+import sys
+import tempfile
+import time
+import logging
+from typing import List, NamedTuple
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from factory import GraphSerializer, TestCaseDefinition, build_grid_graph
+from service import AsyncSearchService
+
+
+# ---------------------------------------------------------------------------
+# Configuration & Telemetry Setup
+# ---------------------------------------------------------------------------
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger("ServiceBenchmark")
+
+
+# ---------------------------------------------------------------------------
+# Data Transfer Objects (DTOs)
+# ---------------------------------------------------------------------------
+class ServiceCheck(NamedTuple):
+    """
+    An immutable Data Transfer Object (DTO) holding the verdict of one service behaviour.
+
+    Attributes:
+        check_name (str): A label such as 'coalescing' or 'deadline'.
+        check_duration (float): The wall-clock time of the check, in seconds.
+        passed (bool): Whether the service behaved as documented.
+    """
+    check_name: str
+    check_duration: float
+    passed: bool
+
+
+# ---------------------------------------------------------------------------
+# Asynchronous Service Benchmark
+# ---------------------------------------------------------------------------
+class ServiceBenchmark:
+    """
+    Exercises the documented behaviours of `AsyncSearchService` against a single-worker pool.
+
+    Architectural Note:
+    The map is a generated grid written to a temporary file. On it, 'as' answers in milliseconds,
+    while 'cus2' (IDA*) runs for minutes, so it stands in for any query that outlives its callers.
+    With one worker, a computation that is never stopped blocks every later query, so "the next
+    query is answered promptly" proves that the worker was freed. The checks are:
+    1. Coalescing: concurrent identical queries share one computation and get the same result.
+    2. Deadline: a query that outlives its deadline returns 'TIMEOUT', and its worker stops.
+    3. Cancellation: cancelling the only caller of a running query stops its worker.
+    4. Unknown method: an unsupported method returns 'FAIL' without reaching the pool.
+
+    Attributes:
+        grid_width (int): The side length of the generated grid (grid_width² nodes).
+        caller_count (int): The number of concurrent callers in the coalescing check.
+        deadline_seconds (float): The deadline of the query that must time out.
+        response_budget_seconds (float): How long the query after a stopped one may take at most.
+    """
+
+    def __init__(
+        self,
+        grid_width: int = 30,
+        caller_count: int = 8,
+        deadline_seconds: float = 0.5,
+        response_budget_seconds: float = 3.0
+    ) -> None:
+        self.grid_width = grid_width
+        self.caller_count = caller_count
+        self.deadline_seconds = deadline_seconds
+        self.response_budget_seconds = response_budget_seconds
+
+    def _write_grid_map(self, output_directory: Path) -> str:
+        """Writes the generated grid, with its corner-to-corner query, as a configuration file."""
+        problem_graph = build_grid_graph(self.grid_width, corner_query=True)
+        GraphSerializer(output_directory).write_to_disk(TestCaseDefinition(
+            filename="service_grid.txt",
+            nodes=problem_graph.node_coordinates,
+            adjacency_list=problem_graph.adjacency_list,
+            origin=problem_graph.origin,
+            destinations=problem_graph.destinations,
+            architectural_purpose="Service benchmark grid",
+        ))
+        return str(output_directory / "service_grid.txt")
+
+    async def _check_coalescing(self, search_service: AsyncSearchService, map_path: str) -> bool:
+        """Starts identical queries together and checks that they share one computation."""
+        query_tasks = [asyncio.create_task(search_service.solve(map_path, "as")) for _ in range(self.caller_count)]
+        # One loop turn lets every task register with the service before the worker can answer.
+        await asyncio.sleep(0)
+        in_flight_queries = list(search_service.in_flight_queries.values())
+        shared_computation = len(in_flight_queries) == 1 and in_flight_queries[0].waiter_count == self.caller_count
+
+        query_results = await asyncio.gather(*query_tasks)
+        identical_results = all(
+            query_result.execution_status == "SUCCESS"
+            and query_result[:6] == query_results[0][:6]
+            for query_result in query_results
+        )
+        return shared_computation and identical_results
+
+    async def _answers_promptly(self, search_service: AsyncSearchService, map_path: str) -> bool:
+        """Checks that a quick query is answered within `response_budget_seconds`, i.e. that the worker is free."""
+        query_result = await search_service.solve(map_path, "as", deadline_seconds=self.response_budget_seconds)
+        return query_result.execution_status == "SUCCESS"
+
+    async def _check_deadline(self, search_service: AsyncSearchService, map_path: str) -> bool:
+        """Runs a query that cannot finish in time and checks the TIMEOUT result and the freed worker."""
+        query_result = await search_service.solve(map_path, "cus2", deadline_seconds=self.deadline_seconds)
+        timed_out = query_result.execution_status == "TIMEOUT"
+        return timed_out and await self._answers_promptly(search_service, map_path)
+
+    async def _check_cancellation(self, search_service: AsyncSearchService, map_path: str) -> bool:
+        """Cancels the only caller of a running query and checks that the worker is freed."""
+        query_task = asyncio.create_task(search_service.solve(map_path, "cus2"))
+        # Give the worker time to pick the computation up, so it is cancelled while running.
+        await asyncio.sleep(0.5)
+        query_task.cancel()
+        try:
+            await query_task
+            return False
+        except asyncio.CancelledError:
+            pass
+        return await self._answers_promptly(search_service, map_path)
+
+    async def _check_unknown_method(self, search_service: AsyncSearchService, map_path: str) -> bool:
+        """Checks that an unsupported method is reported as a failure, not as an unreachable goal."""
+        query_result = await search_service.solve(map_path, "bogus")
+        return query_result.execution_status == "FAIL" and not search_service.in_flight_queries
+
+    async def _run_checks(self, map_path: str) -> List[ServiceCheck]:
+        """
+        Runs every check in order against one single-worker service, logging each verdict at once:
+        if a worker is never stopped, closing the service waits for it.
+        """
+        service_checks: List[ServiceCheck] = []
+        async with AsyncSearchService(max_workers=1) as search_service:
+            # The first query pays for the worker's start-up, which no check should measure.
+            await search_service.solve(map_path, "as")
+            for check_name, check_function in (
+                ("coalescing", self._check_coalescing),
+                ("deadline", self._check_deadline),
+                ("cancellation", self._check_cancellation),
+                ("unknown method", self._check_unknown_method),
+            ):
+                start_time_counter = time.perf_counter()
+                passed = await check_function(search_service, map_path)
+                service_check = ServiceCheck(check_name, time.perf_counter() - start_time_counter, passed)
+                service_checks.append(service_check)
+                logger.info(f"{service_check.check_name:<16} {service_check.check_duration:8.3f} s {'OK' if service_check.passed else 'FAILED'}")
+        return service_checks
+
+    def run(self) -> List[ServiceCheck]:
+        """
+        Executes every check, logging a verdict per behaviour.
+
+        Returns:
+            List[ServiceCheck]: One entry per behaviour, in the order listed above.
+        """
+        with tempfile.TemporaryDirectory(prefix="service-benchmark-") as map_directory:
+            map_path = self._write_grid_map(Path(map_directory))
+            logger.info(f"{self.grid_width ** 2} nodes, {self.caller_count} coalesced callers, 1 worker")
+            service_checks = asyncio.run(self._run_checks(map_path))
+        return service_checks
+
+
+# ---------------------------------------------------------------------------
+# Application Entry Point
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    service_benchmark = ServiceBenchmark()
+    benchmark_checks = service_benchmark.run()
+    sys.exit(0 if all(service_check.passed for service_check in benchmark_checks) else 1)
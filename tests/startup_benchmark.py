@@ -0,0 +1,180 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import logging
+from typing import Dict, List, NamedTuple
+from pathlib import Path
+
+
+# ---------------------------------------------------------------------------
+# Configuration & Telemetry Setup
+# ---------------------------------------------------------------------------
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger("StartupBenchmark")
+
+
+# ---------------------------------------------------------------------------
+# Data Transfer Objects (DTOs)
+# ---------------------------------------------------------------------------
+class StartupMeasurement(NamedTuple):
+    """
+    An immutable Data Transfer Object (DTO) holding one cold-start measurement of the CLI.
+
+    Attributes:
+        import_microseconds (int): The cumulative `-X importtime` cost of `import search`.
+        imported_modules (List[str]): Every module the import pulled in, in import order.
+        cli_duration (float): The wall-clock time of one complete `search.py` run, in seconds.
+    """
+    import_microseconds: int
+    imported_modules: List[str]
+    cli_duration: float
+
+
+# ---------------------------------------------------------------------------
+# Startup Regression Benchmark
+# ---------------------------------------------------------------------------
+class StartupBenchmark:
+    """
+    Guards the cold-start cost of `search.py`, which shell pipelines invoke once per query.
+
+    Architectural Note:
+    `python -X importtime` reports the self and cumulative import cost of every module on
+    stderr. The benchmark takes the best of several runs (the least disturbed by other load)
+    and fails when the project's import chain exceeds `import_budget_microseconds`, when a whole
+    CLI run exceeds `cli_budget_seconds`, or when a module from `FORBIDDEN_MODULES` reappears on
+    the startup path. Bytecode caching is forced on (into a private directory), because a
+    recompiling interpreter would measure the compiler rather than the import path.
+
+    The CLI run measures a cold start on a map seen for the first time: every run gets a new, empty
+    graph cache directory (through `PATHFINDER_CACHE_DIR`), so it parses the map and writes the
+    cache entry. A warm cache hit is cheaper, so the budget covers both. Nothing is written next
+    to the sample map.
+
+    Attributes:
+        project_root (Path): The directory containing `search.py`.
+        sample_graph (Path): The configuration file used for the end-to-end CLI timing.
+        repetitions (int): How many measurements to take.
+        import_budget_microseconds (int): The ceiling on the cumulative import time of `search`.
+        cli_budget_seconds (float): The ceiling on one complete CLI invocation.
+    """
+
+    FORBIDDEN_MODULES: List[str] = ["typing", "dataclasses", "logging", "inspect", "asyncio"]
+    IMPORTTIME_PATTERN = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+    def __init__(
+        self,
+        project_root: Path,
+        sample_graph: Path,
+        repetitions: int = 7,
+        import_budget_microseconds: int = 15000,
+        cli_budget_seconds: float = 0.25
+    ) -> None:
+        self.project_root = project_root
+        self.sample_graph = sample_graph
+        self.repetitions = repetitions
+        self.import_budget_microseconds = import_budget_microseconds
+        self.cli_budget_seconds = cli_budget_seconds
+        self._bytecode_directory = tempfile.mkdtemp(prefix="startup-benchmark-")
+        self._graph_cache_root = tempfile.mkdtemp(prefix="startup-benchmark-cache-")
+
+    def _build_environment(self) -> Dict[str, str]:
+        """Returns the subprocess environment, with bytecode caching enabled into a private prefix."""
+        process_environment = dict(os.environ)
+        process_environment.pop("PYTHONDONTWRITEBYTECODE", None)
+        process_environment["PYTHONPYCACHEPREFIX"] = self._bytecode_directory
+        return process_environment
+
+    def _measure_once(self) -> StartupMeasurement:
+        """
+        Takes one import-time and one end-to-end measurement in fresh interpreters.
+
+        Internal Variables:
+            import_process (CompletedProcess): The `-X importtime -c "import search"` run.
+            cumulative_by_module (Dict[str, int]): The cumulative microseconds reported per module.
+        """
+        process_environment = self._build_environment()
+        import_process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import search"],
+            cwd=self.project_root, env=process_environment, capture_output=True, text=True, check=True,
+        )
+
+        cumulative_by_module: Dict[str, int] = {}
+        imported_modules: List[str] = []
+        for report_line in import_process.stderr.splitlines():
+            line_match = self.IMPORTTIME_PATTERN.match(report_line)
+            if line_match:
+                module_name = line_match.group(4)
+                imported_modules.append(module_name)
+                cumulative_by_module[module_name] = int(line_match.group(2))
+
+        # A fresh, empty graph cache per run: the CLI parses the map and writes the entry (cache miss).
+        process_environment["PATHFINDER_CACHE_DIR"] = tempfile.mkdtemp(dir=self._graph_cache_root)
+        start_time_counter = time.perf_counter()
+        subprocess.run(
+            [sys.executable, str(self.project_root / "search.py"), str(self.sample_graph), "as"],
+            cwd=self.project_root, env=process_environment, capture_output=True, check=True,
+        )
+        cli_duration = time.perf_counter() - start_time_counter
+
+        return StartupMeasurement(cumulative_by_module.get("search", 0), imported_modules, cli_duration)
+
+    def run(self) -> bool:
+        """
+        Executes the benchmark and logs a verdict.
+
+        Returns:
+            bool: True if every budget holds and no forbidden module is imported.
+        """
+        try:
+            # The first run only populates the bytecode cache.
+            self._measure_once()
+            measurements = [self._measure_once() for _ in range(self.repetitions)]
+        finally:
+            shutil.rmtree(self._bytecode_directory, ignore_errors=True)
+            shutil.rmtree(self._graph_cache_root, ignore_errors=True)
+
+        best_import_microseconds = min(measurement.import_microseconds for measurement in measurements)
+        best_cli_duration = min(measurement.cli_duration for measurement in measurements)
+        forbidden_imports = [
+            module_name for module_name in self.FORBIDDEN_MODULES
+            if module_name in measurements[0].imported_modules
+        ]
+
+        logger.info(f"import search: {best_import_microseconds} us (budget {self.import_budget_microseconds} us)")
+        logger.info(f"search.py cold run (graph cache miss): {best_cli_duration:.4f} s (budget {self.cli_budget_seconds:.4f} s)")
+
+        within_budget = True
+        if best_import_microseconds > self.import_budget_microseconds:
+            logger.error("Import time of the CLI exceeds its budget.")
+            within_budget = False
+        if best_cli_duration > self.cli_budget_seconds:
+            logger.error("Cold start of the CLI exceeds its budget.")
+            within_budget = False
+        if forbidden_imports:
+            logger.error(f"Modules kept off the startup path were imported: {', '.join(forbidden_imports)}")
+            within_budget = False
+        return within_budget
+
+
+# ---------------------------------------------------------------------------
+# Application Entry Point
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    project_root = Path(__file__).parent.parent
+
+    startup_benchmark = StartupBenchmark(
+        project_root=project_root,
+        sample_graph=project_root / "PathFinder-test.txt",
+    )
+    sys.exit(0 if startup_benchmark.run() else 1)
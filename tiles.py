@@ -0,0 +1,264 @@
+# ---------------------------------------------------------------------------
+# Imports & Dependencies
+# ---------------------------------------------------------------------------
+import json
+import math
+import os
+import struct
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+from graph import ReadOnlyGraphView
+
+
+# ---------------------------------------------------------------------------
+# On-Disk Tile Layout
+# ---------------------------------------------------------------------------
+MANIFEST_FILENAME = "manifest.json"
+NODE_TABLE_FILENAME = "nodes.bin"
+TILE_FORMAT_VERSION = 1
+TILE_HEADER = struct.Struct("<qq")
+
+
+class _TileRows:
+    """
+    The CSR adjacency rows of the nodes belonging to one resident tile.
+
+    Attributes:
+        adjacency_offsets (array): Row offsets, indexed by the node's row within the tile.
+        adjacency_targets (array): Global dense indices of the edge targets (ascending within each row).
+        adjacency_weights (array): Edge weights aligned with `adjacency_targets`.
+        byte_size (int): The memory held by the three arrays, charged against the cache budget.
+    """
+
+    def __init__(self, adjacency_offsets: array, adjacency_targets: array, adjacency_weights: array) -> None:
+        self.adjacency_offsets = adjacency_offsets
+        self.adjacency_targets = adjacency_targets
+        self.adjacency_weights = adjacency_weights
+        self.byte_size = sum(len(values) * values.itemsize for values in (adjacency_offsets, adjacency_targets, adjacency_weights))
+
+
+# ---------------------------------------------------------------------------
+# Lazily Paged Graph
+# ---------------------------------------------------------------------------
+class TiledGraph(ReadOnlyGraphView):
+    """
+    A read-only Graph whose adjacency lives on disk in spatial tiles and is paged in on demand.
+
+    Architectural Note:
+    `write_tiles` cuts the plane into square tiles of `tile_width` and stores the CSR rows of the
+    nodes inside each tile in its own file. Only the small per-node table (sorted IDs, tile and
+    row numbers, coordinates) and the goal bitmap stay resident; a tile's rows are read the first
+    time `get_adjacency_slice` or `get_neighbors` touches one of its nodes. Resident tiles sit in
+    an LRU cache bounded by both a tile count and a byte budget, and the least recently used
+    tiles are evicted as soon as either bound is exceeded (a search holding a reference to an
+    evicted row simply keeps that array alive until it moves on).
+
+    Dense indices, row order and coordinates are exactly those of the source Graph, and queries
+    are the same `SearchProblem` objects, so every search returns the same result as on the fully
+    loaded graph. Lookups, neighbour listing and the manifest's query come from `ReadOnlyGraphView`;
+    this class only overrides `get_adjacency_slice` to page tiles in.
+
+    Attributes:
+        directory (str): The tile store location.
+        node_ids (array): Every node ID in ascending order (position = dense index).
+        coordinate_x, coordinate_y (array): The resident node coordinates (NaN if unknown).
+        tile_of (array): The tile number of every dense index.
+        tile_row (array): The row of every dense index within its tile.
+        max_cached_tiles (int): The maximum number of resident tiles.
+        max_cached_bytes (int): The maximum bytes of resident adjacency.
+        cached_bytes (int): The bytes currently resident.
+        tile_loads (int): How many tile reads have been performed (cache misses).
+        tile_evictions (int): How many tiles have been evicted.
+    """
+
+    DEFAULT_MAX_CACHED_TILES: int = 64
+    DEFAULT_MAX_CACHED_BYTES: int = 256 * 1024 * 1024
+
+    def __init__(
+        self,
+        directory: str,
+        max_cached_tiles: int = DEFAULT_MAX_CACHED_TILES,
+        max_cached_bytes: int = DEFAULT_MAX_CACHED_BYTES
+    ) -> None:
+        """
+        Opens a tile store written by `write_tiles`.
+
+        Args:
+            directory (str): The tile store location.
+            max_cached_tiles (int): The maximum number of resident tiles (at least 1 is always kept).
+            max_cached_bytes (int): The byte budget for resident adjacency.
+
+        Raises:
+            FileNotFoundError: If the manifest or node table is missing.
+            ValueError: If the store was written with an unsupported format version.
+        """
+        self.directory = directory
+        self.max_cached_tiles = max_cached_tiles
+        self.max_cached_bytes = max_cached_bytes
+        self.cached_bytes = 0
+        self.tile_loads = 0
+        self.tile_evictions = 0
+        self._tile_cache: "OrderedDict[int, _TileRows]" = OrderedDict()
+
+        with open(os.path.join(directory, MANIFEST_FILENAME), "r", encoding="utf-8") as manifest_stream:
+            manifest = json.load(manifest_stream)
+        if manifest.get("format_version") != TILE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported tile store format: {manifest.get('format_version')}")
+
+        self._tile_filenames: List[str] = manifest["tile_files"]
+
+        node_count = manifest["node_count"]
+        self.node_ids = array("q")
+        self.tile_of = array("q")
+        self.tile_row = array("q")
+        self.coordinate_x = array("d")
+        self.coordinate_y = array("d")
+        with open(os.path.join(directory, NODE_TABLE_FILENAME), "rb") as node_stream:
+            for node_column in (self.node_ids, self.tile_of, self.tile_row, self.coordinate_x, self.coordinate_y):
+                node_column.fromfile(node_stream, node_count)
+
+        self._attach_default_query(manifest["origin"], manifest["destinations"])
+
+    # ---------------------------------------------------------------------------
+    # Engine Interface
+    # ---------------------------------------------------------------------------
+    def get_adjacency_slice(self, node_index: int) -> Tuple[array, array, int, int]:
+        """
+        Exposes the CSR row of a node, paging its tile in first if needed.
+
+        Returns:
+            Tuple[array, array, int, int]: The tile's (targets, weights) arrays and the [start, stop)
+                                           positions of the row. Targets are global dense indices.
+        """
+        tile_rows = self._load_tile(self.tile_of[node_index])
+        row = self.tile_row[node_index]
+        return (
+            tile_rows.adjacency_targets,
+            tile_rows.adjacency_weights,
+            tile_rows.adjacency_offsets[row],
+            tile_rows.adjacency_offsets[row + 1],
+        )
+
+    # ---------------------------------------------------------------------------
+    # LRU Tile Cache
+    # ---------------------------------------------------------------------------
+    def _load_tile(self, tile_number: int) -> _TileRows:
+        """
+        Returns a resident tile, reading it from disk on a miss and evicting the least recently
+        used tiles until both cache bounds hold again.
+        """
+        tile_rows = self._tile_cache.get(tile_number)
+        if tile_rows is not None:
+            self._tile_cache.move_to_end(tile_number)
+            return tile_rows
+
+        tile_rows = self._read_tile(tile_number)
+        self.tile_loads += 1
+        self._tile_cache[tile_number] = tile_rows
+        self.cached_bytes += tile_rows.byte_size
+        self.trim_cache(self.max_cached_bytes)
+        return tile_rows
+
+    def trim_cache(self, max_cached_bytes: int) -> None:
+        """
+        Evicts least recently used tiles until the cache fits `max_cached_bytes` and the tile limit.
+        The most recently used tile always stays resident. Callers under memory pressure may invoke
+        this with a lower byte budget (0 keeps only the newest tile).
+        """
+        while len(self._tile_cache) > 1 and (
+            len(self._tile_cache) > self.max_cached_tiles or self.cached_bytes > max_cached_bytes
+        ):
+            _, evicted_rows = self._tile_cache.popitem(last=False)
+            self.cached_bytes -= evicted_rows.byte_size
+            self.tile_evictions += 1
+
+    def _read_tile(self, tile_number: int) -> _TileRows:
+        """Reads one tile file (header, then offsets, targets and weights arrays)."""
+        with open(os.path.join(self.directory, self._tile_filenames[tile_number]), "rb") as tile_stream:
+            row_count, edge_count = TILE_HEADER.unpack(tile_stream.read(TILE_HEADER.size))
+            adjacency_offsets, adjacency_targets, adjacency_weights = array("q"), array("q"), array("d")
+            adjacency_offsets.fromfile(tile_stream, row_count + 1)
+            adjacency_targets.fromfile(tile_stream, edge_count)
+            adjacency_weights.fromfile(tile_stream, edge_count)
+        return _TileRows(adjacency_offsets, adjacency_targets, adjacency_weights)
+
+
+# ---------------------------------------------------------------------------
+# Tile Store Writer
+# ---------------------------------------------------------------------------
+def write_tiles(graph: Any, directory: str, tile_width: float) -> int:
+    """
+    Writes a loaded Graph as a tile store that `TiledGraph` can page in lazily.
+
+    Architectural Note:
+    A node belongs to the tile containing its coordinates (floor(x / tile_width),
+    floor(y / tile_width)); nodes without coordinates share one extra tile. Within a tile, rows
+    are written in ascending dense index order, and edge targets keep their global dense
+    indices, so a row read back from a tile is identical to the Graph's own CSR row.
+
+    Args:
+        graph (Any): A Graph whose index has been built.
+        directory (str): The output location (created if missing).
+        tile_width (float): The side length of a square tile, in coordinate units.
+
+    Returns:
+        int: The number of tiles written.
+
+    Raises:
+        ValueError: If `tile_width` is not positive.
+    """
+    if tile_width <= 0:
+        raise ValueError("The tile width must be positive.")
+    os.makedirs(directory, exist_ok=True)
+    manifest_path = os.path.join(directory, MANIFEST_FILENAME)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+
+    tile_members: Dict[Tuple, List[int]] = {}
+    for node_index in range(graph.node_count):
+        x_coordinate, y_coordinate = graph.coordinate_x[node_index], graph.coordinate_y[node_index]
+        if math.isnan(x_coordinate):
+            tile_key: Tuple = (1, 0, 0)
+        else:
+            tile_key = (0, math.floor(x_coordinate / tile_width), math.floor(y_coordinate / tile_width))
+        tile_members.setdefault(tile_key, []).append(node_index)
+
+    tile_of = array("q", [0]) * graph.node_count
+    tile_row = array("q", [0]) * graph.node_count
+    tile_filenames: List[str] = []
+
+    for tile_number, tile_key in enumerate(sorted(tile_members)):
+        adjacency_offsets, adjacency_targets, adjacency_weights = array("q", [0]), array("q"), array("d")
+        for row, node_index in enumerate(tile_members[tile_key]):
+            tile_of[node_index] = tile_number
+            tile_row[node_index] = row
+            targets, weights, row_start, row_stop = graph.get_adjacency_slice(node_index)
+            adjacency_targets.extend(targets[row_start:row_stop])
+            adjacency_weights.extend(weights[row_start:row_stop])
+            adjacency_offsets.append(len(adjacency_targets))
+
+        tile_filename = f"tile_{tile_number:06d}.bin"
+        with open(os.path.join(directory, tile_filename), "wb") as tile_stream:
+            tile_stream.write(TILE_HEADER.pack(len(adjacency_offsets) - 1, len(adjacency_targets)))
+            for tile_column in (adjacency_offsets, adjacency_targets, adjacency_weights):
+                tile_column.tofile(tile_stream)
+        tile_filenames.append(tile_filename)
+
+    with open(os.path.join(directory, NODE_TABLE_FILENAME), "wb") as node_stream:
+        for node_column in (array("q", graph.node_ids), tile_of, tile_row, graph.coordinate_x, graph.coordinate_y):
+            node_column.tofile(node_stream)
+
+    manifest = {
+        "format_version": TILE_FORMAT_VERSION,
+        "tile_width": tile_width,
+        "node_count": graph.node_count,
+        "origin": graph.origin,
+        "destinations": list(graph.destinations),
+        "tile_files": tile_filenames,
+    }
+    # The manifest is written last, so a store interrupted mid-write is never mistaken for a complete one.
+    with open(manifest_path, "w", encoding="utf-8") as manifest_stream:
+        json.dump(manifest, manifest_stream)
+    return len(tile_filenames)